@@ -0,0 +1,260 @@
+"""
+analytics.py
+Agregat harian dari history_store.CallHistoryStore:
+- counter_hour_counts : jumlah panggilan per loket per jam (0..23)
+- service_intervals   : rata-rata jarak antar panggilan berurutan di loket
+                        yang sama (proxy waktu layanan; jeda > max_gap_s,
+                        mis. istirahat / tutup, tidak dihitung)
+- daily_counts        : jumlah panggilan per tanggal
+- export_csv / export_summary_csv
+
+Dengan NumPy setiap agregat adalah beberapa pass vektor (bincount) langsung
+di atas buffer kolom (np.frombuffer, tanpa salin). Tanpa NumPy dipakai loop
+Python biasa dengan hasil yang sama.
+
+Jam / tanggal memakai offset UTC tetap (default: zona waktu lokal mesin;
+Indonesia tanpa DST).
+
+CLI:
+    python -m package.analytics data/history --from 2025-01-01 --to 2025-02-01 \\
+        --csv calls.csv --summary-csv ringkasan.csv
+"""
+import argparse
+import csv
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from .config import WAIT_MAX_SERVICE_S
+from .history_store import CallHistoryStore
+from .models import ticket_label
+
+try:
+    import numpy as np
+except ImportError:  # opsional: fallback loop Python
+    np = None
+
+HOURS = 24
+
+
+def local_utc_offset() -> int:
+    """Offset detik zona lokal saat ini (time.timezone bertanda terbalik)."""
+    return -(time.altzone if time.daylight and time.localtime().tm_isdst > 0 else time.timezone)
+
+
+def _offset(utc_offset_s: Optional[int]) -> int:
+    return local_utc_offset() if utc_offset_s is None else utc_offset_s
+
+
+def _columns(store: CallHistoryStore, start: Optional[float], end: Optional[float]):
+    """(counter ids, timestamps) untuk rentang waktu; array NumPy tanpa salin."""
+    i, j = store.index_range(start, end)
+    cid = np.frombuffer(store.counter, dtype=np.uint16)[i:j]
+    ts = np.frombuffer(store.ts, dtype=np.float64)[i:j]
+    if not store.is_sorted and (start is not None or end is not None):
+        mask = np.ones(len(ts), dtype=bool)
+        if start is not None:
+            mask &= ts >= start
+        if end is not None:
+            mask &= ts < end
+        cid, ts = cid[mask], ts[mask]
+    return cid, ts
+
+
+def _indices(store: CallHistoryStore, start: Optional[float], end: Optional[float]):
+    i, j = store.index_range(start, end)
+    ts = store.ts
+    for k in range(i, j):
+        if (start is None or ts[k] >= start) and (end is None or ts[k] < end):
+            yield k
+
+
+# ---------- AGREGAT ----------
+def counter_hour_counts(
+    store: CallHistoryStore,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    utc_offset_s: Optional[int] = None,
+) -> Dict[str, List[int]]:
+    """{loket: [jumlah jam 00, jam 01, ..., jam 23]}"""
+    off = _offset(utc_offset_s)
+    n_counters = len(store.counters)
+    if np is not None:
+        cid, ts = _columns(store, start, end)
+        hour = ((ts + off) // 3600 % HOURS).astype(np.int64)
+        flat = np.bincount(cid.astype(np.int64) * HOURS + hour, minlength=n_counters * HOURS)
+        grid = flat.reshape(n_counters, HOURS).tolist()
+    else:
+        grid = [[0] * HOURS for _ in range(n_counters)]
+        cids, ts = store.counter, store.ts
+        for k in _indices(store, start, end):
+            grid[cids[k]][int((ts[k] + off) // 3600 % HOURS)] += 1
+    return {c: grid[i] for i, c in enumerate(store.counters) if any(grid[i])}
+
+
+def service_intervals(
+    store: CallHistoryStore,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    max_gap_s: float = WAIT_MAX_SERVICE_S,
+) -> Dict[str, Dict[str, float]]:
+    """{loket: {"calls", "intervals", "mean_s"}} dari jarak antar panggilan loket yang sama."""
+    n_counters = len(store.counters)
+    if np is not None:
+        cid, ts = _columns(store, start, end)
+        calls = np.bincount(cid, minlength=n_counters)
+        # urut per loket lalu waktu; stabil -> urutan waktu tetap jika ts sudah naik
+        order = np.argsort(cid, kind="stable") if store.is_sorted else np.lexsort((ts, cid))
+        cid_s, ts_s = cid[order], ts[order]
+        gaps = np.diff(ts_s)
+        valid = (cid_s[1:] == cid_s[:-1]) & (gaps >= 0) & (gaps <= max_gap_s)
+        owner = cid_s[1:][valid]
+        counts = np.bincount(owner, minlength=n_counters)
+        sums = np.bincount(owner, weights=gaps[valid], minlength=n_counters)
+        calls, counts, sums = calls.tolist(), counts.tolist(), sums.tolist()
+    else:
+        calls = [0] * n_counters
+        counts = [0] * n_counters
+        sums = [0.0] * n_counters
+        last: Dict[int, float] = {}
+        cids, ts = store.counter, store.ts
+        idx = _indices(store, start, end)
+        if not store.is_sorted:
+            idx = sorted(idx, key=ts.__getitem__)
+        for k in idx:
+            c, t = cids[k], ts[k]
+            calls[c] += 1
+            prev = last.get(c)
+            if prev is not None and 0 <= t - prev <= max_gap_s:
+                counts[c] += 1
+                sums[c] += t - prev
+            last[c] = t
+    return {
+        name: {
+            "calls": int(calls[i]),
+            "intervals": int(counts[i]),
+            "mean_s": sums[i] / counts[i] if counts[i] else 0.0,
+        }
+        for i, name in enumerate(store.counters)
+        if calls[i]
+    }
+
+
+def daily_counts(
+    store: CallHistoryStore,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    utc_offset_s: Optional[int] = None,
+) -> Dict[str, int]:
+    """{"YYYY-MM-DD": jumlah panggilan}"""
+    off = _offset(utc_offset_s)
+    if np is not None:
+        _, ts = _columns(store, start, end)
+        days, counts = np.unique(((ts + off) // 86400).astype(np.int64), return_counts=True)
+        pairs = zip(days.tolist(), counts.tolist())
+    else:
+        acc: Dict[int, int] = {}
+        ts = store.ts
+        for k in _indices(store, start, end):
+            day = int((ts[k] + off) // 86400)
+            acc[day] = acc.get(day, 0) + 1
+        pairs = sorted(acc.items())
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return {(epoch + timedelta(days=d)).date().isoformat(): n for d, n in pairs}
+
+
+def summarize(
+    store: CallHistoryStore,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    utc_offset_s: Optional[int] = None,
+) -> dict:
+    return {
+        "backend": "numpy" if np is not None else "python",
+        "per_counter_hour": counter_hour_counts(store, start, end, utc_offset_s),
+        "service": service_intervals(store, start, end),
+        "daily": daily_counts(store, start, end, utc_offset_s),
+    }
+
+
+# ---------- CSV ----------
+def export_csv(
+    store: CallHistoryStore,
+    path: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    utc_offset_s: Optional[int] = None,
+) -> int:
+    """Satu baris per panggilan (waktu lokal ISO). Return jumlah baris."""
+    tz = timezone(timedelta(seconds=_offset(utc_offset_s)))
+    n = 0
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        w = csv.writer(fh)
+        w.writerow(["waktu", "nomor", "pool", "label", "loket"])
+        for ts, number, counter, pool in store.rows(start, end):
+            w.writerow([
+                datetime.fromtimestamp(ts, tz).isoformat(timespec="seconds"),
+                number, pool, ticket_label(pool, number), counter,
+            ])
+            n += 1
+    return n
+
+
+def export_summary_csv(summary: dict, path: str):
+    """Satu baris per loket: total, rata-rata interval, lalu 24 kolom jam."""
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        w = csv.writer(fh)
+        w.writerow(["loket", "panggilan", "interval_rata_s"] + [f"jam_{h:02d}" for h in range(HOURS)])
+        per_hour = summary["per_counter_hour"]
+        for counter, svc in summary["service"].items():
+            w.writerow(
+                [counter, svc["calls"], round(svc["mean_s"], 1)]
+                + per_hour.get(counter, [0] * HOURS)
+            )
+
+
+# ---------- CLI ----------
+def _parse_date(text: Optional[str], off: int) -> Optional[float]:
+    if not text:
+        return None
+    d = datetime.strptime(text, "%Y-%m-%d").replace(tzinfo=timezone(timedelta(seconds=off)))
+    return d.timestamp()
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Analitik riwayat panggilan (lihat --history di main)")
+    p.add_argument("history", help="Direktori history store")
+    p.add_argument("--from", dest="start", default=None, help="Tanggal awal YYYY-MM-DD (inklusif)")
+    p.add_argument("--to", dest="end", default=None, help="Tanggal akhir YYYY-MM-DD (eksklusif)")
+    p.add_argument("--csv", default=None, help="Ekspor semua panggilan dalam rentang ke CSV")
+    p.add_argument("--summary-csv", default=None, help="Ekspor ringkasan per loket ke CSV")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    off = local_utc_offset()
+    start, end = _parse_date(args.start, off), _parse_date(args.end, off)
+    store = CallHistoryStore(args.history)
+
+    t0 = time.perf_counter()
+    summary = summarize(store, start, end, off)
+    elapsed = time.perf_counter() - t0
+    print(f"[ANALYTICS] {len(store)} baris, agregasi {elapsed * 1000:.0f} ms ({summary['backend']})")
+
+    for counter, svc in summary["service"].items():
+        busiest = max(range(HOURS), key=summary["per_counter_hour"][counter].__getitem__)
+        print(
+            f"  {counter:<12} {svc['calls']:>8} panggilan  "
+            f"interval rata-rata {svc['mean_s']:6.0f} s  tersibuk jam {busiest:02d}"
+        )
+    if args.csv:
+        n = export_csv(store, args.csv, start, end, off)
+        print(f"[ANALYTICS] {n} baris ditulis ke {args.csv}")
+    if args.summary_csv:
+        export_summary_csv(summary, args.summary_csv)
+        print(f"[ANALYTICS] ringkasan ditulis ke {args.summary_csv}")
+
+
+if __name__ == "__main__":
+    main()
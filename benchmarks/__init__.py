@@ -0,0 +1,7 @@
+"""
+Package benchmarks
+Benchmark headless (platform Qt "offscreen"), audio/TTS di-stub.
+Jalankan: python -m <package>.benchmarks [--quick] [--output hasil.json]
+Soak test (trace panggilan, deteksi leak / tren naik):
+          python -m <package>.benchmarks.soak [--hours 12 --minutes 5 | --trace LOG]
+"""
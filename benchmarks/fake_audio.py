@@ -0,0 +1,184 @@
+"""
+fake_audio.py
+Backend audio palsu untuk soak test. Jalur chime / TTS / cache di
+ExtensionHooks tetap berjalan apa adanya (thread worker TTS, render fragmen
+cache, antrian AudioPipeline, callback on_started / on_finished); hanya
+keluaran suara yang diganti:
+
+- engine pyttsx3  -> SleepingTTSEngine: say() tidur sepanjang durasi ucapan,
+                     save_to_file() menulis WAV hening berdurasi sama
+- AudioPipeline   -> SleepingAudioPipeline: klip "diputar" berurutan dengan
+                     QTimer sepanjang durasi PCM-nya
+- chime           -> WAV hening CHIME_S detik di direktori temp
+
+Semua durasi dibagi `speed` (faktor kompresi waktu soak), supaya pengumuman
+tidak menumpuk hanya karena trace dipadatkan.
+"""
+import tempfile
+import time
+import wave
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+WORD_S = 0.35    # durasi ucapan per kata
+RENDER_S = 0.01  # waktu render WAV per kata
+CHIME_S = 0.8
+
+PcmFormat = Tuple[int, int, int]
+_Callback = Optional[Callable[[], None]]
+
+
+def write_silent_wav(path: Path, seconds: float, fmt: PcmFormat):
+    channels, width, rate = fmt
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(rate)
+        w.writeframes(bytes(int(seconds * rate) * channels * width))
+
+
+class SleepingTTSEngine:
+    """Pengganti engine pyttsx3 (API yang dipakai TTSWorker saja)."""
+
+    def __init__(self, speed: float = 1.0, fmt: PcmFormat = (1, 2, 22050)):
+        self.speed = max(1e-3, speed)
+        self.format = fmt
+        self._props: Dict[str, object] = {"rate": 200}
+        self._callbacks: Dict[str, List[Callable]] = {}
+        self._jobs: List[Tuple[str, Optional[str]]] = []
+
+    def getProperty(self, name: str):
+        return self._props.get(name)
+
+    def setProperty(self, name: str, value):
+        self._props[name] = value
+
+    def connect(self, topic: str, cb: Callable):
+        self._callbacks.setdefault(topic, []).append(cb)
+
+    def say(self, text: str):
+        self._jobs.append((text, None))
+
+    def save_to_file(self, text: str, path: str):
+        self._jobs.append((text, path))
+
+    def runAndWait(self):
+        jobs, self._jobs = self._jobs, []
+        for text, path in jobs:
+            words = len(text.split())
+            if path is None:
+                for cb in self._callbacks.get("started-utterance", ()):
+                    cb(name=None)
+                time.sleep(words * WORD_S / self.speed)
+            else:
+                write_silent_wav(Path(path), words * WORD_S, self.format)
+                time.sleep(words * RENDER_S / self.speed)
+
+    def stop(self):
+        self._jobs.clear()
+
+
+class SleepingAudioPipeline(QObject):
+    """Pengganti AudioPipeline: antrian klip yang sama, tanpa QAudioOutput."""
+    ducking_changed = pyqtSignal(bool)
+    speed = 1.0  # diisi install()
+
+    def __init__(self, fmt: PcmFormat = (1, 2, 22050), volume: float = 1.0, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.format = fmt
+        self._bytes_per_sec = fmt[0] * fmt[1] * fmt[2]
+        self._clips: Deque[Tuple[float, _Callback, _Callback]] = deque()
+        self._busy = False
+        self._ducked = False
+        self._stopped = False
+        self.clips_played = 0
+        self.seconds_played = 0.0
+
+    def enqueue(
+        self,
+        pcm: bytes,
+        gain: float = 1.0,
+        on_finished: _Callback = None,
+        duck: bool = True,
+        on_started: _Callback = None,
+    ):
+        if self._stopped:
+            return
+        self._clips.append((len(pcm) / self._bytes_per_sec, on_started, on_finished))
+        if duck:
+            self._set_ducked(True)
+        if not self._busy:
+            self._play_next()
+
+    def _play_next(self):
+        if self._stopped or not self._clips:
+            self._busy = False
+            self._set_ducked(False)
+            return
+        self._busy = True
+        seconds, on_started, on_finished = self._clips.popleft()
+        if on_started is not None:
+            on_started()
+        QTimer.singleShot(int(seconds * 1000 / self.speed), lambda: self._finished(seconds, on_finished))
+
+    def _finished(self, seconds: float, on_finished: _Callback):
+        if self._stopped:
+            return
+        self.clips_played += 1
+        self.seconds_played += seconds
+        if on_finished is not None:
+            on_finished()
+        self._play_next()
+
+    def _set_ducked(self, ducked: bool):
+        if ducked != self._ducked:
+            self._ducked = ducked
+            self.ducking_changed.emit(ducked)
+
+    def set_volume(self, volume: float):
+        pass
+
+    def is_busy(self) -> bool:
+        return self._busy
+
+    def stats(self) -> dict:
+        return {
+            "fake": True,
+            "queued_clips": len(self._clips),
+            "clips_played": self.clips_played,
+            "seconds_played": round(self.seconds_played, 1),
+        }
+
+    def stop(self):
+        self._stopped = True
+        self._clips.clear()
+
+
+def install(speed: float = 1.0) -> Path:
+    """Aktifkan chime + TTS dengan backend palsu; return direktori temp yang dipakai."""
+    from ..extensions import audio_pipeline, hooks, tts
+
+    tmp = Path(tempfile.mkdtemp(prefix="loket-fake-audio-"))
+    chime = tmp / "chime.wav"
+    write_silent_wav(chime, CHIME_S, hooks.AUDIO_FORMAT)
+    hooks.ENABLE_CHIME = True
+    hooks.ENABLE_TTS = True
+    hooks.CHIME_PATH = chime
+    hooks.AUDIO_CACHE_DIR = tmp / "cache"
+    hooks.CALL_LOG_DIR = str(tmp / "log")
+
+    # hooks mengimpor AudioPipeline saat start_audio(), jadi atribut modul cukup diganti
+    SleepingAudioPipeline.speed = max(1e-3, speed)
+    audio_pipeline.AudioPipeline = SleepingAudioPipeline
+
+    def init_engine(worker):
+        engine = SleepingTTSEngine(speed, hooks.AUDIO_FORMAT)
+        engine.connect("started-utterance", worker._on_started_utterance)
+        worker.engine_init_ms = 0.0
+        return engine
+
+    tts.TTSWorker._init_engine = init_engine
+    return tmp
@@ -0,0 +1,402 @@
+"""
+soak.py
+Soak test: putar lalu lintas panggilan realistis (atau rekaman) terhadap
+QueueManager + MainDisplayWindow + ExtensionHooks asli di platform Qt
+"offscreen", dengan waktu dipadatkan (mis. 12 jam dalam 5 menit).
+
+Trace:
+- Poisson     : kedatangan tiket + panggilan loket, laju per jam, opsional
+                profil hari sibuk (laju berubah per jam, thinning)
+- Rekaman     : direktori history store (lihat --history di main) atau log panggilan
+                (jsonl / csv, boleh .gz) dari extensions/call_log.py
+
+Selama berjalan diambil sampel berkala: RSS, jumlah QObject / widget Qt,
+jumlah thread (Python dan OS), objek Python, dan latensi panggilan -> paint
+label nomor. Setelah warmup, tiap metrik diuji trennya (regresi linear +
+median sepertiga awal vs akhir); naik melewati ambang -> gagal (exit 1).
+
+Audio: default chime + TTS + cache tetap aktif dengan backend palsu
+(fake_audio.py: engine TTS dan output audio hanya sleep, durasi ikut
+dipadatkan), jadi thread worker TTS dan antrian audio ikut diuji tanpa
+perangkat suara. --with-audio memakai pyttsx3 / QAudioOutput asli.
+
+Jalankan:
+    python -m <package>.benchmarks.soak --hours 12 --minutes 5
+    python -m <package>.benchmarks.soak --trace logs/calls-2025-01-06.jsonl --compress 60
+"""
+import argparse
+import csv
+import gc
+import gzip
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QObject, QEvent, QT_VERSION_STR  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from ..config import COUNTERS  # noqa: E402
+from ..queue_manager import QueueManager  # noqa: E402
+from . import fake_audio  # noqa: E402
+
+# (detik sejak awal trace, op, argumen); op "call" -> loket, "issue" -> pool
+TraceEvent = Tuple[float, str, Optional[str]]
+
+# pengali laju per jam mulai 08:00 (hari kerja cabang: puncak pagi & siang)
+BUSY_DAY = [0.6, 1.4, 1.8, 1.5, 1.2, 1.6, 1.3, 1.0, 0.9, 0.8, 0.6, 0.3]
+
+# metrik -> (naik relatif, naik absolut); gagal jika kenaikan > keduanya
+THRESHOLDS: Dict[str, Tuple[float, float]] = {
+    "rss_mb": (0.10, 16.0),
+    "qt_objects": (0.05, 20.0),
+    "qt_widgets": (0.05, 5.0),
+    "threads": (0.0, 2.0),
+    "os_threads": (0.0, 2.0),
+    "py_objects": (0.05, 5000.0),
+    "latency_p95_ms": (0.50, 5.0),
+}
+
+
+# ---------------- TRACE ----------------
+def poisson_trace(
+    hours: float,
+    rate_per_hour: float,
+    counters: Sequence[str],
+    profile: Optional[Sequence[float]] = None,
+    issue_tickets: bool = True,
+    seed: int = 1,
+) -> List[TraceEvent]:
+    """Kedatangan tiket dan panggilan loket sebagai proses Poisson (non-homogen jika ada profil)."""
+    rng = random.Random(seed)
+    peak = max(profile) if profile else 1.0
+    horizon = hours * 3600.0
+
+    def arrivals(rate: float) -> Iterable[float]:
+        # thinning: bangkitkan pada laju puncak, terima dengan peluang laju(t)/puncak
+        t = 0.0
+        lam = rate * peak / 3600.0
+        while lam > 0:
+            t += rng.expovariate(lam)
+            if t >= horizon:
+                return
+            factor = profile[int(t // 3600) % len(profile)] if profile else 1.0
+            if rng.random() < factor / peak:
+                yield t
+
+    events: List[TraceEvent] = [(t, "call", rng.choice(counters)) for t in arrivals(rate_per_hour)]
+    if issue_tickets:
+        events.extend((t, "issue", None) for t in arrivals(rate_per_hour))
+    events.sort(key=lambda e: e[0])
+    return events
+
+
+def _open_text(path: Path):
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def load_trace(path: str) -> List[TraceEvent]:
+    """Rekaman panggilan: direktori history store, atau log jsonl / csv (boleh .gz)."""
+    p = Path(path)
+    calls: List[Tuple[float, str]] = []
+    if p.is_dir():
+        from ..history_store import CallHistoryStore
+        calls = [(ts, counter) for ts, _n, counter, _pool in CallHistoryStore(p).rows()]
+    else:
+        with _open_text(p) as fh:
+            if ".csv" in p.suffixes:
+                calls = [(float(r["called_at"]), r["counter"]) for r in csv.DictReader(fh)]
+            else:
+                for line in fh:
+                    line = line.strip()
+                    if line:
+                        rec = json.loads(line)
+                        calls.append((float(rec["called_at"]), rec["counter"]))
+    if not calls:
+        raise ValueError(f"trace kosong: {path}")
+    calls.sort()
+    t0 = calls[0][0]
+    return [(ts - t0, "call", counter) for ts, counter in calls]
+
+
+# ---------------- SAMPEL ----------------
+def rss_bytes() -> Optional[int]:
+    try:
+        import psutil  # type: ignore
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def os_thread_count() -> Optional[int]:
+    try:
+        import psutil  # type: ignore
+        return psutil.Process().num_threads()
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("Threads:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def qt_object_count(app: QApplication) -> int:
+    """QObject milik aplikasi: anak QApplication + pohon tiap window top-level."""
+    total = len(app.findChildren(QObject))
+    for w in app.topLevelWidgets():
+        total += 1 + len(w.findChildren(QObject))
+    return total
+
+
+class _LatencyProbe(QObject):
+    """Panggilan -> Paint berikutnya pada label nomor (panggilan yang tergabung ikut diukur)."""
+
+    def __init__(self):
+        super().__init__()
+        self._pending: List[float] = []
+        self.window: List[float] = []
+
+    def called(self):
+        self._pending.append(time.perf_counter())
+
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Paint and self._pending:
+            now = time.perf_counter()
+            self.window.extend((now - t) * 1000 for t in self._pending)
+            self._pending.clear()
+        return False
+
+    def take(self) -> List[float]:
+        out, self.window = self.window, []
+        return out
+
+
+# ---------------- TREN ----------------
+def _median(values: List[float]) -> float:
+    s = sorted(values)
+    n = len(s)
+    return (s[n // 2] + s[(n - 1) // 2]) / 2 if n else 0.0
+
+
+def _slope(xs: List[float], ys: List[float]) -> float:
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    var = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var if var else 0.0
+
+
+def analyze_trends(samples: List[dict], warmup: float = 0.2) -> Dict[str, dict]:
+    """
+    Per metrik: kenaikan hasil regresi sepanjang run dan selisih median
+    sepertiga akhir vs awal. Gagal hanya jika keduanya melewati ambang,
+    supaya lonjakan sesaat (GC, paint besar) tidak dianggap leak.
+    """
+    steady = samples[int(len(samples) * warmup):]
+    out: Dict[str, dict] = {}
+    if len(steady) < 6:
+        return out
+    for metric, (rel, abs_) in THRESHOLDS.items():
+        points = [(s["trace_s"], s[metric]) for s in steady if s.get(metric) is not None]
+        if len(points) < 6:
+            continue
+        xs = [p[0] for p in points]
+        ys = [float(p[1]) for p in points]
+        third = max(2, len(ys) // 3)
+        first, last = _median(ys[:third]), _median(ys[-third:])
+        fitted = _slope(xs, ys) * (xs[-1] - xs[0])
+        limit = max(rel * abs(first), abs_)
+        out[metric] = {
+            "first": first,
+            "last": last,
+            "fitted_growth": fitted,
+            "median_growth": last - first,
+            "limit": limit,
+            "ok": not (fitted > limit and last - first > limit),
+        }
+    return out
+
+
+# ---------------- RUN ----------------
+def run_soak(
+    app: QApplication,
+    trace: List[TraceEvent],
+    compress: float,
+    sample_s: float = 5.0,
+    board: bool = False,
+) -> Dict[str, object]:
+    from ..ui import MainDisplayWindow
+    from ..extensions import ExtensionHooks
+
+    qm = QueueManager()
+    display = MainDisplayWindow(
+        qm, force_fullscreen=False, kiosk=False, board_counters=list(COUNTERS) if board else None,
+    )
+    display.resize(1920, 1080)
+    hooks = ExtensionHooks(qm, enable_logging=True, counters=COUNTERS)
+    probe = _LatencyProbe()
+    display.current_number_label.installEventFilter(probe)
+    for _ in range(20):
+        app.processEvents()
+
+    samples: List[dict] = []
+    calls = issues = 0
+
+    def sample(trace_s: float):
+        gc.collect()
+        rss = rss_bytes()
+        lat = probe.take()
+        samples.append({
+            "wall_s": round(time.perf_counter() - t0, 2),
+            "trace_s": round(trace_s, 1),
+            "calls": calls,
+            "rss_mb": round(rss / 2**20, 2) if rss is not None else None,
+            "qt_objects": qt_object_count(app),
+            "qt_widgets": len(app.allWidgets()),
+            "threads": threading.active_count(),
+            "os_threads": os_thread_count(),
+            "py_objects": len(gc.get_objects()),
+            "latency_p95_ms": round(sorted(lat)[int(0.95 * (len(lat) - 1))], 3) if lat else None,
+            "latency_mean_ms": round(sum(lat) / len(lat), 3) if lat else None,
+            "latency_n": len(lat),
+        })
+
+    t0 = time.perf_counter()
+    next_sample = t0
+    for at, op, arg in trace:
+        due = t0 + at / compress
+        while True:
+            now = time.perf_counter()
+            if now >= next_sample:
+                sample((now - t0) * compress)
+                next_sample = now + sample_s
+            if now >= due:
+                break
+            app.processEvents()
+            time.sleep(min(0.002, due - now))
+        if op == "call":
+            probe.called()
+            qm.next_number(arg or COUNTERS[0])
+            calls += 1
+        else:
+            qm.issue_ticket(arg)
+            issues += 1
+
+    # biarkan refresh / hook terakhir selesai, lalu sampel penutup
+    drain_end = time.perf_counter() + 1.0
+    while time.perf_counter() < drain_end:
+        app.processEvents()
+        time.sleep(0.002)
+    sample(trace[-1][0] if trace else 0.0)
+
+    result = {
+        "calls": calls,
+        "tickets": issues,
+        "wall_s": time.perf_counter() - t0,
+        "trace_s": trace[-1][0] if trace else 0.0,
+        "compress": compress,
+        "hooks": hooks.hook_stats(),
+        "tts": hooks.tts_stats(),
+        "display_update_counters": dict(display.update_counters),
+        "samples": samples,
+    }
+    hooks.shutdown()
+    display.close()
+    return result
+
+
+# ---------------- CLI ----------------
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Soak test display + hooks dengan trace panggilan")
+    src = p.add_mutually_exclusive_group()
+    src.add_argument("--trace", default=None, help="Rekaman: direktori history store atau log jsonl/csv(.gz)")
+    src.add_argument("--hours", type=float, default=12.0, help="Panjang trace Poisson (jam)")
+    p.add_argument("--rate", type=float, default=120.0, help="Panggilan (dan tiket) per jam untuk trace Poisson")
+    p.add_argument("--flat", action="store_true", help="Laju konstan (tanpa profil hari sibuk)")
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--compress", type=float, default=0.0, help="Faktor percepatan waktu (mis. 144)")
+    p.add_argument("--minutes", type=float, default=5.0, help="Durasi wall-clock target jika --compress tidak diisi")
+    p.add_argument("--sample", type=float, default=5.0, help="Interval sampel (detik wall-clock)")
+    p.add_argument("--warmup", type=float, default=0.2, help="Fraksi sampel awal yang diabaikan analisis tren")
+    p.add_argument("--board", action="store_true", help="Display mode papan multi-loket")
+    p.add_argument("--with-audio", action="store_true",
+                   help="Pakai engine TTS / output audio asli (butuh perangkat audio); default backend palsu")
+    p.add_argument("--output", default=None, help="Tulis hasil JSON ke file")
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.trace:
+        trace = load_trace(args.trace)
+    else:
+        trace = poisson_trace(
+            args.hours, args.rate, COUNTERS, profile=None if args.flat else BUSY_DAY, seed=args.seed,
+        )
+    span = trace[-1][0] if trace else 0.0
+    compress = args.compress or max(1.0, span / (args.minutes * 60))
+    print(
+        f"[SOAK] {len(trace)} event, {span / 3600:.1f} jam trace, x{compress:.0f} "
+        f"-> ~{span / compress / 60:.1f} menit"
+    )
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    if not args.with_audio:
+        fake_audio.install(speed=compress)
+    else:
+        from ..extensions import hooks
+        hooks.CALL_LOG_DIR = tempfile.mkdtemp(prefix="loket-soak-log-")
+
+    result = run_soak(app, trace, compress, sample_s=args.sample, board=args.board)
+    trends = analyze_trends(result["samples"], warmup=args.warmup)
+    failed = sorted(m for m, t in trends.items() if not t["ok"])
+    result["trends"] = trends
+    result["passed"] = not failed
+    result["meta"] = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+        "qpa": app.platformName(),
+        "trace": args.trace or f"poisson {args.rate}/jam",
+    }
+
+    text = json.dumps(result, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        print(f"[SOAK] hasil ditulis ke {args.output}")
+    for metric, t in trends.items():
+        flag = "OK  " if t["ok"] else "NAIK"
+        print(
+            f"[SOAK] {flag} {metric:<15} {t['first']:>10.1f} -> {t['last']:>10.1f} "
+            f"(regresi +{t['fitted_growth']:.1f}, batas {t['limit']:.1f})"
+        )
+    if failed:
+        print(f"[SOAK] GAGAL: tren naik pada {', '.join(failed)}")
+        return 1
+    print("[SOAK] lulus")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
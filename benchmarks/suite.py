@@ -0,0 +1,289 @@
+"""
+suite.py
+Benchmark untuk membandingkan rilis:
+- queue_throughput : QueueManager.next_number per detik (adapter QObject)
+- core_throughput  : QueueCore.next_number per detik (tanpa Qt) + issue_ticket
+- call_to_paint    : TellerWindow._handle_next -> label nomor di MainDisplayWindow ter-paint
+- marquee          : CPU per tick MarqueeLabel (mode char vs pixel)
+- memory_growth    : pertumbuhan memori selama N panggilan
+- history          : append ke CallHistoryStore + agregasi analytics.summarize
+
+Hasil berupa JSON (stdout atau --output) supaya bisa di-diff antar rilis.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QObject, QEvent, QT_VERSION_STR  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from ..core import QueueCore  # noqa: E402
+from ..queue_manager import QueueManager  # noqa: E402
+
+
+def stub_audio():
+    """Matikan chime/TTS dan arahkan log panggilan ke direktori temp."""
+    from ..extensions import hooks
+    hooks.ENABLE_CHIME = False
+    hooks.ENABLE_TTS = False
+    hooks.CALL_LOG_DIR = tempfile.mkdtemp(prefix="loket-bench-log-")
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    s = sorted(samples)
+
+    def pick(q: float) -> float:
+        return s[min(len(s) - 1, int(q * len(s)))]
+
+    return {
+        "n": len(s),
+        "mean": sum(s) / len(s),
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": s[-1],
+    }
+
+
+class _PaintProbe(QObject):
+    """Event filter: catat waktu Paint terakhir pada widget target."""
+
+    def __init__(self):
+        super().__init__()
+        self.painted_at = 0.0
+        self.count = 0
+
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Paint:
+            self.painted_at = time.perf_counter()
+            self.count += 1
+        return False
+
+
+# ---------------- BENCHMARKS ----------------
+def bench_queue_throughput(calls: int) -> Dict[str, float]:
+    qm = QueueManager()
+    counters = ["Loket 1", "Loket 2", "Loket 3", "Loket 4"]
+    t0 = time.perf_counter()
+    for i in range(calls):
+        qm.next_number(counters[i & 3])
+    dt = time.perf_counter() - t0
+    return {"calls": calls, "seconds": dt, "calls_per_sec": calls / dt, "us_per_call": dt / calls * 1e6}
+
+
+def bench_core_throughput(calls: int) -> Dict[str, float]:
+    core = QueueCore()
+    counters = ["Loket 1", "Loket 2", "Loket 3", "Loket 4"]
+    core.new_call.connect(lambda entry: None)  # satu subscriber, seperti adapter
+    t0 = time.perf_counter()
+    for i in range(calls):
+        core.next_number(counters[i & 3])
+    dt_call = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for i in range(calls):
+        core.issue_ticket()
+        core.next_number(counters[i & 3])
+    dt_ticket = time.perf_counter() - t0
+    return {
+        "calls": calls,
+        "calls_per_sec": calls / dt_call,
+        "us_per_call": dt_call / calls * 1e6,
+        "us_per_issue_and_call": dt_ticket / calls * 1e6,
+    }
+
+
+def bench_call_to_paint(app: QApplication, calls: int, timeout_s: float = 1.0) -> Dict[str, object]:
+    from ..ui import MainDisplayWindow, TellerWindow
+    from ..extensions import ExtensionHooks
+    from ..config import COUNTERS
+
+    qm = QueueManager()
+    display = MainDisplayWindow(qm, force_fullscreen=False, kiosk=False)
+    display.resize(1280, 720)
+    teller = TellerWindow(qm, counters=COUNTERS)
+    teller.show()
+    hooks = ExtensionHooks(qm, enable_logging=True, counters=COUNTERS)
+
+    probe = _PaintProbe()
+    display.current_number_label.installEventFilter(probe)
+    for _ in range(20):
+        app.processEvents()
+
+    latencies = []
+    timeouts = 0
+    for _ in range(calls):
+        before = probe.count
+        t0 = time.perf_counter()
+        teller._handle_next()
+        deadline = t0 + timeout_s
+        while probe.count == before and time.perf_counter() < deadline:
+            app.processEvents()
+        if probe.count == before:
+            timeouts += 1
+        else:
+            latencies.append((probe.painted_at - t0) * 1000)
+
+    result = {
+        "latency_ms": percentiles(latencies),
+        "timeouts": timeouts,
+        "display_update_counters": dict(display.update_counters),
+        "hooks": hooks.hook_stats(),
+    }
+    hooks.shutdown()
+    teller.close()
+    display.close()
+    return result
+
+
+def bench_marquee(app: QApplication, seconds: float) -> Dict[str, object]:
+    from ..widgets.marquee import MarqueeLabel, MODE_CHAR, MODE_PIXEL
+    from ..config import STYLE
+
+    out = {}
+    for mode in (MODE_CHAR, MODE_PIXEL):
+        m = MarqueeLabel("Selamat datang di Loket Antrian", interval_ms=70, stylesheet=STYLE["MARQUEE"], mode=mode)
+        m.resize(1200, 48)
+        m.show()
+        probe = _PaintProbe()
+        m.installEventFilter(probe)
+        for _ in range(10):
+            app.processEvents()
+        probe.count = 0
+        cpu0 = time.process_time()
+        t_end = time.perf_counter() + seconds
+        while time.perf_counter() < t_end:
+            app.processEvents()
+            time.sleep(0.001)
+        cpu = time.process_time() - cpu0
+        out[mode] = {
+            "seconds": seconds,
+            "paints": probe.count,
+            "cpu_s": cpu,
+            "cpu_pct": cpu / seconds * 100,
+            "cpu_us_per_paint": (cpu / probe.count * 1e6) if probe.count else None,
+            "renders": m.render_count,
+        }
+        m.close()
+        m.deleteLater()
+        app.processEvents()
+    return out
+
+
+def bench_memory_growth(calls: int, samples: int = 10) -> Dict[str, object]:
+    qm = QueueManager()
+    tracemalloc.start()
+    step = max(1, calls // samples)
+    points = []
+    t0 = time.perf_counter()
+    for i in range(calls):
+        qm.next_number("Loket 1")
+        if (i + 1) % step == 0:
+            current, _ = tracemalloc.get_traced_memory()
+            points.append({"calls": i + 1, "traced_bytes": current})
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    first, last = points[0], points[-1]
+    growth = (last["traced_bytes"] - first["traced_bytes"]) / max(1, last["calls"] - first["calls"])
+    return {
+        "calls": calls,
+        "seconds": time.perf_counter() - t0,
+        "peak_traced_bytes": peak,
+        "bytes_per_call_after_warmup": growth,
+        "samples": points,
+    }
+
+
+def bench_history(rows: int, counters: int = 12) -> Dict[str, object]:
+    import random
+    from .. import analytics
+    from ..history_store import CallHistoryStore
+
+    store = CallHistoryStore()
+    names = [f"Loket {i + 1}" for i in range(counters)]
+    rng = random.Random(1)
+    ts = time.time() - rows * 20.0
+    t0 = time.perf_counter()
+    for i in range(rows):
+        ts += rng.expovariate(1 / 20.0)
+        store.append(i + 1, names[i % counters], ts)
+    append_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    summary = analytics.summarize(store)
+    aggregate_s = time.perf_counter() - t0
+    return {
+        "rows": rows,
+        "backend": summary["backend"],
+        "append_us_per_row": append_s / rows * 1e6,
+        "aggregate_s": aggregate_s,
+        "bytes_per_row": store.nbytes() / rows,
+    }
+
+
+# ---------------- RUNNER ----------------
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Benchmark sistem antrian (headless)")
+    p.add_argument("--quick", action="store_true", help="Ukuran kecil untuk cek cepat")
+    p.add_argument("--output", default=None, help="Tulis hasil JSON ke file")
+    p.add_argument("--only", nargs="*", default=None,
+                   choices=["queue_throughput", "core_throughput", "call_to_paint", "marquee", "memory_growth", "history"])
+    return p.parse_args(argv)
+
+
+def run(args) -> Dict[str, object]:
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    stub_audio()
+    sizes = {
+        "throughput": 20_000 if args.quick else 200_000,
+        "paint": 50 if args.quick else 500,
+        "marquee_s": 1.0 if args.quick else 5.0,
+        "memory": 100_000 if args.quick else 1_000_000,
+        "history": 200_000 if args.quick else 2_000_000,
+    }
+    wanted = set(args.only or [
+        "queue_throughput", "core_throughput", "call_to_paint", "marquee", "memory_growth", "history",
+    ])
+    results: Dict[str, object] = {
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa": app.platformName(),
+            "quick": args.quick,
+        }
+    }
+    if "queue_throughput" in wanted:
+        results["queue_throughput"] = bench_queue_throughput(sizes["throughput"])
+    if "core_throughput" in wanted:
+        results["core_throughput"] = bench_core_throughput(sizes["throughput"])
+    if "call_to_paint" in wanted:
+        results["call_to_paint"] = bench_call_to_paint(app, sizes["paint"])
+    if "marquee" in wanted:
+        results["marquee"] = bench_marquee(app, sizes["marquee_s"])
+    if "memory_growth" in wanted:
+        results["memory_growth"] = bench_memory_growth(sizes["memory"])
+    if "history" in wanted:
+        results["history"] = bench_history(sizes["history"])
+    return results
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run(args)
+    text = json.dumps(results, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        print(f"[BENCH] hasil ditulis ke {args.output}")
+    else:
+        print(text)
@@ -9,32 +9,111 @@ LOGO_PATHS = [
     ASSETS_DIR / "logo1.png",
     ASSETS_DIR / "logo2.png",
 ]
+LOGO_SIZE = (220, 90)  # ukuran logo pada 1920x1080, diskalakan per layar
+THEME_RESIZE_DEBOUNCE_MS = 100  # hitung ulang skala tema setelah resize reda
 
 VIDEO_PATH = ASSETS_DIR / "sample.mp4"
+# Playlist signage: folder berisi klip, atau manifest .json / .txt / .m3u.
+# Jika tidak ada, VIDEO_PATH diputar berulang.
+VIDEO_PLAYLIST = ASSETS_DIR / "playlist"
 CHIME_PATH = ASSETS_DIR / "chime.wav"
 
 ENABLE_TTS = True
 ENABLE_CHIME = True
-TTS_QUEUE_DELAY_MS = 300
+TTS_QUEUE_MAX = 8  # batas antrian pengumuman TTS
+ENABLE_AUDIO_CACHE = True  # fragmen frasa dirender sekali lalu disambung
+AUDIO_CACHE_DIR = Path("cache") / "audio"
+AUDIO_CACHE_MAX_MB = 64
+# Jalur audio tunggal (chime + pengumuman): (channel, byte/sampel, sample rate)
+AUDIO_FORMAT = (1, 2, 22050)
+AUDIO_MASTER_VOLUME = 1.0
+CHIME_VOLUME = 0.9
+VOICE_VOLUME = 1.0
+VIDEO_DUCK_VOLUME = 30  # volume video (0-100) selama pengumuman
+
+# Hook bus: setiap hook jalan di thread sendiri dengan antrian terbatas
+HOOK_BUDGET_MS = 50
+HOOK_QUEUE_MAX = 64
+
+# Log panggilan (audit) - ditulis thread terpisah
+CALL_LOG_DIR = Path("logs")
+CALL_LOG_FORMAT = "jsonl"  # "jsonl" / "csv"
+CALL_LOG_MAX_MB = 10  # rotasi per hari atau saat ukuran file melewati batas
+CALL_LOG_COMPRESS = True
 LOOP_VIDEO = True
 
+COUNTERS = ["Loket 1", "Loket 2", "Loket 3", "Loket 4"]
+
+# Pool tiket per layanan: prefix -> nama layanan. Prefix "" = nomor polos
+# tanpa huruf (perilaku lama). Contoh multi-layanan:
+#   TICKET_POOLS = {"A": "Teller", "B": "Customer Service"}
+#   COUNTER_POOLS = {"Loket 1": ["A"], "Loket 2": ["A"], "Loket 3": ["A", "B"], "Loket 4": ["B"]}
+TICKET_POOLS = {"": "Umum"}
+# Loket -> prefix pool yang dilayani; loket yang tidak tercantum melayani semua pool
+COUNTER_POOLS = {}
+# Kelas prioritas tiket: lebih besar dipanggil lebih dulu
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 1  # lansia / disabilitas / ibu hamil
+
+MARQUEE_MODE = "pixel"  # "pixel" (pixmap cache, geser halus) / "char" (mode lama)
+MARQUEE_SPEED_PX_S = 80
+REFRESH_FRAME_MS = 16  # update display digabung maksimal 1x per frame
+BOARD_HISTORY_LENGTH = 200  # panjang riwayat di papan multi-loket (--board)
+
+# Estimasi waktu tunggu: EWMA selang antar panggilan per loket
+WAIT_EWMA_ALPHA = 0.2
+WAIT_MIN_SERVICE_S = 5  # selang lebih pendek dianggap salah tekan -> dibulatkan ke sini
+WAIT_MAX_SERVICE_S = 1800  # selang lebih panjang dianggap loket istirahat -> diabaikan
+
+# Stream display ke layar sekunder (--stream-port): MJPEG / PNG via HTTP
+STREAM_FPS = 10  # batas atas; saat tidak ada perubahan tidak ada frame baru
+STREAM_JPEG_QUALITY = 75
+
+# Watchdog event loop GUI
+WATCHDOG_INTERVAL_MS = 50
+WATCHDOG_STALL_MS = 200  # drift di atas ini dicatat sebagai stall
+
+# Metrik (--metrics-port / --metrics-file)
+METRICS_SNAPSHOT_MS = 1000  # collector dibaca di GUI thread tiap interval ini
+
+# Governor daya display (power.py)
+POWER_IDLE_AFTER_S = 600  # tanpa panggilan selama ini -> idle
+POWER_IDLE_MARQUEE_FPS = 8  # frame marquee per detik saat idle
+POWER_IDLE_PAUSE_VIDEO = False  # True: video ikut dijeda saat idle
+POWER_IDLE_WATCHDOG_MS = 500  # heartbeat watchdog saat idle / quiet / hidden
+# Jam tenang (waktu lokal), boleh melewati tengah malam, mis. [("18:00", "07:00")]
+POWER_QUIET_HOURS = []
+POWER_QUIET_IDLE_S = 60  # di jam tenang, idle sesingkat ini langsung quiet
+POWER_CHECK_MS = 5000
+
 # Kiosk defaults (bisa dioverride via argument)
 KIOSK_HIDE_CURSOR_DEFAULT = False
 
 STYLE = {
     "BACKGROUND_PANEL": "background-color:#0F172A; border:2px solid #1E293B; border-radius:8px;",
-    "CURRENT_NUMBER": "color:#FACC15; font-weight:900;",  # ukuran akan diatur dinamis
-    "CURRENT_COUNTER": "color:#38BDF8; font-weight:bold;",  # ukuran dinamis
+    # font-size = ukuran desain pada 1920x1080; diskalakan ui/theme.py per layar
+    "CURRENT_NUMBER": "color:#FACC15; font-weight:900; font-size:130px;",
+    "CURRENT_COUNTER": "color:#38BDF8; font-weight:bold; font-size:48px;",
+    "DISPLAY_TITLE": "color:#F8FAFC; font-size:28px; font-weight:800; letter-spacing:2px;",
+    "SECTION_TITLE": "color:#CBD5E1; font-size:16px; font-weight:bold;",
+    "DISPLAY_WAITING": "color:#CBD5E1; font-size:20px; font-weight:600;",
+    "FOOTER": "color:#64748B; font-size:14px;",
     "HISTORY_ITEM": "color:#E2E8F0; font-size:16px;",
+    "BOARD_HISTORY": "color:#E2E8F0; font-size:16px; background:transparent; border:none;",
+    "LOGO_FRAME": "background-color:#0C4A3F; border-radius:6px;",
     "LOGO_PLACEHOLDER": (
         "background-color:#10B981; color:white; font-weight:bold; font-size:16px;"
         "border-radius:6px; padding:10px;"
     ),
     "VIDEO_PLACEHOLDER": "background-color:#1E3A8A; color:white; font-size:26px;",
+    "VIDEO_CONTAINER": "background-color:#000000;",
     "TELLER_PANEL": "background-color:#0F172A; border:1px solid #334155; border-radius:10px; padding:18px;",
     "TELLER_TITLE": "font-size:22px; font-weight:700; color:#F1F5F9;",
     "TELLER_LABEL": "font-size:14px; color:#94A3B8;",
     "TELLER_LAST": "font-size:18px; font-weight:600; color:#F8FAFC;",
+    "TELLER_PREVIEW": "font-size:16px; color:#A5B4FC; font-weight:600;",
+    "TELLER_WAITING": "font-size:14px; color:#CBD5E1;",
+    "TELLER_HINT": "color:#64748B; font-size:12px;",
     "TELLER_NEXT_BTN": (
         "font-size:26px; font-weight:700; background: qlineargradient("
         "x1:0 y1:0, x2:1 y2:1, stop:0 #2563EB, stop:1 #1D4ED8);"
@@ -45,5 +124,14 @@ STYLE = {
         "font-size:16px; padding:6px 10px; background-color:#1E293B; color:#E2E8F0;"
         "border:1px solid #334155; border-radius:6px;"
     ),
-    "MARQUEE": "color:white; font-size:20px; background-color:#222; padding:8px;"
-}
\ No newline at end of file
+    "MARQUEE": "color:white; font-size:20px; background-color:#222; padding:8px;",
+    "BOARD_TABLE": (
+        "QTableView { background-color:#0F172A; color:#E2E8F0; font-size:22px; border:none;"
+        "gridline-color:#1E293B; }"
+        "QHeaderView::section { background-color:#1E293B; color:#94A3B8; font-size:14px;"
+        "font-weight:bold; border:none; padding:4px; }"
+    ),
+}
+
+# Kapasitas ring buffer history di QueueManager (memori tetap datar sepanjang hari)
+HISTORY_CAPACITY = 256
@@ -0,0 +1,165 @@
+"""
+core.py
+Mesin antrian murni Python (tanpa Qt): nomor, tiket, pool, history, jurnal
+dan estimasi tunggu. Dipakai langsung oleh tool headless (server, skrip,
+replay batch) dan dibungkus queue_manager.QueueManager untuk UI Qt.
+
+Event memakai callback biasa dengan API mirip signal:
+    core.new_call.connect(fn)   /   core.new_call.disconnect(fn)
+Callback dipanggil sinkron di thread pemanggil, setelah state diperbarui.
+"""
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+from .models import CallEntry, Ticket
+from .journal import CallJournal
+from .history_store import CallHistoryStore
+from .config import HISTORY_CAPACITY, TICKET_POOLS, COUNTER_POOLS, PRIORITY_NORMAL
+from .tracing import TRACER
+from .ticket_pool import TicketPools
+from .wait_estimate import WaitEstimator
+
+
+class Callbacks:
+    """Daftar callback untuk satu event; connect/disconnect/emit seperti pyqtSignal."""
+    __slots__ = ("name", "_fns")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._fns: List[Callable[..., Any]] = []
+
+    def connect(self, fn: Callable[..., Any]):
+        self._fns.append(fn)
+
+    def disconnect(self, fn: Callable[..., Any]):
+        try:
+            self._fns.remove(fn)
+        except ValueError:
+            pass
+
+    def emit(self, *args):
+        for fn in tuple(self._fns):
+            try:
+                fn(*args)
+            except Exception as e:
+                # subscriber rusak tidak boleh menggagalkan panggilan yang sudah tercatat
+                print(f"[CORE WARN] callback {self.name} gagal: {e}")
+
+
+class QueueCore:
+    """
+    Urutan nomor antrian.
+    - issue_ticket(pool, priority): pelanggan mengambil tiket -> masuk pool
+      layanannya (lihat ticket_pool.py)
+    - next_number(counter): loket memanggil tiket terbaik (prioritas, lalu
+      paling lama) dari pool yang dilayaninya; jika tidak ada tiket menunggu
+      (tanpa kiosk tiket), nomor baru dari pool pertama loket langsung dipanggil
+    Jumlah menunggu dan estimasi tunggu (EWMA per loket) selalu tersedia O(1).
+    """
+    def __init__(
+        self,
+        start_number: int = 1,
+        journal: Optional[CallJournal] = None,
+        history_capacity: int = HISTORY_CAPACITY,
+        pools: Optional[Dict[str, str]] = None,
+        counter_pools: Optional[Dict[str, List[str]]] = None,
+        history_store: Optional[CallHistoryStore] = None,
+    ):
+        self.new_call = Callbacks("new_call")  # (CallEntry)
+        self.ticket_issued = Callbacks("ticket_issued")  # (Ticket)
+        self.pending_changed = Callbacks("pending_changed")  # (jumlah tiket menunggu)
+        self.state_synced = Callbacks("state_synced")  # () history diganti seluruhnya (reset)
+        self.pools = TicketPools(
+            TICKET_POOLS if pools is None else pools,
+            COUNTER_POOLS if counter_pools is None else counter_pools,
+        )
+        # ring buffer: panggilan lama otomatis terbuang, memori tetap
+        self._calls: Deque[CallEntry] = deque(maxlen=max(1, history_capacity))
+        # indeks panggilan terakhir per loket
+        self._last_by_counter: Dict[str, CallEntry] = {}
+        self.wait_estimator = WaitEstimator()
+        self._journal = journal
+        # riwayat lengkap untuk analitik (opsional); ring buffer di atas hanya untuk layar
+        self.history_store = history_store
+        if journal is not None and journal.restored:
+            # lanjutkan urutan dari jurnal, bukan dari start_number
+            self.pools.set_numbers(journal.pool_numbers())
+            for n, c, ts, pool in journal.recent_calls():
+                self._record(CallEntry(number=n, counter=c, timestamp=ts, pool=pool))
+            for n, ts, pool, prio in journal.pending_tickets():
+                self.pools.restore(Ticket(n, ts, pool=pool, priority=prio))
+        else:
+            self.pools.set_numbers({p: start_number - 1 for p in self.pools.names})
+
+    def _record(self, entry: CallEntry):
+        self._calls.append(entry)
+        self._last_by_counter[entry.counter] = entry
+        self.wait_estimator.observe_call(entry.counter, entry.timestamp)
+
+    # ---------- TIKET ----------
+    def issue_ticket(self, pool: Optional[str] = None, priority: int = PRIORITY_NORMAL) -> Ticket:
+        """ValueError jika pool tidak dikonfigurasi."""
+        ticket = self.pools.issue(pool, priority)
+        if self._journal is not None:
+            self._journal.append_ticket(ticket.number, ticket.issued_at, ticket.pool, ticket.priority)
+        self.ticket_issued.emit(ticket)
+        self.pending_changed.emit(self.pools.waiting())
+        return ticket
+
+    def waiting_count(self, pool: Optional[str] = None) -> int:
+        return self.pools.waiting(pool)
+
+    def peek_next(self, counter: Optional[str] = None) -> Optional[Ticket]:
+        """Tiket yang akan dipanggil loket `counter` (None: tiket terdepan semua pool)."""
+        return self.pools.peek(counter)
+
+    def next_label(self, counter: str) -> str:
+        """Label yang akan dipanggil next_number(counter) saat ini."""
+        return self.pools.next_label(counter)
+
+    def estimated_wait(self, ahead: Optional[int] = None) -> Optional[float]:
+        """Detik tunggu untuk `ahead` orang di depan (default: pengambil tiket baru)."""
+        return self.wait_estimator.estimate_wait(self.pools.waiting() if ahead is None else ahead)
+
+    # ---------- PANGGIL ----------
+    def next_number(self, counter: str) -> CallEntry:
+        ticket = self.pools.take(counter)
+        if ticket is not None:
+            entry = CallEntry(number=ticket.number, counter=counter, pool=ticket.pool)
+        else:
+            pool = self.pools.pools_for(counter)[0]
+            entry = CallEntry(number=self.pools.next_number(pool), counter=counter, pool=pool)
+        if TRACER.enabled:
+            TRACER.start(entry.label)
+        self._record(entry)
+        if self._journal is not None:
+            self._journal.append_call(entry.number, entry.counter, entry.timestamp, entry.pool)
+        if self.history_store is not None:
+            self.history_store.append_entry(entry)
+        self.new_call.emit(entry)
+        if ticket is not None:
+            self.pending_changed.emit(self.pools.waiting())
+        return entry
+
+    def current(self) -> Optional[CallEntry]:
+        return self._calls[-1] if self._calls else None
+
+    def last_history(self, n: int) -> List[CallEntry]:
+        """n panggilan sebelum yang sekarang (urut lama -> baru), tanpa menyalin seluruh buffer."""
+        calls = self._calls
+        start = max(-len(calls), -n - 1)
+        return [calls[i] for i in range(start, -1)]
+
+    def last_for_counter(self, counter: str) -> Optional[CallEntry]:
+        return self._last_by_counter.get(counter)
+
+    def reset(self):
+        self._calls.clear()
+        self._last_by_counter.clear()
+        had_pending = self.pools.waiting() > 0
+        self.pools.clear()
+        self.wait_estimator.reset()
+        if self._journal is not None:
+            self._journal.append_reset()
+        if had_pending:
+            self.pending_changed.emit(0)
+        self.state_synced.emit()
@@ -0,0 +1,215 @@
+"""
+audio_cache.py
+Cache audio pengumuman berbasis fragmen frasa.
+
+"Nomor antrian {n}, menuju {counter}" disusun dari kosakata kecil:
+prefix, kata bilangan (terbilang), "menuju", dan nama loket. Setiap fragmen
+dirender sekali ke WAV (lewat TTSWorker), disimpan di disk dengan eviksi LRU,
+lalu PCM-nya (sudah dikonversi ke format jalur audio) disambung saat
+dipanggil. Fragmen yang belum ada -> miss, caller
+jatuh ke TTS live dan fragmen dijadwalkan render.
+"""
+import hashlib
+import os
+import re
+import threading
+import wave
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .tts import TTSWorker
+from .pcm import PcmFormat, apply_gain, convert_pcm
+
+PREFIX = "Nomor antrian"
+JOINER = "menuju"
+GAP_MS = 80  # jeda antar bagian frasa
+
+_UNITS = ["nol", "satu", "dua", "tiga", "empat", "lima", "enam", "tujuh", "delapan", "sembilan", "sepuluh", "sebelas"]
+# seluruh kosakata terbilang(), termasuk "nol" dan "minus": tanpa itu nomor 0 selalu miss
+NUMBER_WORDS = _UNITS + ["belas", "puluh", "seratus", "ratus", "seribu", "ribu", "juta", "minus"]
+
+
+def terbilang(n: int) -> List[str]:
+    """Bilangan -> daftar kata bahasa Indonesia, mis. 123 -> ['seratus', 'dua', 'puluh', 'tiga']."""
+    if n < 0:
+        return ["minus"] + terbilang(-n)
+    if n < 12:
+        return [_UNITS[n]]
+    if n < 20:
+        return [_UNITS[n - 10], "belas"]
+    if n < 100:
+        return [_UNITS[n // 10], "puluh"] + (terbilang(n % 10) if n % 10 else [])
+    if n < 200:
+        return ["seratus"] + (terbilang(n - 100) if n > 100 else [])
+    if n < 1000:
+        return [_UNITS[n // 100], "ratus"] + (terbilang(n % 100) if n % 100 else [])
+    if n < 2000:
+        return ["seribu"] + (terbilang(n - 1000) if n > 1000 else [])
+    if n < 1_000_000:
+        return terbilang(n // 1000) + ["ribu"] + (terbilang(n % 1000) if n % 1000 else [])
+    return terbilang(n // 1_000_000) + ["juta"] + (terbilang(n % 1_000_000) if n % 1_000_000 else [])
+
+
+class AudioCache:
+    def __init__(
+        self,
+        directory: Path,
+        worker: TTSWorker,
+        max_bytes: int = 64 * 1024 * 1024,
+        target_format: Optional[PcmFormat] = None,
+        gain: float = 1.0,
+    ):
+        self.directory = Path(directory)
+        self.worker = worker
+        self.max_bytes = max_bytes
+        self.target_format = target_format
+        self.gain = gain
+        self._lock = threading.Lock()
+        # key -> ukuran file; urutan = LRU (paling lama di depan)
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        # PCM yang sudah dibaca dari disk (dan dikonversi ke target_format)
+        self._pcm: "OrderedDict[str, Tuple[PcmFormat, bytes]]" = OrderedDict()
+        self._pending: set = set()
+        self._total = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- KEY / PATH ----------
+    @staticmethod
+    def _key(text: str) -> str:
+        slug = re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")[:32]
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:8]
+        return f"{slug}-{digest}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.wav"
+
+    @staticmethod
+    def fragments(number: int, counter: str, pool: str = "") -> List[str]:
+        # huruf pool (mis. "A") diucapkan sebagai fragmen sendiri sebelum angka
+        return [PREFIX] + ([pool] if pool else []) + terbilang(number) + [JOINER, counter]
+
+    # ---------- WARM ----------
+    def warm(self, counters: Iterable[str], prefixes: Iterable[str] = ()):
+        """Scan disk lalu jadwalkan render fragmen yang belum ada (non-blok)."""
+        extra = list(counters) + list(prefixes)
+        threading.Thread(target=self._warm, args=(extra,), name="audio-cache-warm", daemon=True).start()
+
+    def _warm(self, extra: List[str]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        files = sorted(self.directory.glob("*.wav"), key=lambda p: p.stat().st_mtime)
+        with self._lock:
+            for p in files:
+                if p.stem not in self._index:
+                    size = p.stat().st_size
+                    self._index[p.stem] = size
+                    self._total += size
+            self._evict_locked()
+        for text in [PREFIX, JOINER] + NUMBER_WORDS + extra:
+            self._ensure(text)
+
+    def _ensure(self, text: str):
+        key = self._key(text)
+        with self._lock:
+            if key in self._index or key in self._pending:
+                return
+            self._pending.add(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.worker.render(text, str(self._path(key)), lambda path, ok, k=key: self._on_rendered(k, ok))
+
+    def _on_rendered(self, key: str, ok: bool):
+        path = self._path(key)
+        with self._lock:
+            self._pending.discard(key)
+            if not ok or not path.is_file():
+                return
+            size = path.stat().st_size
+            self._index[key] = size
+            self._total += size
+            self._evict_locked()
+
+    def _evict_locked(self):
+        while self._total > self.max_bytes and len(self._index) > 1:
+            key, size = self._index.popitem(last=False)
+            self._pcm.pop(key, None)
+            self._total -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    # ---------- LOOKUP ----------
+    def _load(self, text: str) -> Optional[Tuple[PcmFormat, bytes]]:
+        key = self._key(text)
+        with self._lock:
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+            cached = self._pcm.get(key)
+            if cached is not None:
+                self._pcm.move_to_end(key)
+                return cached
+        path = self._path(key)
+        try:
+            with wave.open(str(path), "rb") as w:
+                fmt = (w.getnchannels(), w.getsampwidth(), w.getframerate())
+                data = w.readframes(w.getnframes())
+            if self.target_format is not None:
+                data = apply_gain(convert_pcm(data, fmt, self.target_format), self.gain)
+                fmt = self.target_format
+            os.utime(path)  # simpan urutan LRU antar restart
+        except (OSError, EOFError, wave.Error, ValueError):
+            with self._lock:
+                size = self._index.pop(key, 0)
+                self._total -= size
+            return None
+        with self._lock:
+            self._pcm[key] = (fmt, data)
+        return fmt, data
+
+    def compose(self, number: int, counter: str, pool: str = "") -> Optional[Tuple[PcmFormat, bytes]]:
+        """PCM lengkap untuk pengumuman, atau None jika ada fragmen yang belum tersedia."""
+        parts = []
+        fmt: Optional[PcmFormat] = None
+        missing = []
+        for text in self.fragments(number, counter, pool):
+            loaded = self._load(text)
+            if loaded is None:
+                missing.append(text)
+                continue
+            if fmt is None:
+                fmt = loaded[0]
+            elif loaded[0] != fmt:
+                missing.append(text)
+                continue
+            parts.append((text, loaded[1]))
+        if missing or fmt is None:
+            self.misses += 1
+            for text in missing:
+                self._ensure(text)
+            return None
+
+        channels, width, rate = fmt
+        gap = b"\x00" * (int(rate * GAP_MS / 1000) * channels * width)
+        # jeda setelah prefix dan setelah kata bilangan terakhir (sebelum "menuju")
+        gap_after = (0, len(parts) - 3)
+        out = []
+        for i, (_, data) in enumerate(parts):
+            out.append(data)
+            if i in gap_after:
+                out.append(gap)
+        self.hits += 1
+        return fmt, b"".join(out)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._index),
+            "bytes": self._total,
+            "pending": len(self._pending),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
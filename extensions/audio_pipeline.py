@@ -0,0 +1,229 @@
+"""
+audio_pipeline.py
+Satu jalur output audio (QAudioOutput mode pull) yang diisi dari antrian
+buffer PCM. Chime dan pengumuman diantrekan berurutan sehingga diputar
+back-to-back tanpa jeda dan tanpa timer tetap.
+
+- Format output tetap (PCM 16-bit signed little-endian); klip lain
+  dikonversi sekali saat dimuat (pcm.convert_pcm).
+- Volume per klip (gain) diterapkan di mixer, volume master di QAudioOutput.
+- Setelah klip terakhir selesai terdengar output di-suspend (device tidak
+  lagi ditarik saat idle) dan di-resume saat ada klip baru; resume tidak
+  membuka ulang device seperti start(). Selama masih ada klip yang belum
+  terdengar, kekosongan diisi silence supaya processedUSecs terus maju.
+- ducking_changed(bool) dipancarkan saat pengumuman mulai/selesai supaya
+  audio lain (video) bisa diturunkan.
+
+Pengecualian: TTS live (cache fragmen belum lengkap) diucapkan langsung oleh
+engine pyttsx3 ke device OS, bukan lewat pipeline ini, karena pyttsx3 tidak
+menyediakan stream PCM tanpa merender seluruh kalimat dulu. TTS live tetap
+diurutkan setelah chime (on_finished), tetapi tidak memicu ducking dan tidak
+kena volume master. Setelah fragmen selesai dirender, semua pengumuman lewat
+pipeline.
+"""
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from PyQt5.QtCore import QIODevice, QObject, pyqtSignal
+from PyQt5.QtMultimedia import QAudio, QAudioDeviceInfo, QAudioFormat, QAudioOutput
+
+from .pcm import PcmFormat, apply_gain
+
+BUFFER_MS = 40
+NOTIFY_MS = 10
+
+
+class _Clip:
+    __slots__ = ("data", "pos", "on_finished", "on_started", "enqueued_at", "end_offset")
+
+    def __init__(
+        self,
+        data: bytes,
+        on_finished: Optional[Callable[[], None]],
+        on_started: Optional[Callable[[], None]],
+    ):
+        self.data = data
+        self.pos = 0
+        self.on_finished = on_finished
+        self.on_started = on_started
+        self.enqueued_at = time.perf_counter()
+        self.end_offset = 0
+
+
+class _ClipQueueDevice(QIODevice):
+    """QIODevice yang dibaca QAudioOutput; silence saat antrian kosong (sampai output di-suspend)."""
+
+    def __init__(self, pipeline: "AudioPipeline"):
+        super().__init__(pipeline)
+        self._pipeline = pipeline
+
+    def readData(self, maxlen: int) -> bytes:
+        return self._pipeline._read(maxlen)
+
+    def writeData(self, data) -> int:
+        return -1
+
+    def bytesAvailable(self) -> int:
+        return (1 << 16) + super().bytesAvailable()
+
+    def isSequential(self) -> bool:
+        return True
+
+
+class AudioPipeline(QObject):
+    ducking_changed = pyqtSignal(bool)
+
+    def __init__(self, fmt: PcmFormat = (1, 2, 22050), volume: float = 1.0, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.format = fmt
+        self._clips: Deque[_Clip] = deque()
+        self._playing: List[_Clip] = []  # sudah dibaca device, menunggu selesai terdengar
+        self._read_offset = 0
+        self._ducked = False
+        self._suspended = False
+        self._bytes_per_sec = fmt[0] * fmt[1] * fmt[2]
+
+        # metrik
+        self.clips_played = 0
+        self.suspends = 0
+        self.last_first_sample_ms: Optional[float] = None
+        self._first_sample_total_ms = 0.0
+        self._first_sample_count = 0
+
+        qfmt = QAudioFormat()
+        qfmt.setChannelCount(fmt[0])
+        qfmt.setSampleSize(fmt[1] * 8)
+        qfmt.setSampleRate(fmt[2])
+        qfmt.setCodec("audio/pcm")
+        qfmt.setByteOrder(QAudioFormat.LittleEndian)
+        qfmt.setSampleType(QAudioFormat.SignedInt)
+        info = QAudioDeviceInfo.defaultOutputDevice()
+        if info.isNull() or not info.isFormatSupported(qfmt):
+            raise RuntimeError("device audio tidak tersedia / format tidak didukung")
+
+        self._output = QAudioOutput(info, qfmt, self)
+        self._output.setBufferSize(int(self._bytes_per_sec * BUFFER_MS / 1000))
+        self._output.setNotifyInterval(NOTIFY_MS)
+        self._output.notify.connect(self._check_finished)
+        self._output.setVolume(volume)
+        self._device = _ClipQueueDevice(self)
+        self._device.open(QIODevice.ReadOnly)
+        self._output.start(self._device)
+
+    # ---------- API ----------
+    def enqueue(
+        self,
+        pcm: bytes,
+        gain: float = 1.0,
+        on_finished: Optional[Callable[[], None]] = None,
+        duck: bool = True,
+        on_started: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Antrekan PCM (sudah dalam self.format).
+        on_started dipanggil saat sampel pertama diambil device, on_finished saat klip selesai terdengar.
+        """
+        self._clips.append(_Clip(apply_gain(pcm, gain), on_finished, on_started))
+        if self._suspended:
+            self._suspended = False
+            self._output.resume()
+        elif self._output.state() == QAudio.StoppedState:
+            # stream berhenti (mis. device error): offset mulai dari nol lagi
+            self._finish_playing(len(self._playing))
+            self._read_offset = 0
+            self._output.start(self._device)
+        if duck:
+            self._set_ducked(True)
+
+    def set_volume(self, volume: float):
+        self._output.setVolume(volume)
+
+    def is_busy(self) -> bool:
+        return bool(self._clips or self._playing)
+
+    def stats(self) -> dict:
+        return {
+            "queued_clips": len(self._clips),
+            "clips_played": self.clips_played,
+            "suspended": self._suspended,
+            "suspends": self.suspends,
+            "last_first_sample_ms": self.last_first_sample_ms,
+            "avg_first_sample_ms": (
+                self._first_sample_total_ms / self._first_sample_count if self._first_sample_count else None
+            ),
+        }
+
+    def stop(self):
+        self._clips.clear()
+        self._playing.clear()
+        self._suspended = False
+        self._output.stop()
+
+    # ---------- DEVICE ----------
+    def _read(self, maxlen: int) -> bytes:
+        out = bytearray()
+        while len(out) < maxlen and self._clips:
+            clip = self._clips[0]
+            if clip.pos == 0:
+                ms = (time.perf_counter() - clip.enqueued_at) * 1000
+                self.last_first_sample_ms = ms
+                self._first_sample_total_ms += ms
+                self._first_sample_count += 1
+                if clip.on_started is not None:
+                    clip.on_started()
+            take = clip.data[clip.pos:clip.pos + maxlen - len(out)]
+            out += take
+            clip.pos += len(take)
+            if clip.pos >= len(clip.data):
+                self._clips.popleft()
+                clip.end_offset = self._read_offset + len(out)
+                self._playing.append(clip)
+        frame = self.format[0] * self.format[1]
+        if len(out) < maxlen:
+            # silence supaya stream tetap jalan
+            pad = (maxlen - len(out)) // frame * frame
+            out += bytes(pad)
+        self._read_offset += len(out)
+        return bytes(out)
+
+    def _played_offset(self) -> int:
+        return int(self._output.processedUSecs() * self._bytes_per_sec / 1_000_000)
+
+    def _check_finished(self):
+        if not self._playing:
+            if not self._clips:
+                self._suspend()  # mis. belum pernah ada klip sejak start()
+            return
+        played = self._played_offset()
+        done = 0
+        while done < len(self._playing) and self._playing[done].end_offset <= played:
+            done += 1
+        self._finish_playing(done)
+
+    def _finish_playing(self, count: int):
+        finished, self._playing = self._playing[:count], self._playing[count:]
+        for clip in finished:
+            self.clips_played += 1
+            if clip.on_finished is not None:
+                clip.on_finished()
+        if not self._clips and not self._playing:
+            self._set_ducked(False)
+            self._suspend()
+
+    def _suspend(self):
+        """Antrian habis dan sudah terdengar: hentikan pull sampai enqueue berikutnya."""
+        if self._suspended or self._output.state() != QAudio.ActiveState:
+            return
+        # sisa buffer device hanya silence; offset disamakan dengan yang sudah
+        # diproses supaya end_offset klip berikutnya tetap sejalan processedUSecs
+        # (baik backend menyimpan maupun membuang buffer saat suspend)
+        self._read_offset = self._played_offset()
+        self._suspended = True
+        self.suspends += 1
+        self._output.suspend()
+
+    def _set_ducked(self, ducked: bool):
+        if ducked != self._ducked:
+            self._ducked = ducked
+            self.ducking_changed.emit(ducked)
@@ -0,0 +1,123 @@
+"""
+bus.py
+Registry hook dengan dispatch di luar GUI thread.
+
+Setiap hook punya thread sendiri dan antrian terbatas, jadi hook yang lambat
+(webhook, printer, database) tidak menahan display maupun hook lain.
+GUI thread hanya memanggil dispatch() -> put_nowait ke tiap antrian.
+
+- Antrian penuh: item paling lama dibuang (dropped).
+- Durasi handler melebihi budget_ms: dicatat sebagai slow + warning.
+"""
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from ..config import HOOK_BUDGET_MS, HOOK_QUEUE_MAX
+
+_STOP = object()
+
+
+class _HookRunner:
+    def __init__(self, name: str, handler: Callable[[Any], None], budget_ms: float, max_queue: int):
+        self.name = name
+        self.handler = handler
+        self.budget_ms = budget_ms
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_queue))
+
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.slow = 0
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+
+        self._thread = threading.Thread(target=self._run, name=f"hook-{name}", daemon=True)
+        self._thread.start()
+
+    def put(self, item: Any):
+        self.enqueued += 1
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def stop(self):
+        self.put(_STOP)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            t0 = time.perf_counter()
+            try:
+                self.handler(item)
+            except Exception as e:
+                self.errors += 1
+                print(f"[HOOK ERROR] {self.name}: {e}")
+            ms = (time.perf_counter() - t0) * 1000
+            self.processed += 1
+            self.total_ms += ms
+            if ms > self.max_ms:
+                self.max_ms = ms
+            if ms > self.budget_ms:
+                self.slow += 1
+                if self.slow == 1 or self.slow % 100 == 0:
+                    print(f"[HOOK WARN] {self.name} {ms:.0f}ms > budget {self.budget_ms:.0f}ms (slow={self.slow})")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "slow": self.slow,
+            "budget_ms": self.budget_ms,
+            "max_ms": self.max_ms,
+            "avg_ms": (self.total_ms / self.processed) if self.processed else None,
+        }
+
+
+class HookBus:
+    def __init__(self):
+        self._runners: List[_HookRunner] = []
+
+    def register(
+        self,
+        name: str,
+        handler: Callable[[Any], None],
+        budget_ms: float = HOOK_BUDGET_MS,
+        max_queue: int = HOOK_QUEUE_MAX,
+    ):
+        """Daftarkan handler(item); dipanggil di thread milik hook itu sendiri."""
+        if any(r.name == name for r in self._runners):
+            raise ValueError(f"hook '{name}' sudah terdaftar")
+        self._runners.append(_HookRunner(name, handler, budget_ms, max_queue))
+
+    def unregister(self, name: str):
+        for r in list(self._runners):
+            if r.name == name:
+                self._runners.remove(r)
+                r.stop()
+
+    def dispatch(self, item: Any):
+        for r in self._runners:
+            r.put(item)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {r.name: r.stats() for r in self._runners}
+
+    def shutdown(self):
+        for r in self._runners:
+            r.stop()
+        self._runners.clear()
@@ -0,0 +1,166 @@
+"""
+call_log.py
+Log panggilan terstruktur untuk audit, tanpa memblok GUI thread.
+
+log() hanya memasukkan record ke antrian; thread writer menulis per batch
+ke file JSON-lines atau CSV dengan rotasi per hari / ukuran, lalu (opsional)
+mengompres file yang sudah dirotasi ke .gz.
+"""
+import csv
+import gzip
+import io
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+FIELDS = ["number", "counter", "called_at", "logged_at", "latency_ms"]
+
+_STOP = object()
+
+
+class CallLogWriter:
+    def __init__(
+        self,
+        directory: Path,
+        fmt: str = "jsonl",
+        max_bytes: int = 10 * 1024 * 1024,
+        compress: bool = True,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+    ):
+        if fmt not in ("jsonl", "csv"):
+            raise ValueError(f"format log tidak dikenal: {fmt}")
+        self.directory = Path(directory)
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_queue))
+
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+
+        self._day: Optional[str] = None
+        self._part = 0
+        self._fh = None
+        self._path: Optional[Path] = None
+
+        self._thread = threading.Thread(target=self._run, name="call-log", daemon=True)
+        self._thread.start()
+
+    # ---------- API (GUI / hook thread) ----------
+    def log(self, number: int, counter: str, called_at: float, latency_ms: Optional[float] = None):
+        now = time.time()
+        record = {
+            "number": number,
+            "counter": counter,
+            "called_at": called_at,
+            "logged_at": now,
+            # default: jeda dari nomor dipanggil sampai record masuk antrian log
+            "latency_ms": latency_ms if latency_ms is not None else round((now - called_at) * 1000, 3),
+        }
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+            "file": str(self._path) if self._path else None,
+        }
+
+    def close(self, timeout: float = 2.0):
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    # ---------- WRITER THREAD ----------
+    def _run(self):
+        batch: List[Dict[str, Any]] = []
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stop = True
+            elif item is not None:
+                batch.append(item)
+                # ambil sisa yang sudah menunggu tanpa blok
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except OSError as e:
+                    print(f"[CALLLOG ERROR] {e}")
+                batch = []
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        self._ensure_file(batch[0]["called_at"])
+        buf = io.StringIO()
+        if self.fmt == "jsonl":
+            for rec in batch:
+                buf.write(json.dumps(rec, separators=(",", ":"), ensure_ascii=False))
+                buf.write("\n")
+        else:
+            csv.DictWriter(buf, fieldnames=FIELDS, lineterminator="\n").writerows(batch)
+        self._fh.write(buf.getvalue())
+        self._fh.flush()
+        self.written += len(batch)
+
+    def _ensure_file(self, ts: float):
+        day = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+        if self._fh is not None and day == self._day and self._fh.tell() < self.max_bytes:
+            return
+        if self._fh is not None:
+            self._fh.close()
+            self._finish_file(self._path)
+            self.rotations += 1
+        if day != self._day:
+            self._day = day
+            self._part = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        while True:
+            path = self.directory / f"calls-{day}.{self._part}.{self.fmt}"
+            if not path.exists() and not path.with_name(path.name + ".gz").exists():
+                break
+            self._part += 1
+        self._path = path
+        self._fh = open(path, "w", encoding="utf-8", newline="")
+        if self.fmt == "csv":
+            csv.writer(self._fh, lineterminator="\n").writerow(FIELDS)
+
+    def _finish_file(self, path: Optional[Path]):
+        if not self.compress or path is None or not path.is_file():
+            return
+        gz = path.with_name(path.name + ".gz")
+        with open(path, "rb") as src, gzip.open(gz, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(path)
@@ -1,77 +1,221 @@
-import threading
-from typing import Optional
-from PyQt5.QtCore import QTimer, QObject
-from PyQt5.QtMultimedia import QSoundEffect
-from PyQt5.QtCore import QUrl
+from typing import Any, Callable, Dict, Iterable, Optional
+from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtWidgets import QApplication
 
 from ..queue_manager import QueueManager
 from ..models import CallEntry
-from ..config import ENABLE_TTS, ENABLE_CHIME, CHIME_PATH, TTS_QUEUE_DELAY_MS
+from ..config import (
+    ENABLE_TTS, ENABLE_CHIME, CHIME_PATH,
+    ENABLE_AUDIO_CACHE, AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_MB,
+    AUDIO_FORMAT, AUDIO_MASTER_VOLUME, CHIME_VOLUME, VOICE_VOLUME,
+    CALL_LOG_DIR, CALL_LOG_FORMAT, CALL_LOG_MAX_MB, CALL_LOG_COMPRESS, TICKET_POOLS,
+)
+from .tts import TTSWorker
+from .audio_cache import AudioCache
+from .pcm import apply_gain, load_wav
+from .bus import HookBus
+from .call_log import CallLogWriter
+from ..tracing import TRACER
+from ..startup import PROFILER
 
 
 class ExtensionHooks(QObject):
     """
     Menangani integrasi eksternal:
-    - Logging
-    - Chime
-    - TTS (pyttsx3)
-    Dijalankan non-blok agar UI tidak freeze.
+    - Logging (JSON-lines / CSV, writer di background)
+    - Chime + pengumuman lewat satu jalur audio (tanpa jeda timer)
+    - TTS (pyttsx3, satu worker persisten) + cache audio fragmen frasa
+    Semua hook didispatch lewat HookBus (thread per hook); GUI thread hanya
+    mengantrekan. Hook tambahan (webhook, printer, dsb) via register_hook().
+
+    Dengan defer_audio=True, QtMultimedia/chime/TTS baru disiapkan saat
+    start_audio() dipanggil (mis. setelah paint pertama); panggilan sebelum
+    itu tetap dicatat di log tetapi tidak diumumkan.
     """
-    def __init__(self, queue_manager: QueueManager, enable_logging: bool = True, parent: Optional[QObject] = None):
+    ducking_changed = pyqtSignal(bool)
+    # (entry, voice_pcm | None) dari thread hook audio ke GUI thread
+    _audio_ready = pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        queue_manager: QueueManager,
+        enable_logging: bool = True,
+        parent: Optional[QObject] = None,
+        counters: Iterable[str] = (),
+        defer_audio: bool = False,
+    ):
         super().__init__(parent)
         self.queue_manager = queue_manager
         self.enable_logging = enable_logging
+        self._counters = list(counters)
+
+        # Jalur audio + chime (lihat start_audio)
+        self._pipeline = None  # AudioPipeline
+        self._chime_pcm: Optional[bytes] = None
+        self._tts: Optional[TTSWorker] = None
+        self._audio_cache: Optional[AudioCache] = None
+        self._audio_started = False
+        # id(entry) -> aksi setelah chime selesai (None = chime masih diputar)
+        self._chiming: Dict[int, Optional[Callable[[], None]]] = {}
 
-        # Audio chime
-        self._chime_effect: Optional[QSoundEffect] = None
-        if ENABLE_CHIME:
-            self._prepare_chime()
+        self._call_log: Optional[CallLogWriter] = None
+        if self.enable_logging:
+            self._call_log = CallLogWriter(
+                CALL_LOG_DIR,
+                fmt=CALL_LOG_FORMAT,
+                max_bytes=CALL_LOG_MAX_MB * 1024 * 1024,
+                compress=CALL_LOG_COMPRESS,
+            )
 
+        self.bus = HookBus()
+        if self._call_log is not None:
+            self.bus.register("log", self._log_call)
         self.queue_manager.new_call.connect(self._handle_new_call)
+        if not defer_audio:
+            self.start_audio()
+
+    def start_audio(self):
+        """Siapkan jalur audio, chime, worker TTS dan cache; aman dipanggil ulang."""
+        if self._audio_started or not (ENABLE_CHIME or ENABLE_TTS):
+            return
+        self._audio_started = True
+        with PROFILER.phase("hooks.audio_init"):
+            self._prepare_audio()
+        with PROFILER.phase("hooks.tts_init"):
+            self._tts = TTSWorker() if ENABLE_TTS else None
+            if self._tts is not None and self._pipeline is not None and ENABLE_AUDIO_CACHE:
+                self._audio_cache = AudioCache(
+                    AUDIO_CACHE_DIR,
+                    self._tts,
+                    max_bytes=AUDIO_CACHE_MAX_MB * 1024 * 1024,
+                    target_format=AUDIO_FORMAT,
+                    gain=VOICE_VOLUME,
+                )
+                self._audio_cache.warm(self._counters, prefixes=[p for p in TICKET_POOLS if p])
+        self._audio_ready.connect(self._on_audio_ready)
+        self.bus.register("audio", self._audio_hook)
+
+    def register_hook(self, name: str, handler: Callable[[CallEntry], Any], **kwargs):
+        """Tambah hook; handler(entry) dipanggil di thread hook, bukan GUI thread."""
+        self.bus.register(name, handler, **kwargs)
+
+    def hook_stats(self) -> dict:
+        return self.bus.stats()
 
     # ---------- SIGNAL HANDLER ----------
     def _handle_new_call(self, entry: CallEntry):
-        if self.enable_logging:
-            self._log_call(entry)
-        if ENABLE_CHIME:
-            self._play_chime()
-        if ENABLE_TTS:
-            # beri jeda agar chime selesai dulu
-            QTimer.singleShot(TTS_QUEUE_DELAY_MS, lambda e=entry: self.speak_call(e))
+        # chime langsung diantrekan (PCM sudah di memori); hook runner hanya
+        # mengerjakan lookup cache / TTS
+        if self._audio_started and ENABLE_CHIME:
+            self._start_chime(entry)
+        self.bus.dispatch(entry)
+
+    def _start_chime(self, entry: CallEntry):
+        key = id(entry)
+        self._chiming[key] = None
+        if not self._play_chime(lambda: self._on_chime_finished(key), started=self._trace_cb(entry, "chime_start")):
+            self._chiming.pop(key, None)  # beep: tidak ada yang ditunggu
+
+    def _on_chime_finished(self, key: int):
+        after = self._chiming.pop(key, None)
+        if after is not None:
+            after()
+
+    # ---------- AUDIO HOOK ----------
+    def _audio_hook(self, entry: CallEntry):
+        # lookup cache (bisa baca disk) di thread hook, pemutaran di GUI thread
+        voice = self._cached_voice(entry) if ENABLE_TTS else None
+        self._audio_ready.emit(entry, voice)
+
+    def _on_audio_ready(self, entry: CallEntry, voice: Optional[bytes]):
+        if voice is not None:
+            # chime entry ini sudah lebih dulu di antrian pipeline
+            self._pipeline.enqueue(voice, on_started=self._trace_cb(entry, "tts_first_audio"))
+            return
+        if not ENABLE_TTS:
+            return
+        key = id(entry)
+        if key in self._chiming:
+            # TTS live (cache miss) dimulai tepat saat chime selesai terdengar
+            self._chiming[key] = lambda e=entry: self.speak_call(e)
+        else:
+            self.speak_call(entry)
 
     # ---------- LOG ----------
     def _log_call(self, entry: CallEntry):
-        print(f"[LOG] Dipanggil: Nomor {entry.number} -> {entry.counter}")
-
-    # ---------- CHIME ----------
-    def _prepare_chime(self):
-        if CHIME_PATH.is_file():
-            self._chime_effect = QSoundEffect()
-            self._chime_effect.setSource(QUrl.fromLocalFile(str(CHIME_PATH)))
-            self._chime_effect.setVolume(0.9)
-        else:
-            self._chime_effect = None
+        self._call_log.log(entry.label if entry.pool else entry.number, entry.counter, entry.timestamp)
 
-    def _play_chime(self):
-        if self._chime_effect:
-            self._chime_effect.play()
-        else:
-            QApplication.beep()
+    # ---------- AUDIO ----------
+    def _prepare_audio(self):
+        from .audio_pipeline import AudioPipeline
+        try:
+            self._pipeline = AudioPipeline(AUDIO_FORMAT, volume=AUDIO_MASTER_VOLUME, parent=self)
+        except RuntimeError as e:
+            print(f"[AUDIO WARN] {e}; chime pakai beep")
+            return
+        self._pipeline.ducking_changed.connect(self.ducking_changed)
+        if ENABLE_CHIME and CHIME_PATH.is_file():
+            pcm = load_wav(CHIME_PATH, AUDIO_FORMAT)
+            if pcm is not None:
+                self._chime_pcm = apply_gain(pcm, CHIME_VOLUME)
+
+    def _play_chime(
+        self,
+        on_finished: Optional[Callable[[], None]] = None,
+        started: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """True jika chime masuk jalur audio (on_finished akan dipanggil)."""
+        if self._pipeline is not None and self._chime_pcm is not None:
+            self._pipeline.enqueue(self._chime_pcm, on_finished=on_finished, on_started=started)
+            return True
+        QApplication.beep()
+        if started is not None:
+            started()
+        return False
+
+    @staticmethod
+    def _trace_cb(entry: CallEntry, stage: str) -> Optional[Callable[[], None]]:
+        if not TRACER.enabled:
+            return None
+        return lambda label=entry.label: TRACER.mark(label, stage)
+
+    def _cached_voice(self, entry: CallEntry) -> Optional[bytes]:
+        if self._audio_cache is None:
+            return None
+        composed = self._audio_cache.compose(entry.number, entry.counter, entry.pool)
+        return composed[1] if composed is not None else None
 
     # ---------- TTS ----------
     def speak_call(self, entry: CallEntry):
-        def _run():
-            try:
-                import pyttsx3
-                engine = pyttsx3.init()
-                # Atur suara / kecepatan (opsional)
-                rate = engine.getProperty("rate")
-                engine.setProperty("rate", rate - 20)
-                engine.say(f"Nomor antrian {entry.number}, menuju {entry.counter}")
-                engine.runAndWait()
-                engine.stop()
-            except Exception as e:
-                print(f"[TTS ERROR] {e}")
-
-        threading.Thread(target=_run, daemon=True).start()
\ No newline at end of file
+        """
+        TTS live (dipakai saat fragmen cache belum lengkap). Diputar engine
+        pyttsx3 langsung, di luar AudioPipeline: tanpa ducking / volume master.
+        """
+        if self._tts is None:
+            return
+        spoken = f"{entry.pool} {entry.number}" if entry.pool else entry.number
+        self._tts.submit(
+            f"Nomor antrian {spoken}, menuju {entry.counter}",
+            counter=entry.counter,
+            on_started=self._trace_cb(entry, "tts_first_audio"),
+        )
+
+    def tts_stats(self) -> dict:
+        stats = self._tts.stats() if self._tts else {}
+        if self._audio_cache is not None:
+            stats["audio_cache"] = self._audio_cache.stats()
+        if self._pipeline is not None:
+            stats["audio_pipeline"] = self._pipeline.stats()
+        return stats
+
+    def call_log_stats(self) -> dict:
+        return self._call_log.stats() if self._call_log else {}
+
+    def shutdown(self):
+        self.bus.shutdown()
+        if self._call_log is not None:
+            self._call_log.close()
+        if self._tts is not None:
+            self._tts.stop()
+        if self._pipeline is not None:
+            self._pipeline.stop()
@@ -0,0 +1,86 @@
+"""
+pcm.py
+Utilitas PCM kecil tanpa Qt / audioop: konversi format, gain, baca WAV.
+"""
+import sys
+import wave
+from array import array
+from pathlib import Path
+from typing import Optional, Tuple
+
+# (nchannels, sampwidth, framerate)
+PcmFormat = Tuple[int, int, int]
+
+
+def convert_pcm(data: bytes, src: PcmFormat, dst: PcmFormat) -> bytes:
+    """Konversi PCM little-endian src -> dst (dst harus 16-bit). Tanpa audioop."""
+    if src == dst:
+        return data
+    channels, width, rate = src
+    dst_channels, dst_width, dst_rate = dst
+    if dst_width != 2:
+        raise ValueError("format output harus 16-bit")
+
+    if width == 1:
+        samples = array("h", ((b - 128) << 8 for b in data))
+    elif width == 2:
+        samples = array("h")
+        samples.frombytes(data[: len(data) - len(data) % 2])
+        if sys.byteorder == "big":
+            samples.byteswap()
+    elif width == 4:
+        wide = array("i")
+        wide.frombytes(data[: len(data) - len(data) % 4])
+        if sys.byteorder == "big":
+            wide.byteswap()
+        samples = array("h", (s >> 16 for s in wide))
+    else:
+        raise ValueError(f"sample width {width} tidak didukung")
+
+    # channel
+    if channels != dst_channels:
+        frames = [samples[i:i + channels] for i in range(0, len(samples) - channels + 1, channels)]
+        if dst_channels == 1:
+            samples = array("h", (sum(f) // channels for f in frames))
+        else:
+            samples = array("h", (f[0] for f in frames for _ in range(dst_channels)))
+
+    # sample rate (nearest neighbour, cukup untuk suara/chime)
+    if rate != dst_rate:
+        n_frames = len(samples) // dst_channels
+        out_frames = int(n_frames * dst_rate / rate)
+        step = rate / dst_rate
+        out = array("h", bytes(out_frames * dst_channels * 2))
+        for i in range(out_frames):
+            src_i = int(i * step) * dst_channels
+            for c in range(dst_channels):
+                out[i * dst_channels + c] = samples[src_i + c]
+        samples = out
+
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def apply_gain(data: bytes, gain: float) -> bytes:
+    if gain == 1.0:
+        return data
+    samples = array("h")
+    samples.frombytes(data)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    samples = array("h", (max(-32768, min(32767, int(s * gain))) for s in samples))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def load_wav(path: Path, fmt: PcmFormat) -> Optional[bytes]:
+    try:
+        with wave.open(str(path), "rb") as w:
+            src = (w.getnchannels(), w.getsampwidth(), w.getframerate())
+            data = w.readframes(w.getnframes())
+        return convert_pcm(data, src, fmt)
+    except (OSError, EOFError, wave.Error, ValueError) as e:
+        print(f"[AUDIO WARN] gagal memuat {path}: {e}")
+        return None
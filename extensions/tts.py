@@ -0,0 +1,178 @@
+"""
+tts.py
+Worker TTS tunggal: satu thread memegang satu engine pyttsx3 dan mengonsumsi
+antrian pengumuman yang dibatasi.
+
+Kebijakan coalescing:
+- Jika loket yang sama memanggil lagi sebelum pengumuman lamanya diucapkan,
+  pengumuman lama dibuang (sudah basi).
+- Jika antrian penuh, pengumuman paling lama dibuang.
+
+Worker juga bisa merender teks ke file WAV (render()), dipakai audio cache.
+Render hanya dikerjakan saat tidak ada pengumuman yang menunggu.
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from ..config import TTS_QUEUE_MAX
+
+
+class Announcement:
+    __slots__ = ("text", "counter", "enqueued_at", "on_started")
+
+    def __init__(self, text: str, counter: Optional[str], on_started: Optional[Callable[[], None]] = None):
+        self.text = text
+        self.counter = counter
+        self.enqueued_at = time.monotonic()
+        self.on_started = on_started
+
+
+class TTSWorker:
+    def __init__(self, max_queue: int = TTS_QUEUE_MAX, rate_delta: int = -20):
+        self.max_queue = max(1, max_queue)
+        self.rate_delta = rate_delta
+        self._queue: Deque[Announcement] = deque()
+        self._render_queue: Deque[Tuple[str, str, Optional[Callable[[str, bool], None]]]] = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._first_audio_at: Optional[float] = None
+        self._current: Optional[Announcement] = None
+
+        # metrik
+        self.spoken = 0
+        self.dropped_stale = 0
+        self.dropped_overflow = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.engine_init_ms: Optional[float] = None
+        self.last_ttfa_ms: Optional[float] = None
+        self._ttfa_total_ms = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="tts-worker", daemon=True)
+        self._thread.start()
+
+    # ---------- API ----------
+    def submit(self, text: str, counter: Optional[str] = None, on_started: Optional[Callable[[], None]] = None):
+        """on_started dipanggil (dari thread worker) saat audio pengumuman mulai."""
+        with self._cond:
+            if self._stopped:
+                return
+            if counter is not None:
+                before = len(self._queue)
+                self._queue = deque(a for a in self._queue if a.counter != counter)
+                self.dropped_stale += before - len(self._queue)
+            if len(self._queue) >= self.max_queue:
+                self._queue.popleft()
+                self.dropped_overflow += 1
+            self._queue.append(Announcement(text, counter, on_started))
+            self.max_depth = max(self.max_depth, len(self._queue))
+            self._cond.notify()
+
+    def render(self, text: str, path: str, done: Optional[Callable[[str, bool], None]] = None):
+        """Render text ke file WAV di thread worker; done(path, ok) dipanggil dari thread worker."""
+        with self._cond:
+            if self._stopped:
+                return
+            self._render_queue.append((text, path, done))
+            self._cond.notify()
+
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "queue_depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "spoken": self.spoken,
+            "dropped_stale": self.dropped_stale,
+            "dropped_overflow": self.dropped_overflow,
+            "errors": self.errors,
+            "engine_init_ms": self.engine_init_ms,
+            "last_ttfa_ms": self.last_ttfa_ms,
+            "avg_ttfa_ms": (self._ttfa_total_ms / self.spoken) if self.spoken else None,
+        }
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._queue.clear()
+            self._render_queue.clear()
+            self._cond.notify()
+
+    # ---------- WORKER ----------
+    def _init_engine(self):
+        import pyttsx3
+        t0 = time.perf_counter()
+        engine = pyttsx3.init()
+        # Atur suara / kecepatan (opsional)
+        rate = engine.getProperty("rate")
+        engine.setProperty("rate", rate + self.rate_delta)
+        engine.connect("started-utterance", self._on_started_utterance)
+        self.engine_init_ms = (time.perf_counter() - t0) * 1000
+        return engine
+
+    def _on_started_utterance(self, name=None):
+        if self._first_audio_at is None:
+            self._first_audio_at = time.monotonic()
+            item = self._current
+            if item is not None and item.on_started is not None:
+                item.on_started()
+
+    def _run(self):
+        try:
+            engine = self._init_engine()
+        except Exception as e:
+            print(f"[TTS ERROR] engine gagal init: {e}")
+            with self._cond:
+                self._stopped = True
+                self._queue.clear()
+                self._render_queue.clear()
+            return
+
+        while True:
+            with self._cond:
+                while not self._queue and not self._render_queue and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    break
+                item = self._queue.popleft() if self._queue else None
+                job = self._render_queue.popleft() if item is None else None
+            if item is not None:
+                self._speak(engine, item)
+            else:
+                self._render(engine, *job)
+
+        try:
+            engine.stop()
+        except Exception:
+            pass
+
+    def _speak(self, engine, item: Announcement):
+        self._first_audio_at = None
+        self._current = item
+        try:
+            engine.say(item.text)
+            engine.runAndWait()
+        except Exception as e:
+            self.errors += 1
+            print(f"[TTS ERROR] {e}")
+            return
+        started = self._first_audio_at or time.monotonic()
+        ttfa = (started - item.enqueued_at) * 1000
+        self.last_ttfa_ms = ttfa
+        self._ttfa_total_ms += ttfa
+        self.spoken += 1
+
+    def _render(self, engine, text: str, path: str, done: Optional[Callable[[str, bool], None]]):
+        ok = True
+        self._current = None
+        try:
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+        except Exception as e:
+            ok = False
+            print(f"[TTS ERROR] render '{text}': {e}")
+        if done is not None:
+            done(path, ok)
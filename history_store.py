@@ -0,0 +1,191 @@
+"""
+history_store.py
+Riwayat panggilan jangka panjang dalam bentuk kolom (array bertipe), untuk
+analitik (lihat analytics.py). Berbeda dengan ring buffer di core yang hanya
+menyimpan panggilan terakhir untuk layar, store ini menyimpan semuanya.
+
+Per panggilan hanya 15 byte: number (uint32), counter id (uint16),
+pool id (uint8), timestamp (float64). Nama loket / pool di-intern ke id,
+jadi 10 juta panggilan ~150 MB dan append tetap O(1) (amortized).
+
+Format di disk (<dir>):
+- number.u32, counter.u16, pool.u8, ts.f64 : kolom mentah, append-only
+- names.json : {"counters": [...], "pools": [...], "rows": n, "sorted": bool}
+flush() hanya menambahkan baris baru ke ujung tiap file kolom. Kolom yang
+panjangnya tidak sama (crash di tengah flush) dipotong ke baris lengkap
+terpendek saat load.
+"""
+import json
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# nama kolom -> (typecode array, nama file); ukuran item 4/2/1/8 byte
+COLUMNS = {
+    "number": ("I", "number.u32"),
+    "counter": ("H", "counter.u16"),
+    "pool": ("B", "pool.u8"),
+    "ts": ("d", "ts.f64"),
+}
+NAMES_FILE = "names.json"
+
+# (timestamp, number, counter, pool)
+HistoryRow = Tuple[float, int, str, str]
+
+
+class CallHistoryStore:
+    def __init__(self, directory: Optional[Union[str, Path]] = None, flush_every: int = 256):
+        self.directory = Path(directory) if directory is not None else None
+        self.flush_every = max(1, flush_every)
+        self.number = array(COLUMNS["number"][0])
+        self.counter = array(COLUMNS["counter"][0])
+        self.pool = array(COLUMNS["pool"][0])
+        self.ts = array(COLUMNS["ts"][0])
+        self.counters: List[str] = []
+        self.pools: List[str] = []
+        self._counter_ids: Dict[str, int] = {}
+        self._pool_ids: Dict[str, int] = {}
+        self._flushed = 0  # baris yang sudah ada di disk
+        self._names_dirty = False
+        self._sorted = True  # ts naik (append normal); False -> bisect tidak dipakai
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    def _columns(self) -> Iterator[Tuple[str, array]]:
+        for name in COLUMNS:
+            yield name, getattr(self, name)
+
+    # ---------- APPEND ----------
+    def _intern(self, ids: Dict[str, int], names: List[str], name: str, limit: int) -> int:
+        i = ids.get(name)
+        if i is None:
+            if len(names) >= limit:
+                raise ValueError(f"terlalu banyak nama unik (maks {limit}): {name!r}")
+            i = ids[name] = len(names)
+            names.append(name)
+            self._names_dirty = True
+        return i
+
+    def append(self, number: int, counter: str, timestamp: float, pool: str = ""):
+        # validasi / id dulu (_intern bisa ValueError): kolom tidak boleh terisi sebagian
+        timestamp = float(timestamp)
+        counter_id = self._intern(self._counter_ids, self.counters, counter, 0xFFFF)
+        pool_id = self._intern(self._pool_ids, self.pools, pool, 0xFF)
+        if self.ts and timestamp < self.ts[-1]:
+            self._sorted = False
+        self.number.append(number)
+        self.counter.append(counter_id)
+        self.pool.append(pool_id)
+        self.ts.append(timestamp)
+        if self.directory is not None and len(self.ts) - self._flushed >= self.flush_every:
+            self.flush()
+
+    def append_entry(self, entry):
+        """CallEntry -> satu baris (dipanggil core setiap panggilan)."""
+        self.append(entry.number, entry.counter, entry.timestamp, entry.pool)
+
+    # ---------- BACA ----------
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def index_range(self, start: Optional[float] = None, end: Optional[float] = None) -> Tuple[int, int]:
+        """Indeks baris [i, j) dengan start <= ts < end (bisect jika ts terurut)."""
+        n = len(self.ts)
+        if not self._sorted:
+            return 0, n
+        i = 0 if start is None else bisect_left(self.ts, start)
+        j = n if end is None else bisect_left(self.ts, end, i)
+        return i, j
+
+    @property
+    def is_sorted(self) -> bool:
+        return self._sorted
+
+    def rows(self, start: Optional[float] = None, end: Optional[float] = None) -> Iterator[HistoryRow]:
+        i, j = self.index_range(start, end)
+        counters, pools = self.counters, self.pools
+        for k in range(i, j):
+            ts = self.ts[k]
+            if (start is not None and ts < start) or (end is not None and ts >= end):
+                continue  # hanya terjadi jika ts tidak terurut
+            yield ts, self.number[k], counters[self.counter[k]], pools[self.pool[k]]
+
+    def nbytes(self) -> int:
+        return sum(col.itemsize * len(col) for _, col in self._columns())
+
+    def stats(self) -> dict:
+        return {
+            "rows": len(self),
+            "bytes": self.nbytes(),
+            "counters": len(self.counters),
+            "pools": len(self.pools),
+            "unflushed": len(self) - self._flushed if self.directory is not None else 0,
+        }
+
+    # ---------- DISK ----------
+    def _path(self, name: str) -> Path:
+        return self.directory / COLUMNS[name][1]
+
+    def _load(self):
+        names_path = self.directory / NAMES_FILE
+        if not names_path.exists():
+            return
+        try:
+            names = json.loads(names_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"[HISTORY WARN] {names_path} tidak terbaca: {e}")
+            return
+        self.counters = list(names.get("counters", []))
+        self.pools = list(names.get("pools", []))
+        self._counter_ids = {c: i for i, c in enumerate(self.counters)}
+        self._pool_ids = {p: i for i, p in enumerate(self.pools)}
+
+        sizes = []
+        for name, col in self._columns():
+            path = self._path(name)
+            sizes.append(path.stat().st_size // col.itemsize if path.exists() else 0)
+        rows = min(sizes)
+        for name, col in self._columns():
+            path = self._path(name)
+            if rows == 0:
+                break
+            with open(path, "rb") as fh:
+                col.fromfile(fh, rows)
+            if path.stat().st_size != rows * col.itemsize:
+                os.truncate(path, rows * col.itemsize)  # buang baris setengah jadi
+        if sys.byteorder != "little":
+            for _, col in self._columns():
+                col.byteswap()
+        self._flushed = rows
+        self._sorted = bool(names.get("sorted", True))
+        print(f"[HISTORY] {rows} panggilan dimuat dari {self.directory}")
+
+    def flush(self):
+        """Tambahkan baris baru ke file kolom (tanpa menulis ulang yang lama)."""
+        if self.directory is None:
+            return
+        start, end = self._flushed, len(self.ts)
+        if start == end and not self._names_dirty:
+            return
+        # nama ditulis lebih dulu: baris di disk tidak boleh merujuk id yang belum ada
+        tmp = self.directory / (NAMES_FILE + ".tmp")
+        tmp.write_text(
+            json.dumps({"counters": self.counters, "pools": self.pools, "rows": end, "sorted": self._sorted}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.directory / NAMES_FILE)
+        self._names_dirty = False
+        for name, col in self._columns():
+            chunk = col[start:end]
+            if sys.byteorder != "little":
+                chunk.byteswap()
+            with open(self._path(name), "ab") as fh:
+                chunk.tofile(fh)
+        self._flushed = end
+
+    def close(self):
+        self.flush()
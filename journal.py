@@ -0,0 +1,243 @@
+"""
+journal.py
+Jurnal append-only untuk QueueManager supaya nomor antrian tidak mundur
+saat kiosk restart di tengah hari.
+
+Format:
+- <path>       : log baris, satu record per baris
+                 "J\t<gen>"                                       header generasi
+                 "T\t<number>\t<timestamp>\t<pool>\t<priority>"     tiket diambil (menunggu)
+                 "C\t<number>\t<counter>\t<timestamp>\t<pool>"      panggilan
+                 "R"                                              reset
+                 (kolom pool/priority boleh tidak ada: jurnal lama = pool "")
+- <path>.snap  : snapshot JSON {"gen", "current", "numbers", "calls", "pending"}
+                 hasil kompaksi
+
+Kompaksi menulis snapshot generasi baru lalu mengganti log dengan log kosong
+bergenerasi sama, sehingga replay saat startup hanya membaca snapshot kecil +
+ekor log yang pendek.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+# (number, counter, timestamp, pool)
+JournalCall = Tuple[int, str, float, str]
+# (number, issued_at, pool, priority)
+JournalTicket = Tuple[int, float, str, int]
+
+
+class CallJournal:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        fsync_batch: int = 16,
+        fsync_interval: float = 0.5,
+        compact_every: int = 5000,
+        snapshot_keep: int = 50,
+    ):
+        self.path = Path(path)
+        self.snap_path = self.path.with_name(self.path.name + ".snap")
+        self.fsync_batch = max(1, fsync_batch)
+        self.fsync_interval = fsync_interval
+        self.compact_every = max(1, compact_every)
+
+        self._lock = threading.Lock()
+        self._gen = 0
+        # nomor terakhir per pool tiket ("" = nomor polos)
+        self._numbers: Dict[str, int] = {}
+        self._tail: Deque[JournalCall] = deque(maxlen=max(1, snapshot_keep))
+        # tiket yang belum dipanggil: (pool, number) -> (issued_at, priority), urut ambil
+        self._pending: "OrderedDict[Tuple[str, int], Tuple[float, int]]" = OrderedDict()
+        self._records_since_snapshot = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._restored = False
+        self._fh = None
+        self._closed = False
+
+        self._load()
+        self._compact_locked()
+
+        self._flusher: Optional[threading.Thread] = None
+        if self.fsync_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="call-journal", daemon=True)
+            self._flusher.start()
+
+    # ---------- STATE ----------
+    @property
+    def restored(self) -> bool:
+        """True jika ada state tersimpan yang berhasil dibaca saat open."""
+        return self._restored
+
+    @property
+    def current_number(self) -> int:
+        """Nomor terakhir pool polos ("")."""
+        return self._numbers.get("", 0)
+
+    def pool_numbers(self) -> Dict[str, int]:
+        return dict(self._numbers)
+
+    def recent_calls(self) -> List[JournalCall]:
+        return list(self._tail)
+
+    def pending_tickets(self) -> List[JournalTicket]:
+        return [(n, ts, pool, prio) for (pool, n), (ts, prio) in self._pending.items()]
+
+    # ---------- APPEND ----------
+    def append_ticket(self, number: int, issued_at: float, pool: str = "", priority: int = 0):
+        self._append(
+            f"T\t{number}\t{issued_at:.3f}\t{pool}\t{priority}\n", "T", (number, issued_at, pool, priority)
+        )
+
+    def append_call(self, number: int, counter: str, timestamp: float, pool: str = ""):
+        counter = counter.replace("\t", " ").replace("\n", " ")
+        self._append(
+            f"C\t{number}\t{counter}\t{timestamp:.3f}\t{pool}\n", "C", (number, counter, timestamp, pool)
+        )
+
+    def append_reset(self):
+        self._append("R\n", "R", None)
+
+    def _append(self, line: str, kind: str, record):
+        with self._lock:
+            if self._closed:
+                return
+            self._fh.write(line)
+            self._apply(kind, record)
+            self._unsynced += 1
+            self._records_since_snapshot += 1
+            if self._records_since_snapshot >= self.compact_every:
+                self._compact_locked()
+            elif self._unsynced >= self.fsync_batch:
+                self._sync_locked()
+
+    def _apply(self, kind: str, record):
+        if kind == "R":
+            self._numbers.clear()
+            self._tail.clear()
+            self._pending.clear()
+        elif kind == "T":
+            number, issued_at, pool, priority = record
+            self._numbers[pool] = max(self._numbers.get(pool, 0), number)
+            self._pending[(pool, number)] = (issued_at, priority)
+        else:
+            # nomor tiket yang dipanggil bisa < nomor terakhir yang sudah diambil
+            number, _, _, pool = record
+            self._numbers[pool] = max(self._numbers.get(pool, 0), number)
+            self._pending.pop((pool, number), None)
+            self._tail.append(record)
+
+    # ---------- SYNC ----------
+    def flush(self):
+        with self._lock:
+            if not self._closed:
+                self._sync_locked()
+
+    def _sync_locked(self):
+        if self._unsynced == 0:
+            return
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.fsync_interval)
+            with self._lock:
+                if self._closed:
+                    return
+                if self._unsynced and time.monotonic() - self._last_sync >= self.fsync_interval:
+                    self._sync_locked()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._sync_locked()
+            self._fh.close()
+            self._closed = True
+
+    # ---------- LOAD / COMPACT ----------
+    def _load(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.snap_path.is_file():
+            try:
+                snap = json.loads(self.snap_path.read_text(encoding="utf-8"))
+                self._gen = int(snap["gen"])
+                self._numbers = {str(p): int(n) for p, n in snap.get("numbers", {"": snap["current"]}).items()}
+                for n, c, ts, *pool in snap["calls"]:
+                    self._tail.append((int(n), str(c), float(ts), str(pool[0]) if pool else ""))
+                for n, ts, *rest in snap.get("pending", []):
+                    pool, prio = (str(rest[0]), int(rest[1])) if len(rest) == 2 else ("", 0)
+                    self._pending[(pool, int(n))] = (float(ts), prio)
+                self._restored = True
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"[JOURNAL WARN] snapshot rusak, diabaikan: {e}")
+
+        if not self.path.is_file():
+            return
+        with open(self.path, "r", encoding="utf-8", newline="\n") as fh:
+            header = fh.readline()
+            if not header.startswith("J\t") or not header.endswith("\n"):
+                return
+            try:
+                gen = int(header[2:])
+            except ValueError:
+                return
+            if gen != self._gen:
+                # log sudah terlipat ke snapshot (crash di tengah kompaksi)
+                return
+            for line in fh:
+                if not line.endswith("\n"):
+                    break  # baris terakhir terpotong (crash saat menulis)
+                parts = line[:-1].split("\t")
+                try:
+                    if parts[0] == "C" and len(parts) in (4, 5):
+                        pool = parts[4] if len(parts) == 5 else ""
+                        self._apply("C", (int(parts[1]), parts[2], float(parts[3]), pool))
+                    elif parts[0] == "T" and len(parts) in (3, 5):
+                        pool, prio = (parts[3], int(parts[4])) if len(parts) == 5 else ("", 0)
+                        self._apply("T", (int(parts[1]), float(parts[2]), pool, prio))
+                    elif parts[0] == "R":
+                        self._apply("R", None)
+                    else:
+                        break
+                except ValueError:
+                    break
+                self._restored = True
+
+    def _compact_locked(self):
+        if self._fh is not None:
+            self._fh.flush()
+        gen = self._gen + 1
+        snap = {
+            "gen": gen,
+            "current": self.current_number,
+            "numbers": self._numbers,
+            "calls": list(self._tail),
+            "pending": self.pending_tickets(),
+        }
+        self._write_atomic(self.snap_path, json.dumps(snap, separators=(",", ":")))
+        self._write_atomic(self.path, f"J\t{gen}\n")
+        if self._fh is not None:
+            self._fh.close()
+        self._fh = open(self.path, "a", encoding="utf-8", newline="\n")
+        self._gen = gen
+        self._records_since_snapshot = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: str):
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8", newline="\n") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
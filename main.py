@@ -1,14 +1,20 @@
+from .startup import PROFILER, after_first_paint  # paling awal: titik nol profiler
+
+import os
 import sys
 import argparse
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QGuiApplication
 
-from .queue_manager import QueueManager
-from .ui import MainDisplayWindow, TellerWindow
-from .extensions import ExtensionHooks
+from .core import QueueCore
+from .journal import CallJournal
+from .history_store import CallHistoryStore
+from .protocol import parse_address
+from .config import COUNTERS, LOOP_VIDEO, METRICS_SNAPSHOT_MS, VIDEO_DUCK_VOLUME
+from .tracing import TRACER
+# PyQt5, window display/teller dan extension hooks di-import di main() sesuai
+# mode: mode server tetap headless tanpa memuat Qt sama sekali
 
 
-def bootstrap_sample_data(qm: QueueManager):
+def bootstrap_sample_data(qm):
     qm.next_number("Loket 1")
     qm.next_number("Loket 3")
     qm.next_number("Loket 4")
@@ -17,50 +23,244 @@ def bootstrap_sample_data(qm: QueueManager):
 
 def parse_args():
     p = argparse.ArgumentParser()
-    p.add_argument("--mode", choices=["display", "teller", "both"], default="both")
+    p.add_argument("--mode", choices=["display", "teller", "both", "server"], default="both")
     p.add_argument("--start-number", type=int, default=1)
     p.add_argument("--no-sample", action="store_true")
     p.add_argument("--screen-index", type=int, default=0)
+    p.add_argument("--all-screens", action="store_true",
+                   help="Satu window display per layar; video didecode sekali dan dibagi ke semua layar")
     p.add_argument("--no-full", action="store_true", help="Jalankan tanpa paksa fullscreen")
     p.add_argument("--no-kiosk", action="store_true", help="Jalankan tidak kiosk (menyisakan frame)")
     p.add_argument("--hide-cursor", action="store_true")
+    p.add_argument("--board", action="store_true", help="Tampilkan papan semua loket + riwayat panjang")
+    p.add_argument("--journal", default=None, help="Path jurnal panggilan (lanjutkan nomor setelah restart)")
+    p.add_argument("--history", default=None,
+                   help="Direktori riwayat panggilan kolumnar untuk analitik (python -m package.analytics)")
+    p.add_argument("--listen", default="127.0.0.1:7450", help="Alamat host:port untuk --mode server")
+    p.add_argument("--server", default=None, help="Sambung ke queue server host:port (nomor dibagi antar PC)")
+    p.add_argument("--metrics-port", type=int, default=0, help="Aktifkan tracing + endpoint /metrics di port ini")
+    p.add_argument("--metrics-file", default=None, help="Aktifkan tracing + tulis metrik berkala ke file")
+    p.add_argument("--no-watchdog", action="store_true", help="Matikan detektor stall event loop")
+    p.add_argument("--restart-after", type=float, default=0.0,
+                   help="Buat ulang window display jika event loop macet lebih dari N detik (0 = mati)")
+    p.add_argument("--exit-after", type=float, default=0.0,
+                   help="Keluar paksa jika event loop macet lebih dari N detik, untuk supervisor (0 = mati)")
+    p.add_argument("--stream-port", type=int, default=0,
+                   help="Sajikan display sebagai MJPEG/PNG di port ini (/stream.mjpg, /frame.png)")
+    p.add_argument("--stream-host", default="127.0.0.1",
+                   help="Alamat bind untuk --stream-port (default lokal saja; 0.0.0.0 = semua interface, "
+                        "stream tanpa autentikasi)")
+    p.add_argument("--offscreen", action="store_true",
+                   help="Render display tanpa layar fisik (platform Qt offscreen), biasanya dengan --stream-port")
+    p.add_argument("--stream-size", default="1920x1080", help="Ukuran render display untuk --offscreen (LxT)")
+    p.add_argument("--no-power-saving", action="store_true",
+                   help="Matikan governor daya display (idle / jam tenang / window tersembunyi)")
+    p.add_argument("--profile-startup", action="store_true", help="Cetak rincian waktu tiap fase startup")
     return p.parse_args()
 
 
+def setup_metrics(args, app):
+    """Nyalakan tracing bila diminta; exporter ditutup saat aplikasi keluar."""
+    if not args.metrics_port and not args.metrics_file:
+        return
+    from PyQt5.QtCore import QTimer
+    from .tracing import MetricsServer, MetricsFileWriter
+    TRACER.enabled = True
+    # collector dibaca di GUI thread; exporter (thread sendiri) hanya membaca salinannya
+    TRACER.snapshot()
+    snapshot_timer = QTimer(app)
+    snapshot_timer.timeout.connect(TRACER.snapshot)
+    snapshot_timer.start(METRICS_SNAPSHOT_MS)
+    app.aboutToQuit.connect(snapshot_timer.stop)
+    app.aboutToQuit.connect(TRACER.snapshot)  # nilai akhir untuk writer.close()
+    if args.metrics_port:
+        server = MetricsServer(TRACER, port=args.metrics_port)
+        app.aboutToQuit.connect(server.close)
+    if args.metrics_file:
+        writer = MetricsFileWriter(TRACER, args.metrics_file)
+        app.aboutToQuit.connect(writer.close)
+
+
 def main():
     args = parse_args()
-    app = QApplication(sys.argv)
+    PROFILER.enabled = args.profile_startup
+    PROFILER.mark("imports")
+    with PROFILER.phase("journal"):
+        journal = CallJournal(args.journal) if args.journal else None
+    with PROFILER.phase("history"):
+        history = CallHistoryStore(args.history) if args.history else None
+
+    if args.mode == "server":
+        # headless: tidak perlu QApplication
+        from .server import run_server
+        host, port = parse_address(args.listen)
+        run_server(QueueCore(start_number=args.start_number, journal=journal, history_store=history), host, port)
+        if journal is not None:
+            journal.close()
+        if history is not None:
+            history.close()
+        return
+
+    with PROFILER.phase("import_qt"):
+        from PyQt5.QtCore import QTimer
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QGuiApplication
+        from .queue_manager import QueueManager
 
-    qm = QueueManager(start_number=args.start_number)
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    with PROFILER.phase("qapplication"):
+        app = QApplication(sys.argv)
+    setup_metrics(args, app)
+
+    if journal is not None:
+        app.aboutToQuit.connect(journal.close)
+    if history is not None:
+        app.aboutToQuit.connect(history.close)
+    with PROFILER.phase("queue_manager"):
+        if args.server:
+            from .remote import RemoteQueueManager
+            host, port = parse_address(args.server)
+            qm = RemoteQueueManager(host, port)
+        else:
+            qm = QueueManager(start_number=args.start_number, journal=journal, history_store=history)
 
-    screen_geo = None
     screens = QGuiApplication.screens()
-    if 0 <= args.screen_index < len(screens):
-        screen_geo = screens[args.screen_index].geometry()
+    if args.all_screens:
+        screen_geos = [s.geometry() for s in screens] or [None]
+    elif 0 <= args.screen_index < len(screens):
+        screen_geos = [screens[args.screen_index].geometry()]
     else:
         print(f"[WARN] screen-index {args.screen_index} invalid, gunakan 0..{len(screens)-1}")
+        screen_geos = [None]
 
-    display = None
+    displays = []
     teller = None
-
+    # satu decoder untuk semua window display (dan bertahan saat window dibuat ulang)
+    video_source = None
     if args.mode in ("display", "both"):
-        display = MainDisplayWindow(
+        from .playlist import default_clips
+        clips = default_clips()
+        if clips:
+            from .widgets.video_fanout import SharedVideoSource
+            video_source = SharedVideoSource(clips, loop=LOOP_VIDEO)
+            app.aboutToQuit.connect(video_source.stop)
+
+    def make_display(screen_geo):
+        from .ui.main_display import MainDisplayWindow
+        window = MainDisplayWindow(
             qm,
-            force_fullscreen=not args.no_full,
+            force_fullscreen=not (args.no_full or args.offscreen),
             kiosk=not args.no_kiosk,
             hide_cursor=args.hide_cursor,
             screen_geometry=screen_geo,
+            board_counters=COUNTERS if args.board else None,
+            video_source=video_source,
         )
+        if args.offscreen:
+            w, _, h = args.stream_size.partition("x")
+            window.resize(int(w), int(h))
+        return window
+
+    if args.mode in ("display", "both"):
+        with PROFILER.phase("display"):
+            displays = [make_display(geo) for geo in screen_geos]
 
     if args.mode in ("teller", "both"):
-        teller = TellerWindow(qm, counters=["Loket 1", "Loket 2", "Loket 3", "Loket 4"])
-        teller.show()
+        with PROFILER.phase("teller"):
+            from .ui.teller import TellerWindow
+            teller = TellerWindow(qm, counters=COUNTERS)
+            teller.show()
 
-    ExtensionHooks(qm, enable_logging=True)
+    with PROFILER.phase("hooks"):
+        from .extensions import ExtensionHooks
+        # audio (QtMultimedia, chime, TTS) disiapkan setelah paint pertama
+        hooks = ExtensionHooks(qm, enable_logging=True, counters=COUNTERS, defer_audio=True)
+    app.aboutToQuit.connect(hooks.shutdown)
+    if video_source is not None:
+        # satu source untuk semua window (juga setelah restart_display): duck di sini saja
+        hooks.ducking_changed.connect(
+            lambda ducked: video_source.set_volume(VIDEO_DUCK_VOLUME if ducked else 100)
+        )
+
+    governor = None
+    if displays and not args.no_power_saving:
+        from .power import PowerGovernor
+        governor = PowerGovernor(displays)
+        qm.new_call.connect(governor.note_activity)
+        qm.pending_changed.connect(governor.note_activity)  # tiket baru juga aktivitas
+        for d in displays:
+            governor.state_changed.connect(d.set_power_state)
+        if video_source is not None:
+            governor.state_changed.connect(video_source.set_power_state)
+        app.aboutToQuit.connect(governor.stop)
+
+    streamer = None
+    if args.stream_port and displays:
+        from .stream import DisplayStreamer
+        streamer = DisplayStreamer(displays[0], host=args.stream_host, port=args.stream_port)
+        app.aboutToQuit.connect(streamer.close)
+
+    watchdog = None
+    if not args.no_watchdog:
+        from .watchdog import EventLoopWatchdog
+        watchdog = EventLoopWatchdog(restart_after_s=args.restart_after, exit_after_s=args.exit_after)
+        app.aboutToQuit.connect(watchdog.stop)
+        if governor is not None:
+            governor.state_changed.connect(watchdog.set_power_state)
+
+        def restart_display(_seconds):
+            for i, old in enumerate(list(displays)):
+                displays[i] = make_display(screen_geos[i])
+                old.close()
+                old.deleteLater()
+            if streamer is not None:
+                streamer.set_widget(displays[0])
+            if governor is not None:
+                for d in displays:
+                    d.set_power_state(governor.state)
+                    governor.state_changed.connect(d.set_power_state)
+                governor.set_windows(displays)
 
-    if not args.no_sample:
+        watchdog.wedged.connect(restart_display)
+
+    if TRACER.enabled:
+        TRACER.register_collector("hooks", hooks.hook_stats)
+        TRACER.register_collector("tts", hooks.tts_stats)
+        TRACER.register_collector("call_log", hooks.call_log_stats)
+        if len(displays) == 1:
+            TRACER.register_collector("display", lambda: displays[0].update_counters)
+        elif displays:
+            TRACER.register_collector(
+                "display", lambda: {f"screen{i}": d.update_counters for i, d in enumerate(displays)}
+            )
+        if video_source is not None:
+            TRACER.register_collector("video", video_source.stats)
+        if streamer is not None:
+            TRACER.register_collector("stream", streamer.stats)
+        if watchdog is not None:
+            TRACER.register_collector("watchdog", watchdog.stats)
+        if history is not None:
+            TRACER.register_collector("history", history.stats)
+        if governor is not None:
+            TRACER.register_collector("power", governor.stats)
+
+    # data contoh tidak boleh ikut tercatat di riwayat analitik
+    if not args.no_sample and not args.server and history is None and qm.current() is None:
         bootstrap_sample_data(qm)
 
+    def on_first_paint():
+        PROFILER.mark("first_paint")
+        hooks.start_audio()
+        # dijadwalkan terakhir supaya inisialisasi video display ikut terukur
+        QTimer.singleShot(0, PROFILER.print_report)
+
+    first = displays[0].current_number_label if displays else teller
+    if first is not None:
+        after_first_paint(first, on_first_paint)
+    else:
+        QTimer.singleShot(0, on_first_paint)
+
     sys.exit(app.exec_())
 
 
@@ -1,6 +1,56 @@
-from dataclasses import dataclass
+import time
+from typing import Optional
+
+
+def ticket_label(pool: str, number: int) -> str:
+    """Nomor tampilan: "A007" untuk pool berprefix, "7" untuk pool polos."""
+    return f"{pool}{number:03d}" if pool else str(number)
+
 
-@dataclass
 class CallEntry:
-    number: int
-    counter: str
\ No newline at end of file
+    """Satu panggilan antrian. Pakai __slots__ agar ring buffer history tetap ringkas."""
+    __slots__ = ("number", "counter", "timestamp", "pool")
+
+    def __init__(self, number: int, counter: str, timestamp: Optional[float] = None, pool: str = ""):
+        self.number = number
+        self.counter = counter
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.pool = pool
+
+    @property
+    def label(self) -> str:
+        return ticket_label(self.pool, self.number)
+
+    def __repr__(self):
+        return (
+            f"CallEntry(number={self.number!r}, counter={self.counter!r}, "
+            f"timestamp={self.timestamp!r}, pool={self.pool!r})"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CallEntry):
+            return NotImplemented
+        return (self.number, self.counter, self.timestamp, self.pool) == (
+            other.number, other.counter, other.timestamp, other.pool
+        )
+
+
+class Ticket:
+    """Tiket yang sudah diambil pelanggan tetapi belum dipanggil."""
+    __slots__ = ("number", "issued_at", "pool", "priority")
+
+    def __init__(self, number: int, issued_at: Optional[float] = None, pool: str = "", priority: int = 0):
+        self.number = number
+        self.issued_at = time.time() if issued_at is None else issued_at
+        self.pool = pool
+        self.priority = priority
+
+    @property
+    def label(self) -> str:
+        return ticket_label(self.pool, self.number)
+
+    def __repr__(self):
+        return (
+            f"Ticket(number={self.number!r}, issued_at={self.issued_at!r}, "
+            f"pool={self.pool!r}, priority={self.priority!r})"
+        )
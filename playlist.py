@@ -0,0 +1,77 @@
+"""
+playlist.py
+Daftar klip video signage (tanpa Qt).
+
+Sumber playlist:
+- folder   : semua file video di dalamnya, urut nama
+- .json    : ["a.mp4", "b.mp4"] atau {"clips": [...]}
+- .txt/.m3u: satu path per baris, baris kosong / diawali '#' diabaikan
+Path relatif di manifest dihitung dari folder manifest.
+"""
+import json
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .config import VIDEO_PATH, VIDEO_PLAYLIST
+
+VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".webm", ".m4v"}
+
+
+def load_playlist(source: Path) -> List[Path]:
+    source = Path(source)
+    if source.is_dir():
+        clips = [p for p in sorted(source.iterdir()) if p.suffix.lower() in VIDEO_EXTENSIONS]
+    elif source.is_file():
+        try:
+            text = source.read_text(encoding="utf-8")
+        except OSError as e:
+            print(f"[PLAYLIST WARN] gagal membaca {source}: {e}")
+            return []
+        if source.suffix.lower() == ".json":
+            try:
+                data = json.loads(text)
+            except ValueError as e:
+                print(f"[PLAYLIST WARN] manifest {source} tidak valid: {e}")
+                return []
+            names = data.get("clips", []) if isinstance(data, dict) else data
+        else:
+            names = [ln.strip() for ln in text.splitlines()]
+            names = [n for n in names if n and not n.startswith("#")]
+        clips = [source.parent / n for n in names]
+    else:
+        return []
+    missing = [c for c in clips if not c.is_file()]
+    for c in missing:
+        print(f"[PLAYLIST WARN] klip tidak ditemukan: {c}")
+    return [c for c in clips if c.is_file()]
+
+
+def default_clips() -> List[Path]:
+    """Playlist dari config; fallback ke VIDEO_PATH tunggal."""
+    clips = load_playlist(VIDEO_PLAYLIST)
+    if not clips and VIDEO_PATH.is_file():
+        clips = [VIDEO_PATH]
+    return clips
+
+
+class Playlist:
+    """Kursor melingkar atas daftar klip."""
+
+    def __init__(self, clips: Sequence[Path], loop: bool = True):
+        self.clips = list(clips)
+        self.loop = loop
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self.clips)
+
+    def next(self) -> Optional[Path]:
+        if not self.clips:
+            return None
+        if self._pos >= len(self.clips):
+            if not self.loop:
+                return None
+            self._pos = 0
+        clip = self.clips[self._pos]
+        self._pos += 1
+        return clip
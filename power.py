@@ -0,0 +1,172 @@
+"""
+power.py
+Governor daya untuk display: menurunkan kerja timer / animasi / video saat
+tidak ada aktivitas, dan menghentikannya saat window tidak terlihat atau di
+luar jam layanan.
+
+State:
+- active : ada panggilan dalam POWER_IDLE_AFTER_S terakhir -> semua normal
+- idle   : tanpa panggilan -> marquee diturunkan ke POWER_IDLE_MARQUEE_FPS,
+           heartbeat watchdog diperlambat (video opsional dijeda)
+- quiet  : jam tenang (POWER_QUIET_HOURS) dan tanpa panggilan selama
+           POWER_QUIET_IDLE_S -> marquee & video berhenti
+- hidden : semua window display tersembunyi / minimized / tidak ter-expose
+           (tertutup penuh window lain, tergantung platform) -> sama dengan quiet
+
+Panggilan baru (note_activity) langsung mengembalikan state ke active tanpa
+menunggu tick berikutnya. Komponen menerima state lewat signal state_changed
+dan menerapkan kebijakannya sendiri (set_power_state).
+"""
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from PyQt5.QtCore import QEvent, QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QWidget
+
+from .config import POWER_CHECK_MS, POWER_IDLE_AFTER_S, POWER_QUIET_HOURS, POWER_QUIET_IDLE_S
+
+STATE_ACTIVE = "active"
+STATE_IDLE = "idle"
+STATE_QUIET = "quiet"
+STATE_HIDDEN = "hidden"
+STATES = (STATE_ACTIVE, STATE_IDLE, STATE_QUIET, STATE_HIDDEN)
+
+# state yang tidak perlu menggambar apa pun
+SUSPENDED = (STATE_QUIET, STATE_HIDDEN)
+
+_VISIBILITY_EVENTS = (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose)
+
+
+def _minutes(hhmm: str) -> int:
+    h, _, m = hhmm.partition(":")
+    return int(h) * 60 + int(m or 0)
+
+
+def in_quiet_hours(quiet_hours: Sequence[Tuple[str, str]], now: Optional[float] = None) -> bool:
+    """Rentang "HH:MM"-"HH:MM" waktu lokal; boleh melewati tengah malam (mis. 18:00-07:00)."""
+    t = time.localtime(now)
+    minute = t.tm_hour * 60 + t.tm_min
+    for start, end in quiet_hours:
+        a, b = _minutes(start), _minutes(end)
+        if (a <= minute < b) if a <= b else (minute >= a or minute < b):
+            return True
+    return False
+
+
+class PowerGovernor(QObject):
+    state_changed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        windows: Iterable[QWidget] = (),
+        idle_after_s: float = POWER_IDLE_AFTER_S,
+        quiet_hours: Sequence[Tuple[str, str]] = POWER_QUIET_HOURS,
+        quiet_idle_s: float = POWER_QUIET_IDLE_S,
+        check_ms: int = POWER_CHECK_MS,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self.idle_after_s = idle_after_s
+        self.quiet_hours = list(quiet_hours)
+        self.quiet_idle_s = quiet_idle_s
+        self._windows: List[QWidget] = []
+        self._watched: List[QObject] = []
+
+        self.state = STATE_ACTIVE
+        self._last_activity = time.monotonic()
+        self._entered = self._last_activity
+        self.time_in: Dict[str, float] = {s: 0.0 for s in STATES}
+        self.transitions = 0
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.evaluate)
+        self._timer.start(check_ms)
+        self.set_windows(windows)
+
+    # ---------- INPUT ----------
+    def note_activity(self, *_args):
+        """Slot untuk new_call / pending_changed: kembali active seketika."""
+        self._last_activity = time.monotonic()
+        if self.state != STATE_ACTIVE:
+            self.evaluate()
+
+    def _unwatch(self):
+        for obj in self._watched:
+            try:
+                obj.removeEventFilter(self)
+            except RuntimeError:
+                pass  # window sudah dihapus
+        self._watched = []
+
+    def set_windows(self, windows: Iterable[QWidget]):
+        """Window display yang dipantau (dipanggil ulang jika window dibuat ulang)."""
+        self._unwatch()
+        self._windows = list(windows)
+        for w in self._windows:
+            w.installEventFilter(self)
+            self._watched.append(w)
+            handle = w.windowHandle()
+            if handle is not None:
+                # Expose dikirim ke QWindow, bukan ke QWidget
+                handle.installEventFilter(self)
+                self._watched.append(handle)
+        self.evaluate()
+
+    def eventFilter(self, obj, e):
+        if e.type() in _VISIBILITY_EVENTS:
+            # dievaluasi setelah event diproses (isExposed / isVisible sudah baru)
+            QTimer.singleShot(0, self.evaluate)
+        return False
+
+    # ---------- STATE ----------
+    def _visible(self) -> bool:
+        if not self._windows:
+            return True
+        for w in self._windows:
+            try:
+                if not w.isVisible() or w.isMinimized():
+                    continue
+                handle = w.windowHandle()
+                if handle is None or handle.isExposed():
+                    return True
+            except RuntimeError:
+                continue  # window sudah dihapus Qt
+        return False
+
+    def _compute(self, now: float) -> str:
+        if not self._visible():
+            return STATE_HIDDEN
+        quiet = bool(self.quiet_hours) and in_quiet_hours(self.quiet_hours)
+        idle_for = now - self._last_activity
+        if quiet and idle_for >= self.quiet_idle_s:
+            return STATE_QUIET
+        if idle_for >= self.idle_after_s:
+            return STATE_IDLE
+        return STATE_ACTIVE
+
+    def evaluate(self):
+        now = time.monotonic()
+        state = self._compute(now)
+        if state == self.state:
+            return
+        self.time_in[self.state] += now - self._entered
+        self._entered = now
+        print(f"[POWER] {self.state} -> {state}")
+        self.state = state
+        self.transitions += 1
+        self.state_changed.emit(state)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        seconds = dict(self.time_in)
+        seconds[self.state] += now - self._entered
+        return {
+            "state": self.state,
+            "transitions": self.transitions,
+            "seconds": {s: round(v, 1) for s, v in seconds.items()},
+            "idle_for_s": round(now - self._last_activity, 1),
+        }
+
+    def stop(self):
+        self._timer.stop()
+        self._unwatch()
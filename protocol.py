@@ -0,0 +1,81 @@
+"""
+protocol.py
+Framing sederhana untuk queue server: setiap frame = panjang 4 byte (big-endian)
+diikuti payload JSON ringkas (UTF-8).
+
+Client -> server : {"id": <int>, "op": "next", "counter": <str>}
+                   {"id": <int>, "op": "reset"}
+                   {"id": <int>, "op": "issue", "pool": <str>, "priority": <int>}  (ambil tiket;
+                                                                         pool/priority opsional)
+Server -> client : {"id": <int>, "call": [number, counter, timestamp]}   (balasan)
+                   {"id": <int>, "ok": true}                             (balasan reset)
+                   {"id": <int>, "ticket": [number, issued_at, pool, priority]}  (balasan issue)
+                   {"id": <int>, "error": <str>}
+                   {"ev": "state", "current": <int>, "calls": [[...], ...]}
+                   {"ev": "call", "call": [number, counter, timestamp]}
+                   {"ev": "reset"}
+                   {"ev": "pending", "waiting": <int>, "next": [number, pool] | null, "rate": <float>}
+State juga membawa "pending" (objek yang sama tanpa "ev"). rate = tiket/detik
+semua loket (EWMA), dipakai client untuk estimasi tunggu.
+Entry panggilan [number, counter, timestamp] diberi elemen ke-4 pool jika
+pool-nya berprefix (pool polos tetap 3 elemen).
+"""
+import json
+import struct
+from typing import Any, Dict, List, Tuple
+
+from .models import CallEntry
+
+HEADER = struct.Struct(">I")
+MAX_FRAME = 1 << 20
+DEFAULT_PORT = 7450
+
+
+def encode(msg: Dict[str, Any]) -> bytes:
+    payload = json.dumps(msg, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return HEADER.pack(len(payload)) + payload
+
+
+def decode_frames(buf: bytearray) -> List[Dict[str, Any]]:
+    """Ambil semua frame lengkap dari buf (buf dipotong in-place)."""
+    out = []
+    pos = 0
+    while len(buf) - pos >= HEADER.size:
+        (length,) = HEADER.unpack_from(buf, pos)
+        if length > MAX_FRAME:
+            raise ValueError(f"frame terlalu besar: {length}")
+        end = pos + HEADER.size + length
+        if len(buf) < end:
+            break
+        out.append(json.loads(bytes(buf[pos + HEADER.size:end]).decode("utf-8")))
+        pos = end
+    if pos:
+        del buf[:pos]
+    return out
+
+
+def entry_to_wire(entry: CallEntry) -> list:
+    if entry.pool:
+        return [entry.number, entry.counter, entry.timestamp, entry.pool]
+    return [entry.number, entry.counter, entry.timestamp]
+
+
+def entry_from_wire(data: list) -> CallEntry:
+    number, counter, ts, *pool = data
+    return CallEntry(number=int(number), counter=str(counter), timestamp=float(ts), pool=str(pool[0]) if pool else "")
+
+
+def pending_to_wire(queue_manager) -> Dict[str, Any]:
+    head = queue_manager.peek_next()
+    return {
+        "waiting": queue_manager.waiting_count(),
+        "next": [head.number, head.pool] if head is not None else None,
+        "rate": queue_manager.wait_estimator.throughput(),
+        "numbers": queue_manager.pools.numbers(),  # nomor terakhir per pool
+    }
+
+
+def parse_address(addr: str) -> Tuple[str, int]:
+    """'host:port' / 'host' / ':port' -> (host, port)."""
+    host, _, port = addr.rpartition(":") if ":" in addr else (addr, "", "")
+    return host or "127.0.0.1", int(port) if port else DEFAULT_PORT
@@ -1,33 +1,79 @@
-# (tidak berubah besar, hanya komentar ekstra opsional)
-from typing import List, Optional
+"""
+queue_manager.py
+Adapter QObject tipis di atas core.QueueCore untuk window Qt: semua logika
+ada di core; event core diteruskan sebagai pyqtSignal (new_call, dst) supaya
+TellerWindow / MainDisplayWindow / hooks tetap memakai signal-slot Qt.
+"""
+from typing import Dict, List, Optional
 from PyQt5.QtCore import QObject, pyqtSignal
-from .models import CallEntry
+from .models import CallEntry, Ticket
+from .journal import CallJournal
+from .config import HISTORY_CAPACITY, PRIORITY_NORMAL
+from .core import QueueCore
+from .history_store import CallHistoryStore
 
 
 class QueueManager(QObject):
     new_call = pyqtSignal(CallEntry)
+    ticket_issued = pyqtSignal(Ticket)
+    pending_changed = pyqtSignal(int)  # jumlah tiket menunggu
+    state_synced = pyqtSignal()  # history diganti seluruhnya: baca ulang current() / last_history()
 
-    def __init__(self, start_number: int = 1, parent: Optional[QObject] = None):
+    def __init__(
+        self,
+        start_number: int = 1,
+        parent: Optional[QObject] = None,
+        journal: Optional[CallJournal] = None,
+        history_capacity: int = HISTORY_CAPACITY,
+        pools: Optional[Dict[str, str]] = None,
+        counter_pools: Optional[Dict[str, List[str]]] = None,
+        core: Optional[QueueCore] = None,
+        history_store: Optional[CallHistoryStore] = None,
+    ):
         super().__init__(parent)
-        self._current_number = start_number - 1
-        self._calls: List[CallEntry] = []
+        self.core = core if core is not None else QueueCore(
+            start_number=start_number,
+            journal=journal,
+            history_capacity=history_capacity,
+            pools=pools,
+            counter_pools=counter_pools,
+            history_store=history_store,
+        )
+        self.core.new_call.connect(self.new_call.emit)
+        self.core.ticket_issued.connect(self.ticket_issued.emit)
+        self.core.pending_changed.connect(self.pending_changed.emit)
+        self.core.state_synced.connect(self.state_synced.emit)
+        # dipakai langsung oleh UI / server (tanpa pembungkus)
+        self.pools = self.core.pools
+        self.wait_estimator = self.core.wait_estimator
+        self.history_store = self.core.history_store
+
+    def issue_ticket(self, pool: Optional[str] = None, priority: int = PRIORITY_NORMAL) -> Ticket:
+        return self.core.issue_ticket(pool, priority)
+
+    def waiting_count(self, pool: Optional[str] = None) -> int:
+        return self.core.waiting_count(pool)
+
+    def peek_next(self, counter: Optional[str] = None) -> Optional[Ticket]:
+        return self.core.peek_next(counter)
+
+    def next_label(self, counter: str) -> str:
+        return self.core.next_label(counter)
+
+    def estimated_wait(self, ahead: Optional[int] = None) -> Optional[float]:
+        return self.core.estimated_wait(ahead)
 
     def next_number(self, counter: str) -> CallEntry:
-        self._current_number += 1
-        entry = CallEntry(number=self._current_number, counter=counter)
-        self._calls.append(entry)
-        self.new_call.emit(entry)
-        return entry
+        return self.core.next_number(counter)
 
     def current(self) -> Optional[CallEntry]:
-        return self._calls[-1] if self._calls else None
+        return self.core.current()
 
     def last_history(self, n: int) -> List[CallEntry]:
-        if not self._calls:
-            return []
-        subset = self._calls[:-1]
-        return subset[-n:] if len(subset) >= n else subset
+        return self.core.last_history(n)
+
+    def last_for_counter(self, counter: str) -> Optional[CallEntry]:
+        return self.core.last_for_counter(counter)
 
     def reset(self):
-        self._current_number = 0
-        self._calls.clear()
\ No newline at end of file
+        self.core.reset()
@@ -0,0 +1,223 @@
+"""
+remote.py
+Proxy QueueManager yang terhubung ke queue server (server.py).
+Punya signal new_call yang sama sehingga TellerWindow / MainDisplayWindow
+bisa dipakai tanpa perubahan.
+
+- next_number() tidak menunggu balasan (pipelining); nomor yang dipanggil
+  datang lewat new_call ketika server mem-push event.
+- History dan ringkasan antrian tunggu disimpan lokal (mirror) dari event
+  server, jadi current() / last_history() / waiting_count() tidak perlu
+  round-trip.
+- Reconnect otomatis dengan backoff; request yang belum terkirim ditahan.
+- Snapshot state saat (re)connect dan event reset mengganti mirror seluruhnya
+  lalu memancarkan state_synced supaya window membaca ulang state.
+"""
+from collections import deque
+from typing import Deque, Dict, List, Optional
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtNetwork import QAbstractSocket, QTcpSocket
+
+from .models import CallEntry, Ticket, ticket_label
+from .config import COUNTER_POOLS, HISTORY_CAPACITY, TICKET_POOLS
+from .tracing import TRACER
+from . import protocol
+
+RECONNECT_MIN_MS = 200
+RECONNECT_MAX_MS = 5000
+
+
+class RemoteQueueManager(QObject):
+    new_call = pyqtSignal(CallEntry)
+    pending_changed = pyqtSignal(int)
+    state_synced = pyqtSignal()
+    connection_changed = pyqtSignal(bool)
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = protocol.DEFAULT_PORT,
+        parent: Optional[QObject] = None,
+        history_capacity: int = HISTORY_CAPACITY,
+    ):
+        super().__init__(parent)
+        self.host = host
+        self.port = port
+        self._calls: Deque[CallEntry] = deque(maxlen=max(1, history_capacity))
+        self._last_by_counter: Dict[str, CallEntry] = {}
+        self._pending = {"waiting": 0, "next": None, "rate": 0.0}
+        self._numbers: Dict[str, int] = {}  # nomor terakhir per pool (mirror)
+        self._next_id = 0
+        self._outbox: List[bytes] = []
+        self._inflight: Dict[int, str] = {}
+        # tracing: waktu tekan tombol per loket, menunggu event panggilan dari server
+        self._press_origins: Dict[str, Deque[float]] = {}
+        self._buf = bytearray()
+        self._backoff = RECONNECT_MIN_MS
+
+        self._socket = QTcpSocket(self)
+        self._socket.connected.connect(self._on_connected)
+        self._socket.disconnected.connect(self._on_disconnected)
+        self._socket.readyRead.connect(self._on_ready_read)
+        self._socket.error.connect(self._on_error)
+
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self._connect)
+        self._connect()
+
+    # ---------- API (sama dengan QueueManager) ----------
+    def next_number(self, counter: str) -> Optional[CallEntry]:
+        if TRACER.enabled:
+            self._press_origins.setdefault(counter, deque(maxlen=8)).append(TRACER.take_press())
+        self._send({"op": "next", "counter": counter})
+        return None
+
+    def current(self) -> Optional[CallEntry]:
+        return self._calls[-1] if self._calls else None
+
+    def last_history(self, n: int) -> List[CallEntry]:
+        calls = self._calls
+        start = max(-len(calls), -n - 1)
+        return [calls[i] for i in range(start, -1)]
+
+    def last_for_counter(self, counter: str) -> Optional[CallEntry]:
+        return self._last_by_counter.get(counter)
+
+    def reset(self):
+        self._send({"op": "reset"})
+
+    def issue_ticket(self, pool: Optional[str] = None, priority: int = 0) -> Optional[Ticket]:
+        """Nomor tiket datang lewat balasan server; jumlah menunggu lewat pending_changed."""
+        msg = {"op": "issue", "priority": priority}
+        if pool is not None:
+            msg["pool"] = pool
+        self._send(msg)
+        return None
+
+    def waiting_count(self) -> int:
+        return self._pending["waiting"]
+
+    def peek_next(self, counter: Optional[str] = None) -> Optional[Ticket]:
+        """Tiket terdepan semua pool (subset pool per loket hanya diketahui server)."""
+        head = self._pending["next"]
+        return Ticket(int(head[0]), pool=str(head[1])) if head else None
+
+    def next_label(self, counter: str) -> str:
+        """Seperti QueueManager.next_label; subset pool loket dari config lokal (sama dengan server)."""
+        head = self.peek_next(counter)
+        if head is not None:
+            return head.label
+        pool = (COUNTER_POOLS.get(counter) or list(TICKET_POOLS))[0]
+        return ticket_label(pool, self._numbers.get(pool, 0) + 1)
+
+    def estimated_wait(self, ahead: Optional[int] = None) -> Optional[float]:
+        rate = self._pending["rate"]
+        if rate <= 0:
+            return None
+        return (self._pending["waiting"] if ahead is None else ahead) / rate
+
+    def is_connected(self) -> bool:
+        return self._socket.state() == QAbstractSocket.ConnectedState
+
+    # ---------- SEND ----------
+    def _send(self, msg: dict):
+        self._next_id += 1
+        msg["id"] = self._next_id
+        self._inflight[self._next_id] = msg["op"]
+        frame = protocol.encode(msg)
+        if self.is_connected():
+            self._socket.write(frame)
+        else:
+            self._outbox.append(frame)
+
+    # ---------- CONNECTION ----------
+    def _connect(self):
+        if self._socket.state() == QAbstractSocket.UnconnectedState:
+            self._socket.connectToHost(self.host, self.port)
+
+    def _schedule_reconnect(self):
+        if not self._reconnect_timer.isActive():
+            self._reconnect_timer.start(self._backoff)
+            self._backoff = min(self._backoff * 2, RECONNECT_MAX_MS)
+
+    def _on_connected(self):
+        self._socket.setSocketOption(QAbstractSocket.LowDelayOption, 1)
+        self._backoff = RECONNECT_MIN_MS
+        self._buf.clear()
+        for frame in self._outbox:
+            self._socket.write(frame)
+        self._outbox.clear()
+        self.connection_changed.emit(True)
+
+    def _on_disconnected(self):
+        if self._inflight:
+            # tidak dikirim ulang: bisa jadi server sudah memprosesnya
+            print(f"[REMOTE WARN] {len(self._inflight)} request tanpa balasan saat koneksi putus")
+            self._inflight.clear()
+        self._press_origins.clear()
+        self.connection_changed.emit(False)
+        self._schedule_reconnect()
+
+    def _on_error(self, _err):
+        if self._socket.state() != QAbstractSocket.ConnectedState:
+            self._schedule_reconnect()
+
+    # ---------- RECEIVE ----------
+    def _on_ready_read(self):
+        self._buf += bytes(self._socket.readAll())
+        try:
+            messages = protocol.decode_frames(self._buf)
+        except ValueError as e:
+            print(f"[REMOTE ERROR] frame rusak: {e}")
+            self._socket.abort()
+            return
+        for msg in messages:
+            self._handle(msg)
+
+    def _handle(self, msg: dict):
+        if "id" in msg:
+            self._inflight.pop(msg["id"], None)
+            if "error" in msg:
+                print(f"[REMOTE ERROR] {msg['error']}")
+            return
+        ev = msg.get("ev")
+        if ev == "call":
+            entry = protocol.entry_from_wire(msg["call"])
+            if TRACER.enabled:
+                presses = self._press_origins.get(entry.counter)
+                TRACER.start(entry.label, presses.popleft() if presses else None)
+            self._record(entry)
+            self.new_call.emit(entry)
+        elif ev == "state":
+            self._calls.clear()
+            self._last_by_counter.clear()
+            self._numbers.clear()
+            for data in msg.get("calls", []):
+                self._record(protocol.entry_from_wire(data))
+            self._set_pending(msg.get("pending"))
+            self.state_synced.emit()
+        elif ev == "pending":
+            self._set_pending(msg)
+        elif ev == "reset":
+            self._calls.clear()
+            self._last_by_counter.clear()
+            self._numbers.clear()
+            self.state_synced.emit()
+
+    def _set_pending(self, data: Optional[dict]):
+        if not data:
+            return
+        self._pending = {
+            "waiting": int(data.get("waiting", 0)),
+            "next": data.get("next"),
+            "rate": float(data.get("rate", 0.0)),
+        }
+        for pool, n in (data.get("numbers") or {}).items():
+            self._numbers[pool] = max(self._numbers.get(pool, 0), int(n))
+        self.pending_changed.emit(self._pending["waiting"])
+
+    def _record(self, entry: CallEntry):
+        self._calls.append(entry)
+        self._last_by_counter[entry.counter] = entry
+        self._numbers[entry.pool] = max(self._numbers.get(entry.pool, 0), entry.number)
@@ -0,0 +1,136 @@
+"""
+server.py
+Queue server lokal: satu proses memegang urutan nomor (core.QueueCore,
+tanpa Qt) dan melayani banyak teller / display lewat TCP (lihat protocol.py).
+
+- Request diproses berurutan per koneksi, jadi client boleh pipelining.
+- Setiap panggilan baru di-push ke semua subscriber.
+"""
+import asyncio
+import socket
+from typing import Set
+
+from .core import QueueCore
+from .models import CallEntry
+from . import protocol
+
+# jumlah history yang dikirim ke client baru
+STATE_HISTORY = 16
+
+
+class QueueServer:
+    def __init__(self, queue_manager: QueueCore, host: str = "127.0.0.1", port: int = protocol.DEFAULT_PORT):
+        self.queue_manager = queue_manager
+        self.host = host
+        self.port = port
+        self._clients: Set[asyncio.StreamWriter] = set()
+        self._server = None
+        self.queue_manager.new_call.connect(self._on_new_call)
+        self.queue_manager.pending_changed.connect(self._on_pending_changed)
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        print(f"[SERVER] listen di {self.host}:{self.port}")
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+        for w in list(self._clients):
+            w.close()
+
+    # ---------- BROADCAST ----------
+    def _broadcast(self, msg: dict):
+        frame = protocol.encode(msg)
+        for w in list(self._clients):
+            if w.is_closing():
+                self._clients.discard(w)
+                continue
+            w.write(frame)
+
+    def _on_new_call(self, entry: CallEntry):
+        self._broadcast({"ev": "call", "call": protocol.entry_to_wire(entry)})
+
+    def _on_pending_changed(self, _waiting: int):
+        self._broadcast(dict(protocol.pending_to_wire(self.queue_manager), ev="pending"))
+
+    def _state_message(self) -> dict:
+        qm = self.queue_manager
+        calls = qm.last_history(STATE_HISTORY)
+        cur = qm.current()
+        if cur is not None:
+            calls.append(cur)
+        return {
+            "ev": "state",
+            "current": cur.number if cur else 0,
+            "calls": [protocol.entry_to_wire(c) for c in calls],
+            "pending": protocol.pending_to_wire(qm),
+        }
+
+    # ---------- CLIENT ----------
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        peer = writer.get_extra_info("peername")
+        writer.write(protocol.encode(self._state_message()))
+        self._clients.add(writer)
+        buf = bytearray()
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                buf += data
+                for msg in protocol.decode_frames(buf):
+                    self._dispatch(writer, msg)
+                await writer.drain()
+        except (ConnectionError, ValueError) as e:
+            print(f"[SERVER WARN] koneksi {peer} ditutup: {e}")
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    def _dispatch(self, writer: asyncio.StreamWriter, msg):
+        if not isinstance(msg, dict):
+            # JSON valid tetapi bukan objek ([], 1, "x"): balas error, koneksi tetap
+            writer.write(protocol.encode({"id": None, "error": "request harus objek JSON"}))
+            return
+        req_id = msg.get("id")
+        op = msg.get("op")
+        if op == "next":
+            # new_call -> _broadcast sudah mengirim event ke semua client
+            entry = self.queue_manager.next_number(str(msg.get("counter", "")))
+            writer.write(protocol.encode({"id": req_id, "call": protocol.entry_to_wire(entry)}))
+        elif op == "issue":
+            pool = msg.get("pool")
+            try:
+                if pool is not None and not isinstance(pool, str):
+                    raise TypeError(f"pool harus string: {pool!r}")
+                ticket = self.queue_manager.issue_ticket(pool, int(msg.get("priority", 0)))
+            except (TypeError, ValueError) as e:
+                writer.write(protocol.encode({"id": req_id, "error": str(e)}))
+                return
+            reply = [ticket.number, ticket.issued_at, ticket.pool, ticket.priority]
+            writer.write(protocol.encode({"id": req_id, "ticket": reply}))
+        elif op == "reset":
+            self.queue_manager.reset()
+            self._broadcast({"ev": "reset"})
+            writer.write(protocol.encode({"id": req_id, "ok": True}))
+        else:
+            writer.write(protocol.encode({"id": req_id, "error": f"op tidak dikenal: {op}"}))
+
+
+def run_server(queue_manager: QueueCore, host: str, port: int):
+    server = QueueServer(queue_manager, host, port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
@@ -0,0 +1,73 @@
+"""
+startup.py
+Profiler startup (--profile-startup) + helper "setelah paint pertama".
+
+Waktu diukur relatif terhadap import modul ini (dilakukan paling awal di
+main.py), jadi import PyQt5 ikut terhitung. Saat profiler mati, phase()
+dan mark() hanya mengecek `PROFILER.enabled`.
+"""
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Tuple
+
+T0 = time.perf_counter()
+
+
+class StartupProfiler:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        # (nama, mulai ms, durasi ms); durasi None untuk titik (mark)
+        self.phases: List[Tuple[str, float, object]] = []
+
+    @staticmethod
+    def _now_ms() -> float:
+        return (time.perf_counter() - T0) * 1000
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, self._now_ms() - start))
+
+    def mark(self, name: str):
+        if self.enabled:
+            self.phases.append((name, self._now_ms(), None))
+
+    def report(self) -> str:
+        lines = ["[STARTUP] fase                         mulai(ms)   durasi(ms)"]
+        for name, start, dur in self.phases:
+            d = "-" if dur is None else f"{dur:10.1f}"
+            lines.append(f"[STARTUP] {name:<28} {start:9.1f}   {d:>10}")
+        return "\n".join(lines)
+
+    def print_report(self):
+        if self.enabled:
+            print(self.report())
+
+
+PROFILER = StartupProfiler()
+
+
+def after_first_paint(widget, callback: Callable[[], None]):
+    """
+    Panggil callback sekali, di iterasi event loop setelah widget pertama kali
+    di-paint (bukan sekadar show()), supaya kerja berat tidak menunda frame awal.
+    """
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+
+    class _Watcher(QObject):
+        def eventFilter(self, obj, e):
+            if e.type() == QEvent.Paint:
+                obj.removeEventFilter(self)
+                QTimer.singleShot(0, callback)
+                self.deleteLater()
+            return False
+
+    watcher = _Watcher(widget)
+    widget.installEventFilter(watcher)
+    return watcher
@@ -0,0 +1,262 @@
+"""
+stream.py
+Render MainDisplayWindow (biasanya di platform Qt "offscreen") lalu sajikan
+sebagai MJPEG / gambar tunggal lewat HTTP lokal, untuk layar sekunder murah
+yang hanya bisa menampilkan gambar atau stream MJPEG.
+
+- Dirty tracking: event filter mencatat area Paint dari widget di window
+  target (update panggilan, marquee, video). Tick tanpa area kotor tidak
+  melakukan grab maupun encode, jadi layar diam biayanya praktis nol.
+  Catatan: marquee pixel di state ACTIVE menggambar ulang tiap frame, jadi
+  selama itu setiap tick tetap grab strip marquee + encode JPEG satu frame
+  penuh (hingga STREAM_FPS). Power IDLE menurunkannya ke
+  POWER_IDLE_MARQUEE_FPS; baru di QUIET / HIDDEN tick benar-benar kosong.
+- Hanya area kotor yang di-grab dan ditempel ke frame cache.
+- Encode JPEG di thread terpisah (frame terbaru menang); PNG dibuat saat
+  diminta dan di-cache per frame.
+
+Endpoint: /stream.mjpg, /frame.jpg, /frame.png, / (halaman viewer).
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QBuffer, QByteArray, QEvent, QIODevice, QObject, QRect, QTimer
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from .config import STREAM_FPS, STREAM_JPEG_QUALITY
+
+BOUNDARY = "loketframe"
+
+
+def encode_image(image: QImage, fmt: str, quality: int = -1) -> bytes:
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.WriteOnly)
+    image.save(buf, fmt, quality)
+    buf.close()
+    return bytes(data)
+
+
+class _FrameStore:
+    """Frame terbaru + bytes hasil encode; dibaca thread HTTP."""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.image: Optional[QImage] = None
+        self.encoded: Dict[str, bytes] = {}
+
+    def publish(self, image: QImage, jpeg: bytes):
+        with self.cond:
+            self.seq += 1
+            self.image = image
+            self.encoded = {"JPG": jpeg}
+            self.cond.notify_all()
+
+    def get(self, fmt: str):
+        with self.cond:
+            seq, image, data = self.seq, self.image, self.encoded.get(fmt)
+        if data is None and image is not None:
+            data = encode_image(image, fmt)
+            with self.cond:
+                if self.seq == seq:
+                    self.encoded[fmt] = data
+        return seq, data
+
+    def wait_newer(self, seq: int, timeout: float):
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq != seq, timeout)
+            return self.seq, self.encoded.get("JPG")
+
+
+class DisplayStreamer(QObject):
+    def __init__(
+        self,
+        widget: QWidget,
+        host: str = "127.0.0.1",
+        port: int = 8090,
+        fps: float = STREAM_FPS,
+        quality: int = STREAM_JPEG_QUALITY,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self.widget = widget
+        self.quality = quality
+        self.store = _FrameStore()
+        self._frame: Optional[QImage] = None
+        self._dirty: Optional[QRect] = None
+        self._grabbing = False
+
+        # ditulis GUI thread, thread encoder, dan thread HTTP: selalu lewat _count()
+        self.stats_counters = {
+            "ticks": 0, "idle_ticks": 0, "grabs": 0, "grab_px": 0,
+            "encodes": 0, "encode_skipped": 0, "clients": 0, "bytes_sent": 0,
+        }
+        self._stats_lock = threading.Lock()
+
+        # encoder: slot tunggal, frame terbaru menang
+        self._pending: Optional[QImage] = None
+        self._pending_lock = threading.Condition()
+        self._stop = threading.Event()
+        self._encoder = threading.Thread(target=self._encode_loop, name="stream-encoder", daemon=True)
+        self._encoder.start()
+
+        QApplication.instance().installEventFilter(self)
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start(max(1, int(1000 / fps)))
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._http_thread = threading.Thread(target=self._httpd.serve_forever, name="stream-http", daemon=True)
+        self._http_thread.start()
+        print(f"[STREAM] http://{host}:{self._httpd.server_port}/stream.mjpg")
+        if host in ("", "0.0.0.0", "::"):
+            print("[STREAM WARN] bind ke semua interface: stream terbuka untuk seluruh jaringan tanpa autentikasi")
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self.stats_counters[key] += n
+
+    # ---------- DIRTY TRACKING (GUI thread) ----------
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Paint and not self._grabbing and obj.isWidgetType():
+            win = self.widget
+            if obj is win or win.isAncestorOf(obj):
+                rect = e.rect().translated(obj.mapTo(win, e.rect().topLeft()) - e.rect().topLeft())
+                self._dirty = rect if self._dirty is None else self._dirty.united(rect)
+        return False
+
+    def mark_dirty(self):
+        self._dirty = self.widget.rect()
+
+    def set_widget(self, widget: QWidget):
+        """Ganti window sumber (mis. setelah window dibuat ulang watchdog)."""
+        self.widget = widget
+        self._frame = None
+        self.mark_dirty()
+
+    def _tick(self):
+        self._count("ticks")
+        size = self.widget.size()
+        if self._frame is None or self._frame.size() != size:
+            self._frame = None
+            self._dirty = self.widget.rect()
+        if self._dirty is None:
+            self._count("idle_ticks")
+            return
+        rect, self._dirty = self._dirty.intersected(self.widget.rect()), None
+        if rect.isEmpty():
+            return
+        self._grabbing = True
+        try:
+            pix = self.widget.grab(rect)
+        finally:
+            self._grabbing = False
+        self._count("grabs")
+        self._count("grab_px", rect.width() * rect.height())
+        if self._frame is None:
+            self._frame = pix.toImage().convertToFormat(QImage.Format_RGB32)
+        else:
+            p = QPainter(self._frame)
+            p.drawPixmap(rect.topLeft(), pix)
+            p.end()
+        self._submit(self._frame.copy())
+
+    # ---------- ENCODER (thread) ----------
+    def _submit(self, image: QImage):
+        with self._pending_lock:
+            if self._pending is not None:
+                self._count("encode_skipped")
+            self._pending = image
+            self._pending_lock.notify()
+
+    def _encode_loop(self):
+        while not self._stop.is_set():
+            with self._pending_lock:
+                self._pending_lock.wait_for(lambda: self._pending is not None or self._stop.is_set())
+                image, self._pending = self._pending, None
+            if image is None:
+                continue
+            jpeg = encode_image(image, "JPG", self.quality)
+            self._count("encodes")
+            self.store.publish(image, jpeg)
+
+    # ---------- HTTP ----------
+    def _make_handler(self):
+        streamer = self
+        store = self.store
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if path == "/stream.mjpg":
+                    self._stream()
+                elif path in ("/frame.jpg", "/frame.png"):
+                    _, data = store.get("PNG" if path.endswith("png") else "JPG")
+                    if data is None:
+                        self.send_error(503, "frame belum tersedia")
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "image/png" if path.endswith("png") else "image/jpeg")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.send_header("Cache-Control", "no-cache")
+                    self.end_headers()
+                    self.wfile.write(data)
+                    streamer._count("bytes_sent", len(data))
+                elif path == "/":
+                    body = b'<html><body style="margin:0;background:#000"><img src="/stream.mjpg" style="width:100%"></body></html>'
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                else:
+                    self.send_error(404)
+
+            def _stream(self):
+                self.send_response(200)
+                self.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={BOUNDARY}")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                streamer._count("clients")
+                seq, data = store.get("JPG")
+                try:
+                    while not streamer._stop.is_set():
+                        if data is not None:
+                            self.wfile.write(
+                                f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                                f"Content-Length: {len(data)}\r\n\r\n".encode("ascii")
+                            )
+                            self.wfile.write(data)
+                            self.wfile.write(b"\r\n")
+                            streamer._count("bytes_sent", len(data))
+                        # idle: tidak ada frame baru -> tidak ada kiriman (keepalive 5 s)
+                        new_seq, new_data = store.wait_newer(seq, 5.0)
+                        data = new_data if new_seq != seq else data
+                        seq = new_seq
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    streamer._count("clients", -1)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    # ---------- API ----------
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return dict(self.stats_counters)
+
+    def close(self):
+        self._stop.set()
+        with self._pending_lock:
+            self._pending_lock.notify_all()
+        self._timer.stop()
+        QApplication.instance().removeEventFilter(self)
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,10 @@
+"""
+Modul diimpor sebagai paket `package.*` (lihat `python -m package.analytics`),
+jadi direktori induk repo dimasukkan ke sys.path.
+"""
+import sys
+from pathlib import Path
+
+ROOT_PARENT = str(Path(__file__).resolve().parents[2])
+if ROOT_PARENT not in sys.path:
+    sys.path.insert(0, ROOT_PARENT)
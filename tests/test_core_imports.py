@@ -0,0 +1,18 @@
+"""core harus tetap murah diimpor: hanya stdlib ringan, tanpa Qt / stack HTTP."""
+import subprocess
+import sys
+
+from conftest import ROOT_PARENT
+
+HEAVY = ["PyQt5", "http.server", "http.client", "ssl", "email", "numpy"]
+
+
+def test_core_import_chain_stays_light():
+    code = (
+        "import sys, package.core; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_PARENT, capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == ""
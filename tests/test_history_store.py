@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from package import analytics
+from package.history_store import COLUMNS, CallHistoryStore
+
+# 2024-01-01 00:00:00 UTC
+T0 = 1704067200.0
+ROWS = [
+    (T0 + 8 * 3600, 1, "Loket 1", "A"),
+    (T0 + 8 * 3600 + 300, 2, "Loket 1", "A"),
+    (T0 + 9 * 3600, 1, "Loket 2", "B"),
+    (T0 + 9 * 3600 + 600, 3, "Loket 1", "A"),
+    (T0 + 86400 + 10 * 3600, 4, "Loket 2", ""),
+]
+
+
+def _fill(store, rows=ROWS):
+    for ts, number, counter, pool in rows:
+        store.append(number, counter, ts, pool)
+    return store
+
+
+def test_roundtrip_save_reload(tmp_path):
+    store = _fill(CallHistoryStore(tmp_path, flush_every=2))
+    store.close()
+
+    loaded = CallHistoryStore(tmp_path)
+    assert len(loaded) == len(ROWS)
+    assert list(loaded.rows()) == ROWS
+    assert loaded.counters == ["Loket 1", "Loket 2"]
+    assert loaded.pools == ["A", "B", ""]
+    assert loaded.is_sorted
+    assert loaded.stats()["unflushed"] == 0
+
+    # append setelah reload hanya menambah ekor file kolom
+    loaded.append(5, "Loket 3", T0 + 2 * 86400, "A")
+    loaded.close()
+    again = CallHistoryStore(tmp_path)
+    assert list(again.rows())[-1] == (T0 + 2 * 86400, 5, "Loket 3", "A")
+    assert len(again) == len(ROWS) + 1
+
+
+def test_partial_column_truncated_on_load(tmp_path):
+    _fill(CallHistoryStore(tmp_path)).close()
+    # crash di tengah flush: satu kolom punya baris ekstra, satu lagi setengah baris
+    with open(tmp_path / COLUMNS["number"][1], "ab") as fh:
+        fh.write((99).to_bytes(4, "little"))
+    with open(tmp_path / COLUMNS["ts"][1], "ab") as fh:
+        fh.write(b"\0" * 3)
+
+    loaded = CallHistoryStore(tmp_path)
+    assert list(loaded.rows()) == ROWS
+    for name, (typecode, filename) in COLUMNS.items():
+        itemsize = getattr(loaded, name).itemsize
+        assert os.path.getsize(tmp_path / filename) == len(ROWS) * itemsize
+
+
+def test_rejected_append_keeps_columns_aligned(tmp_path):
+    store = CallHistoryStore(tmp_path)
+    for i in range(0xFF):
+        store.append(i, "Loket 1", T0 + i, f"P{i}")
+    with pytest.raises(ValueError):
+        store.append(1, "Loket 1", T0 + 1000, "satu pool terlalu banyak")
+    with pytest.raises(TypeError):
+        store.append(1, "Loket 1", None, "P0")
+    assert {len(col) for _, col in store._columns()} == {0xFF}
+    assert list(store.rows())[-1] == (T0 + 0xFE, 0xFE, "Loket 1", "P254")
+    store.close()
+    assert len(CallHistoryStore(tmp_path)) == 0xFF
+
+
+def test_unsorted_range_filter(tmp_path):
+    store = CallHistoryStore()
+    _fill(store, list(reversed(ROWS)))
+    assert not store.is_sorted
+    start, end = T0 + 8 * 3600 + 1, T0 + 86400
+    expected = sorted(r for r in ROWS if start <= r[0] < end)
+    assert sorted(store.rows(start, end)) == expected
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_summarize_numpy_matches_python(monkeypatch, ordered):
+    np = pytest.importorskip("numpy")
+    store = _fill(CallHistoryStore(), ROWS if ordered else list(reversed(ROWS)))
+    args = (store, T0, T0 + 2 * 86400, 0)
+
+    monkeypatch.setattr(analytics, "np", np)
+    fast = analytics.summarize(*args)
+    monkeypatch.setattr(analytics, "np", None)
+    slow = analytics.summarize(*args)
+
+    assert fast.pop("backend") == "numpy"
+    assert slow.pop("backend") == "python"
+    assert fast == slow
+    assert slow["daily"] == {"2024-01-01": 4, "2024-01-02": 1}
+    assert slow["per_counter_hour"]["Loket 1"][8] == 2
+    assert slow["service"]["Loket 1"] == {"calls": 3, "intervals": 1, "mean_s": 300.0}
@@ -0,0 +1,101 @@
+import json
+
+from package.journal import CallJournal
+
+
+def _open(path):
+    # tanpa thread flusher; fsync tiap batch
+    return CallJournal(path, fsync_interval=0)
+
+
+def _write_log(path, gen, *lines):
+    path.write_text("".join([f"J\t{gen}\n"] + [line + "\n" for line in lines]), encoding="utf-8")
+
+
+def test_roundtrip_new_format(tmp_path):
+    path = tmp_path / "calls.log"
+    j = _open(path)
+    j.append_ticket(1, 10.0, "A", 0)
+    j.append_ticket(2, 11.0, "A", 1)
+    j.append_ticket(1, 12.0, "B", 0)
+    j.append_call(1, "Loket 1", 20.0, "A")
+    j.close()
+
+    j = _open(path)
+    assert j.restored
+    assert j.pool_numbers() == {"A": 2, "B": 1}
+    assert j.recent_calls() == [(1, "Loket 1", 20.0, "A")]
+    assert j.pending_tickets() == [(2, 11.0, "A", 1), (1, 12.0, "B", 0)]
+    j.close()
+
+
+def test_replay_old_format_records(tmp_path):
+    path = tmp_path / "calls.log"
+    (tmp_path / "calls.log.snap").write_text(
+        json.dumps({"gen": 3, "current": 0, "calls": [], "pending": []}), encoding="utf-8"
+    )
+    _write_log(
+        path, 3,
+        "T\t5\t100.000",                  # tiket lama (3 kolom): pool "", prioritas 0
+        "C\t4\tLoket 1\t101.000",         # panggilan lama (4 kolom)
+        "C\t1\tLoket 2\t102.000\tA",      # format baru (5 kolom)
+        "T\t2\t103.000\tA\t1",
+    )
+    j = _open(path)
+    assert j.pool_numbers() == {"": 5, "A": 2}
+    assert j.current_number == 5
+    assert j.recent_calls() == [(4, "Loket 1", 101.0, ""), (1, "Loket 2", 102.0, "A")]
+    assert j.pending_tickets() == [(5, 100.0, "", 0), (2, 103.0, "A", 1)]
+    j.close()
+
+
+def test_replay_old_snapshot_without_numbers(tmp_path):
+    path = tmp_path / "calls.log"
+    (tmp_path / "calls.log.snap").write_text(
+        json.dumps({
+            "gen": 7,
+            "current": 12,
+            "calls": [[11, "Loket 1", 50.0], [12, "Loket 2", 51.0]],
+            "pending": [[13, 52.0]],
+        }),
+        encoding="utf-8",
+    )
+    _write_log(path, 7, "C\t13\tLoket 1\t60.000")
+    j = _open(path)
+    assert j.restored
+    assert j.pool_numbers() == {"": 13}
+    assert j.recent_calls()[-1] == (13, "Loket 1", 60.0, "")
+    assert j.pending_tickets() == []  # tiket 13 sudah dipanggil
+    j.close()
+
+
+def test_stale_log_generation_and_torn_line_ignored(tmp_path):
+    path = tmp_path / "calls.log"
+    (tmp_path / "calls.log.snap").write_text(
+        json.dumps({"gen": 2, "current": 3, "numbers": {"": 3}, "calls": [], "pending": []}),
+        encoding="utf-8",
+    )
+    _write_log(path, 1, "C\t99\tLoket 1\t1.000")  # sudah terlipat ke snapshot
+    j = _open(path)
+    assert j.pool_numbers() == {"": 3}
+    j.close()
+
+    path.write_text(path.read_text(encoding="utf-8") + "C\t4\tLoket 1\t2.000\nC\t5\tLok", encoding="utf-8")
+    j = _open(path)
+    assert j.pool_numbers() == {"": 4}
+    j.close()
+
+
+def test_reset_record_clears_state(tmp_path):
+    path = tmp_path / "calls.log"
+    j = _open(path)
+    j.append_ticket(1, 1.0, "A", 0)
+    j.append_call(1, "Loket 1", 2.0, "A")
+    j.append_reset()
+    j.close()
+
+    j = _open(path)
+    assert j.pool_numbers() == {}
+    assert j.recent_calls() == []
+    assert j.pending_tickets() == []
+    j.close()
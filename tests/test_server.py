@@ -0,0 +1,47 @@
+import pytest
+
+from package import protocol
+from package.core import QueueCore
+from package.server import QueueServer
+
+
+class _Writer:
+    def __init__(self):
+        self.buf = bytearray()
+
+    def write(self, data: bytes):
+        self.buf += data
+
+    def replies(self):
+        return protocol.decode_frames(self.buf)
+
+
+@pytest.fixture
+def server():
+    return QueueServer(QueueCore(pools={"A": "Teller"}))
+
+
+@pytest.mark.parametrize("msg", [[], 1, "x", None])
+def test_non_object_request_gets_error_reply(server, msg):
+    w = _Writer()
+    server._dispatch(w, msg)
+    (reply,) = w.replies()
+    assert reply["id"] is None and "error" in reply
+
+
+@pytest.mark.parametrize("extra", [{"priority": None}, {"priority": "tinggi"}, {"pool": ["A"]}, {"pool": "Z"}])
+def test_bad_issue_arguments_get_error_reply(server, extra):
+    w = _Writer()
+    server._dispatch(w, dict({"id": 7, "op": "issue"}, **extra))
+    (reply,) = w.replies()
+    assert reply["id"] == 7 and "error" in reply
+    assert server.queue_manager.waiting_count() == 0
+
+
+def test_issue_and_next(server):
+    w = _Writer()
+    server._dispatch(w, {"id": 1, "op": "issue", "pool": "A", "priority": 1})
+    server._dispatch(w, {"id": 2, "op": "next", "counter": "Loket 1"})
+    issued, called = w.replies()
+    assert issued == {"id": 1, "ticket": [1, issued["ticket"][1], "A", 1]}
+    assert called["id"] == 2 and called["call"][:2] == [1, "Loket 1"]
@@ -0,0 +1,64 @@
+import pytest
+
+from package.ticket_pool import TicketPools
+
+POOLS = {"A": "Teller", "B": "Customer Service"}
+COUNTER_POOLS = {"Loket 1": ["A"], "Loket 3": ["A", "B"], "Loket 4": ["B"]}
+
+
+@pytest.fixture
+def pools():
+    return TicketPools(POOLS, COUNTER_POOLS)
+
+
+def test_priority_then_age_across_pools(pools):
+    pools.issue("B", issued_at=1.0)
+    pools.issue("A", issued_at=2.0)
+    pools.issue("B", priority=1, issued_at=3.0)
+    pools.issue("A", issued_at=4.0)
+
+    # prioritas tinggi dulu walau paling baru, lalu urut ambil lintas pool
+    labels = [pools.take("Loket 3").label for _ in range(4)]
+    assert labels == ["B002", "B001", "A001", "A002"]
+    assert pools.take("Loket 3") is None
+    assert pools.waiting() == 0
+
+
+def test_counter_only_takes_from_its_pools(pools):
+    pools.issue("B")
+    pools.issue("A")
+
+    assert pools.peek("Loket 1").label == "A001"
+    assert pools.take("Loket 1").label == "A001"
+    assert pools.take("Loket 1") is None  # B001 bukan milik Loket 1
+    assert pools.waiting("B") == 1
+    assert pools.take("Loket 4").label == "B001"
+
+
+def test_counter_without_config_uses_all_pools(pools):
+    assert pools.pools_for("Loket 9") == ["A", "B"]
+    pools.issue("B")
+    assert pools.take("Loket 9").label == "B001"
+
+
+def test_next_label_prefers_head_then_first_pool(pools):
+    pools.set_numbers({"A": 6, "B": 2})
+    assert pools.next_label("Loket 4") == "B003"
+    assert pools.next_label("Loket 3") == "A007"
+
+    pools.issue("B")
+    assert pools.next_label("Loket 3") == "B003"
+    assert pools.next_label("Loket 1") == "A007"
+
+
+def test_plain_pool_label_has_no_prefix():
+    pools = TicketPools({"": "Umum"})
+    pools.set_numbers({"": 41})
+    assert pools.next_label("Loket 1") == "42"
+
+
+def test_unknown_pool_rejected(pools):
+    with pytest.raises(ValueError):
+        pools.issue("Z")
+    with pytest.raises(ValueError):
+        TicketPools(POOLS, {"Loket 1": ["Z"]})
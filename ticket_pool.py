@@ -0,0 +1,122 @@
+"""
+ticket_pool.py
+Pool tiket per layanan + kelas prioritas (tanpa Qt).
+
+- Setiap pool punya prefix dan urutan nomor sendiri (A001, B001, ...).
+- Tiket menunggu disimpan di heap per pool dengan kunci
+  (-prioritas, urutan ambil): prioritas lebih tinggi dulu, lalu yang paling
+  lama menunggu.
+- Loket melayani subset pool; take(counter) hanya membandingkan kepala heap
+  pool-pool miliknya (jumlahnya kecil) lalu heappop, jadi O(log n) tanpa
+  memindai daftar tiket.
+"""
+import heapq
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .models import Ticket, ticket_label
+
+# (-priority, urutan ambil, tiket)
+_HeapItem = Tuple[int, int, Ticket]
+
+
+class TicketPools:
+    def __init__(
+        self,
+        pools: Mapping[str, str],
+        counter_pools: Optional[Mapping[str, Sequence[str]]] = None,
+    ):
+        if not pools:
+            raise ValueError("minimal satu pool tiket")
+        self.names: Dict[str, str] = dict(pools)
+        self._all = list(self.names)
+        self.counter_pools: Dict[str, List[str]] = {}
+        for counter, prefixes in (counter_pools or {}).items():
+            unknown = [p for p in prefixes if p not in self.names]
+            if unknown:
+                raise ValueError(f"pool tidak dikenal untuk {counter}: {unknown}")
+            self.counter_pools[counter] = list(prefixes)
+        self._heaps: Dict[str, List[_HeapItem]] = {p: [] for p in self._all}
+        self._numbers: Dict[str, int] = {p: 0 for p in self._all}
+        self._order = 0
+        self._waiting = 0
+
+    # ---------- NOMOR ----------
+    def pools_for(self, counter: str) -> List[str]:
+        return self.counter_pools.get(counter) or self._all
+
+    def next_number(self, pool: str) -> int:
+        self._check(pool)
+        self._numbers[pool] += 1
+        return self._numbers[pool]
+
+    def numbers(self) -> Dict[str, int]:
+        return dict(self._numbers)
+
+    def set_numbers(self, numbers: Mapping[str, int]):
+        """Lanjutkan urutan (mis. dari jurnal); pool yang sudah tidak dikonfigurasi diabaikan."""
+        for pool, n in numbers.items():
+            if pool in self._numbers:
+                self._numbers[pool] = max(self._numbers[pool], n)
+
+    # ---------- TIKET ----------
+    def issue(self, pool: Optional[str] = None, priority: int = 0, issued_at: Optional[float] = None) -> Ticket:
+        pool = self._all[0] if pool is None else pool
+        ticket = Ticket(self.next_number(pool), issued_at, pool=pool, priority=priority)
+        self._push(ticket)
+        return ticket
+
+    def restore(self, ticket: Ticket):
+        if ticket.pool not in self._heaps:
+            print(f"[POOL WARN] tiket {ticket.label} dari pool yang tidak dikonfigurasi, diabaikan")
+            return
+        self._numbers[ticket.pool] = max(self._numbers[ticket.pool], ticket.number)
+        self._push(ticket)
+
+    def _push(self, ticket: Ticket):
+        self._order += 1
+        heapq.heappush(self._heaps[ticket.pool], (-ticket.priority, self._order, ticket))
+        self._waiting += 1
+
+    def _best_pool(self, pools: Iterable[str]) -> Optional[str]:
+        best = None
+        best_key = None
+        for p in pools:
+            heap = self._heaps[p]
+            if heap and (best_key is None or heap[0][:2] < best_key):
+                best, best_key = p, heap[0][:2]
+        return best
+
+    def take(self, counter: str) -> Optional[Ticket]:
+        pool = self._best_pool(self.pools_for(counter))
+        if pool is None:
+            return None
+        self._waiting -= 1
+        return heapq.heappop(self._heaps[pool])[2]
+
+    def peek(self, counter: Optional[str] = None) -> Optional[Ticket]:
+        pool = self._best_pool(self.pools_for(counter) if counter is not None else self._all)
+        return self._heaps[pool][0][2] if pool is not None else None
+
+    def next_label(self, counter: str) -> str:
+        """Label yang akan didapat loket: kepala antriannya, atau nomor baru pool pertamanya."""
+        head = self.peek(counter)
+        if head is not None:
+            return head.label
+        pool = self.pools_for(counter)[0]
+        return ticket_label(pool, self._numbers[pool] + 1)
+
+    def waiting(self, pool: Optional[str] = None) -> int:
+        return self._waiting if pool is None else len(self._heaps.get(pool, ()))
+
+    def clear(self):
+        for p in self._all:
+            self._heaps[p].clear()
+            self._numbers[p] = 0
+        self._waiting = 0
+
+    def _check(self, pool: str):
+        if pool not in self._numbers:
+            raise ValueError(f"pool tiket tidak dikenal: {pool!r}")
+
+    def stats(self) -> dict:
+        return {(p or "default"): {"waiting": len(self._heaps[p]), "issued": self._numbers[p]} for p in self._all}
@@ -0,0 +1,222 @@
+"""
+tracing.py
+Tracing latensi end-to-end per panggilan + endpoint metrik.
+
+Tahap (stage) yang dicatat, relatif terhadap tekan tombol teller (atau
+next_number bila tidak ada tekan tombol, mis. mode server/skrip):
+    press -> next_number -> signal -> display_update -> chime_start -> tts_first_audio
+
+Pada client --server (remote.RemoteQueueManager) tahap next_number adalah
+tekan tombol -> event panggilan diterima dari server (round-trip). Panggilan
+dari loket di PC lain diukur sejak event diterima.
+
+Dipakai lewat objek global TRACER. Saat tracing mati, call site hanya
+mengecek `TRACER.enabled`, jadi overhead praktis nol.
+
+Metrik diekspos dalam format teks Prometheus lewat HTTP lokal (/metrics)
+dan/atau ditulis berkala ke file. Statistik runtime lain (hook bus, TTS,
+display, watchdog) didaftarkan lewat register_collector().
+
+Collector membaca objek Qt / state milik GUI thread, jadi tidak dipanggil
+dari thread exporter: pemiliknya memanggil snapshot() berkala (QTimer di
+main.setup_metrics) dan exporter hanya membaca salinan terakhir.
+"""
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+STAGES = ["next_number", "signal", "display_update", "chime_start", "tts_first_audio"]
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+MAX_TRACKED_CALLS = 256
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value_ms: float):
+        i = 0
+        while i < len(BUCKETS_MS) and value_ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.total += value_ms
+        self.count += 1
+
+
+class CallTracer:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._pending_press: Optional[float] = None
+        # label tiket (CallEntry.label) -> waktu awal (monotonic)
+        self._origins: "OrderedDict[str, float]" = OrderedDict()
+        self.histograms: Dict[str, Histogram] = {s: Histogram() for s in STAGES}
+        self._collectors: List[Tuple[str, Callable[[], dict]]] = []
+        # hasil snapshot() terakhir; None -> exporter memanggil collect() langsung
+        self._stats: Optional[Dict[str, float]] = None
+
+    # ---------- MARK ----------
+    def mark_press(self):
+        self._pending_press = time.monotonic()
+
+    def take_press(self) -> float:
+        """Ambil waktu tekan tombol terakhir (sekarang bila tidak ada), untuk start() yang tertunda."""
+        now = time.monotonic()
+        with self._lock:
+            origin = self._pending_press if self._pending_press is not None else now
+            self._pending_press = None
+        return origin
+
+    def start(self, label: str, origin: Optional[float] = None):
+        """Dipanggil di next_number: tautkan nomor ke tekan tombol terakhir (atau origin)."""
+        now = time.monotonic()
+        with self._lock:
+            if origin is None:
+                origin = self._pending_press if self._pending_press is not None else now
+                self._pending_press = None
+            self._origins[label] = origin
+            self._origins.move_to_end(label)
+            while len(self._origins) > MAX_TRACKED_CALLS:
+                self._origins.popitem(last=False)
+            self.histograms["next_number"].observe((now - origin) * 1000)
+
+    def mark(self, label: str, stage: str):
+        now = time.monotonic()
+        with self._lock:
+            origin = self._origins.get(label)
+            if origin is None:
+                return
+            self.histograms[stage].observe((now - origin) * 1000)
+
+    # ---------- COLLECTORS ----------
+    def register_collector(self, name: str, fn: Callable[[], dict]):
+        """fn() -> dict (boleh bersarang); nilai numerik diekspos sebagai gauge."""
+        self._collectors.append((name, fn))
+
+    def collect(self) -> Dict[str, float]:
+        """Panggil semua collector; harus dari thread pemilik datanya (GUI thread)."""
+        out: Dict[str, float] = {}
+        for name, fn in self._collectors:
+            try:
+                _flatten(name, fn(), out)
+            except Exception as e:
+                print(f"[METRICS WARN] collector {name}: {e}")
+        return out
+
+    def snapshot(self):
+        """Salin hasil collector untuk dibaca exporter dari thread lain."""
+        stats = self.collect()
+        with self._lock:
+            self._stats = stats
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = self._stats
+        return dict(stats) if stats is not None else self.collect()
+
+    # ---------- EXPORT ----------
+    def prometheus_text(self) -> str:
+        lines = [
+            "# HELP loket_call_stage_ms Latensi dari tekan tombol teller sampai tiap tahap",
+            "# TYPE loket_call_stage_ms histogram",
+        ]
+        with self._lock:
+            snapshot = {s: (list(h.counts), h.total, h.count) for s, h in self.histograms.items()}
+        for stage, (counts, total, count) in snapshot.items():
+            cumulative = 0
+            for le, c in zip(BUCKETS_MS, counts):
+                cumulative += c
+                lines.append(f'loket_call_stage_ms_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'loket_call_stage_ms_bucket{{stage="{stage}",le="+Inf"}} {count}')
+            lines.append(f'loket_call_stage_ms_sum{{stage="{stage}"}} {total:.3f}')
+            lines.append(f'loket_call_stage_ms_count{{stage="{stage}"}} {count}')
+
+        stats = self.stats()
+        if stats:
+            lines.append("# HELP loket_stat Statistik runtime (hook, TTS, display, watchdog, ...)")
+            lines.append("# TYPE loket_stat gauge")
+            for key, value in stats.items():
+                group, _, name = key.rpartition(".")
+                lines.append(f'loket_stat{{group="{group}",name="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+def _flatten(prefix: str, data: dict, out: Dict[str, float]):
+    for k, v in data.items():
+        key = f"{prefix}.{k}"
+        if isinstance(v, dict):
+            _flatten(key, v, out)
+        elif isinstance(v, (int, float)):
+            out[key] = float(v)
+
+
+TRACER = CallTracer()
+
+
+# ---------------- EXPORTERS ----------------
+class MetricsServer:
+    """HTTP lokal: GET /metrics -> teks Prometheus."""
+
+    def __init__(self, tracer: CallTracer, host: str = "127.0.0.1", port: int = 9464):
+        # diimpor di sini: http.server mahal (~50 ms) dan core mengimpor modul ini
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        tracer_ref = tracer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = tracer_ref.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+        print(f"[METRICS] http://{host}:{self._httpd.server_port}/metrics")
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class MetricsFileWriter:
+    """Tulis teks Prometheus ke file tiap interval detik (atomic replace)."""
+
+    def __init__(self, tracer: CallTracer, path: Path, interval: float = 10.0):
+        self.tracer = tracer
+        self.path = Path(path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-file", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self):
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(self.tracer.prometheus_text(), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            print(f"[METRICS WARN] gagal menulis {self.path}: {e}")
+
+    def close(self):
+        self._stop.set()
+        self.write()
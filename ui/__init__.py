@@ -1,8 +1,21 @@
 """
 Package ui
 Mengelompokkan semua komponen tampilan (window, dialog, dsb).
+Window di-import saat pertama diakses, jadi mode teller tidak ikut memuat
+QtMultimedia milik display.
 """
-from .main_display import MainDisplayWindow
-from .teller import TellerWindow
+import importlib
+
+_LAZY = {
+    "MainDisplayWindow": ".main_display",
+    "TellerWindow": ".teller",
+}
 
 __all__ = ["MainDisplayWindow", "TellerWindow"]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
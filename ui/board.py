@@ -0,0 +1,188 @@
+"""
+board.py
+Papan multi-loket berbasis model/view.
+
+- CounterBoardModel : satu baris per loket (nomor terakhir tiap loket).
+  Panggilan baru hanya memancarkan dataChanged untuk sel yang berubah.
+- CallHistoryModel  : riwayat panggilan terbaru (panjang bisa diatur).
+  View hanya meminta baris yang terlihat, jadi ratusan baris tetap murah.
+Keduanya dibaca ulang penuh (beginResetModel / endResetModel) saat
+state_synced: reset antrian atau snapshot dari queue server.
+"""
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+from PyQt5.QtCore import Qt, QAbstractTableModel, QAbstractListModel, QModelIndex
+from PyQt5.QtWidgets import QFrame, QVBoxLayout, QLabel, QTableView, QListView, QHeaderView, QAbstractItemView
+
+from ..queue_manager import QueueManager
+from ..models import CallEntry
+from ..config import BOARD_HISTORY_LENGTH
+from .theme import style
+
+ROW_HEIGHT = 34  # pada skala 1.0
+
+
+class CounterBoardModel(QAbstractTableModel):
+    HEADERS = ["Loket", "Nomor"]
+    COL_COUNTER = 0
+    COL_NUMBER = 1
+
+    def __init__(self, queue_manager: QueueManager, counters: Iterable[str] = (), parent=None):
+        super().__init__(parent)
+        self.queue_manager = queue_manager
+        self._counters: List[str] = []
+        self._numbers: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        for c in counters:
+            self._add_counter(c)
+        self._load_numbers()
+        self.queue_manager.new_call.connect(self.on_new_call)
+        self.queue_manager.state_synced.connect(self.on_state_synced)
+
+    def _load_numbers(self):
+        for row, c in enumerate(self._counters):
+            last = self.queue_manager.last_for_counter(c)
+            self._numbers[row] = last.label if last is not None else None
+
+    def on_state_synced(self):
+        # baris loket tetap, nomor dibaca ulang (setelah reset: semua "-")
+        self.beginResetModel()
+        self._load_numbers()
+        self.endResetModel()
+
+    def _add_counter(self, counter: str) -> int:
+        row = len(self._counters)
+        self._counters.append(counter)
+        self._numbers.append(None)
+        self._row_of[counter] = row
+        return row
+
+    def on_new_call(self, entry: CallEntry):
+        row = self._row_of.get(entry.counter)
+        if row is None:
+            row = len(self._counters)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._add_counter(entry.counter)
+            self._numbers[row] = entry.label
+            self.endInsertRows()
+            return
+        if self._numbers[row] == entry.label:
+            return
+        self._numbers[row] = entry.label
+        idx = self.index(row, self.COL_NUMBER)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._counters)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            if index.column() == self.COL_COUNTER:
+                return self._counters[index.row()]
+            number = self._numbers[index.row()]
+            return "-" if number is None else number
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter if index.column() == self.COL_NUMBER else Qt.AlignVCenter | Qt.AlignLeft
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class CallHistoryModel(QAbstractListModel):
+    """Riwayat terbaru di atas; baris tertua dibuang saat melewati max_length."""
+
+    def __init__(self, queue_manager: QueueManager, max_length: int = BOARD_HISTORY_LENGTH, parent=None):
+        super().__init__(parent)
+        self.queue_manager = queue_manager
+        self.max_length = max(1, max_length)
+        self._entries: Deque[CallEntry] = deque()
+        self._load_entries()
+        queue_manager.new_call.connect(self.on_new_call)
+        queue_manager.state_synced.connect(self.on_state_synced)
+
+    def _load_entries(self):
+        self._entries.clear()
+        for e in reversed(self.queue_manager.last_history(self.max_length - 1)):
+            self._entries.append(e)
+        cur = self.queue_manager.current()
+        if cur is not None:
+            self._entries.appendleft(cur)
+
+    def on_state_synced(self):
+        self.beginResetModel()
+        self._load_entries()
+        self.endResetModel()
+
+    def on_new_call(self, entry: CallEntry):
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._entries.appendleft(entry)
+        self.endInsertRows()
+        if len(self._entries) > self.max_length:
+            last = len(self._entries) - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self._entries.pop()
+            self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            e = self._entries[index.row()]
+            return f"Nomor {e.label}  {e.counter}"
+        return None
+
+
+class CounterBoardPanel(QFrame):
+    """Tabel semua loket + daftar riwayat (keduanya virtual)."""
+
+    def __init__(
+        self,
+        queue_manager: QueueManager,
+        counters: Iterable[str] = (),
+        history_length: int = BOARD_HISTORY_LENGTH,
+        parent=None,
+    ):
+        super().__init__(parent)
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(6)
+
+        self.board_model = CounterBoardModel(queue_manager, counters, self)
+        self.board_view = QTableView()
+        self.board_view.setModel(self.board_model)
+        style(self.board_view, "BOARD_TABLE")
+        self.board_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.board_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.board_view.setFocusPolicy(Qt.NoFocus)
+        self.board_view.verticalHeader().hide()
+        # tinggi baris tetap -> view tidak perlu mengukur tiap baris
+        self.board_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.board_view.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.board_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        lay.addWidget(self.board_view, 3)
+
+        hist_title = QLabel("Riwayat Panggilan")
+        style(hist_title, "SECTION_TITLE")
+        lay.addWidget(hist_title)
+
+        self.history_model = CallHistoryModel(queue_manager, history_length, self)
+        self.history_view = QListView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.setUniformItemSizes(True)
+        style(self.history_view, "BOARD_HISTORY")
+        self.history_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.history_view.setFocusPolicy(Qt.NoFocus)
+        lay.addWidget(self.history_view, 2)
+
+    def set_scale(self, scale: float):
+        """Tinggi baris tetap ikut skala tema (font-nya diskalakan stylesheet)."""
+        self.board_view.verticalHeader().setDefaultSectionSize(round(ROW_HEIGHT * scale))
@@ -1,17 +1,24 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QLabel, QVBoxLayout, QHBoxLayout,
     QFrame, QSizePolicy, QSpacerItem
 )
-from PyQt5.QtCore import Qt, QUrl, QTimer
-from PyQt5.QtGui import QPixmap, QCursor
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from PyQt5.QtMultimediaWidgets import QVideoWidget
+from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtGui import QCursor
 
 from ..queue_manager import QueueManager
 from ..models import CallEntry
 from ..widgets.marquee import MarqueeLabel
-from ..config import STYLE, LOGO_PATHS, VIDEO_PATH, LOOP_VIDEO
+from ..widgets.video_fanout import SharedVideoSource, VideoFrameView
+from ..playlist import default_clips
+from .board import CounterBoardPanel
+from .theme import LOGOS, ThemedWindow, scale_for_size, style
+from ..power import STATE_ACTIVE, STATE_QUIET, SUSPENDED
+from ..tracing import TRACER
+from ..startup import PROFILER, after_first_paint
+from ..config import (
+    REFRESH_FRAME_MS, LOGO_PATHS, LOGO_SIZE, THEME_RESIZE_DEBOUNCE_MS, LOOP_VIDEO, MARQUEE_MODE, MARQUEE_SPEED_PX_S,
+)
 
 # (Opsional) aktifkan kalau mau paksa topmost via Win32 (install: pip install pywin32)
 ENABLE_FORCE_TOPMOST = False
@@ -21,7 +28,7 @@ except Exception:
     ENABLE_FORCE_TOPMOST = False
 
 
-class MainDisplayWindow(QMainWindow):
+class MainDisplayWindow(ThemedWindow, QMainWindow):
     """
     Display utama Fullscreen / Kiosk.
     - Frameless
@@ -29,6 +36,10 @@ class MainDisplayWindow(QMainWindow):
     - ESC pertama -> keluar fullscreen (jika mau), ESC kedua -> exit (atau Shift+ESC langsung exit)
     - F11 toggle
     - Re-apply fullscreen beberapa kali untuk mengatasi taskbar bandel.
+    - Tema (ui/theme.py): satu stylesheet per window, font & logo mengikuti
+      ukuran layar; resize di-debounce.
+    - set_power_state (power.py): marquee ikut state; reassert fullscreen
+      tidak jalan di jam tenang dan dijalankan sekali saat kembali aktif.
     """
     def __init__(
         self,
@@ -37,22 +48,65 @@ class MainDisplayWindow(QMainWindow):
         kiosk: bool = True,
         hide_cursor: bool = False,
         screen_geometry=None,
+        board_counters: Optional[List[str]] = None,
+        video_source: Optional[SharedVideoSource] = None,
     ):
         super().__init__()
         self.queue_manager = queue_manager
         self.kiosk = kiosk
+        self.force_fullscreen = force_fullscreen
+        self._power_state = STATE_ACTIVE
+        self.marquee: MarqueeLabel
         self.hide_cursor = hide_cursor
         self.history_labels: List[QLabel] = []
         self.current_number_label: QLabel
         self.current_counter_label: QLabel
-        self._video_player: Optional[QMediaPlayer] = None
-        self._video_widget: Optional[QVideoWidget] = None
+        # Video: satu decoder bisa dibagi ke banyak window (multi layar).
+        # QtMultimedia dimuat & video diputar setelah paint pertama.
+        self._video_source = video_source
+        self._video_view: Optional[VideoFrameView] = None
+        self._video_container: Optional[QFrame] = None
         self._screen_geometry = screen_geometry
+        # mode papan multi-loket (model/view) menggantikan 3 label history
+        self._board_counters = board_counters
+        self.board_panel: Optional[CounterBoardPanel] = None
+        self._logo_labels: List[QLabel] = []
+
+        # Skala tema dihitung ulang setelah resize reda (bukan per event)
+        self._theme_timer = QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(THEME_RESIZE_DEBOUNCE_MS)
+        self._theme_timer.timeout.connect(self._rescale_theme)
+
+        # Update display digabung: maksimal satu refresh per frame. Update
+        # pertama setelah idle langsung diterapkan; timer menjadi jendela
+        # coalescing untuk update yang datang dalam frame yang sama.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_FRAME_MS)
+        self._refresh_timer.timeout.connect(self._on_refresh_window_end)
+        self._refresh_dirty = False
+        self._label_texts: Dict[QLabel, str] = {}
+        self.update_counters = {
+            "requested": 0,   # emisi new_call yang masuk
+            "coalesced": 0,   # tergabung ke refresh di akhir jendela frame
+            "applied": 0,     # refresh yang benar-benar dijalankan
+            "labels_set": 0,  # setText yang dilakukan
+            "labels_skipped": 0,  # label yang teksnya tidak berubah
+        }
 
         self._apply_window_flags()
-        self._build_ui()
+        with PROFILER.phase("display.build_ui"):
+            self._build_ui()
+        with PROFILER.phase("display.theme"):
+            size = self._screen_geometry.size() if self._screen_geometry else self.size()
+            self.apply_theme(scale_for_size(size.width(), size.height()))
+        if self._video_container is not None:
+            after_first_paint(self.current_number_label, self._start_video)
 
         self.queue_manager.new_call.connect(self.update_display)
+        self.queue_manager.pending_changed.connect(self._on_pending_changed)
+        self.queue_manager.state_synced.connect(self._on_state_synced)
 
         if self.hide_cursor:
             self.setCursor(QCursor(Qt.BlankCursor))
@@ -92,6 +146,8 @@ class MainDisplayWindow(QMainWindow):
             QTimer.singleShot(250, self._force_topmost)
 
     def _reassert_fullscreen(self):
+        if self._power_state == STATE_QUIET:
+            return  # cabang tutup: tidak perlu merebut layar
         if not self.isFullScreen():
             self.showFullScreen()
         self.raise_()
@@ -126,7 +182,13 @@ class MainDisplayWindow(QMainWindow):
         top_layout.setSpacing(0)
 
         logos_container = self._build_logos()
-        marquee = MarqueeLabel("Selamat datang di Loket Antrian", interval_ms=70, stylesheet=STYLE["MARQUEE"])
+        self.marquee = marquee = MarqueeLabel(
+            "Selamat datang di Loket Antrian",
+            interval_ms=70,
+            mode=MARQUEE_MODE,
+            speed_px_s=MARQUEE_SPEED_PX_S,
+        )
+        style(marquee, "MARQUEE")
         marquee.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
         top_layout.addLayout(logos_container, 1)
@@ -156,101 +218,186 @@ class MainDisplayWindow(QMainWindow):
         for i in range(2):
             if i < len(LOGO_PATHS) and LOGO_PATHS[i].is_file():
                 lbl = QLabel()
-                pix = QPixmap(str(LOGO_PATHS[i]))
-                if not pix.isNull():
-                    lbl.setPixmap(pix.scaled(220, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                if not LOGOS.source(LOGO_PATHS[i]).isNull():
+                    # pixmap terskala dipasang di on_scale_changed
+                    lbl.setProperty("logo_path", str(LOGO_PATHS[i]))
+                    self._logo_labels.append(lbl)
                 else:
                     lbl.setText("LOGO ERR")
                     lbl.setAlignment(Qt.AlignCenter)
-                lbl.setStyleSheet("background-color:#0C4A3F; border-radius:6px;")
+                style(lbl, "LOGO_FRAME")
             else:
                 lbl = QLabel(f"LOGO {i+1}")
                 lbl.setAlignment(Qt.AlignCenter)
-                lbl.setStyleSheet(STYLE["LOGO_PLACEHOLDER"])
+                style(lbl, "LOGO_PLACEHOLDER")
                 lbl.setMinimumHeight(80)
             lay.addWidget(lbl)
         lay.addStretch()
         return lay
 
     def _build_video(self):
-        if VIDEO_PATH.is_file():
+        if self._video_source is not None or default_clips():
+            # hanya wadah; decoder dibuat di _start_video setelah paint pertama
             container = QFrame()
+            style(container, "VIDEO_CONTAINER")
             v = QVBoxLayout(container)
             v.setContentsMargins(0, 0, 0, 0)
-            self._video_widget = QVideoWidget()
-            self._video_player = QMediaPlayer(None, QMediaPlayer.VideoSurface)
-            self._video_player.setVideoOutput(self._video_widget)
-            self._video_player.setMedia(QMediaContent(QUrl.fromLocalFile(str(VIDEO_PATH))))
-            self._video_player.play()
-            if LOOP_VIDEO:
-                self._video_player.mediaStatusChanged.connect(self._loop_video)
-            v.addWidget(self._video_widget)
+            self._video_container = container
             return container
         else:
             lbl = QLabel("AREA VIDEO")
             lbl.setAlignment(Qt.AlignCenter)
-            lbl.setStyleSheet(STYLE["VIDEO_PLACEHOLDER"])
+            style(lbl, "VIDEO_PLACEHOLDER")
             lbl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             return lbl
 
-    def _loop_video(self, status):
-        if status == QMediaPlayer.EndOfMedia and self._video_player:
-            self._video_player.setPosition(0)
-            self._video_player.play()
+    def _start_video(self):
+        with PROFILER.phase("display.video_init"):
+            if self._video_source is None:
+                self._video_source = SharedVideoSource(default_clips(), loop=LOOP_VIDEO, parent=self)
+            self._video_view = VideoFrameView()
+            self._video_container.layout().addWidget(self._video_view)
+            self._video_source.attach(self._video_view)
 
     def _build_info_panel(self):
         container = QFrame()
-        container.setStyleSheet(STYLE["BACKGROUND_PANEL"])
+        style(container, "BACKGROUND_PANEL")
         lay = QVBoxLayout(container)
         lay.setContentsMargins(10, 10, 10, 10)
         lay.setSpacing(6)
 
         title = QLabel("INFORMASI ANTRIAN")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("color:#F8FAFC; font-size:28px; font-weight:800; letter-spacing:2px;")
+        style(title, "DISPLAY_TITLE")
         lay.addWidget(title)
 
-        hist_title = QLabel("3 Nomor Terakhir")
-        hist_title.setStyleSheet("color:#CBD5E1; font-size:16px; font-weight:bold;")
-        lay.addWidget(hist_title)
+        if self._board_counters is not None:
+            self.board_panel = CounterBoardPanel(self.queue_manager, self._board_counters)
+            lay.addWidget(self.board_panel, 1)
+        else:
+            hist_title = QLabel("3 Nomor Terakhir")
+            style(hist_title, "SECTION_TITLE")
+            lay.addWidget(hist_title)
 
-        for _ in range(3):
-            h = QLabel("-")
-            h.setStyleSheet(STYLE["HISTORY_ITEM"])
-            self.history_labels.append(h)
-            lay.addWidget(h)
+            for _ in range(3):
+                h = QLabel("-")
+                style(h, "HISTORY_ITEM")
+                self.history_labels.append(h)
+                lay.addWidget(h)
 
-        lay.addItem(QSpacerItem(10, 15, QSizePolicy.Minimum, QSizePolicy.Expanding))
+            lay.addItem(QSpacerItem(10, 15, QSizePolicy.Minimum, QSizePolicy.Expanding))
 
         self.current_number_label = QLabel("--")
         self.current_number_label.setAlignment(Qt.AlignCenter)
-        self.current_number_label.setStyleSheet(STYLE["CURRENT_NUMBER"] + "font-size:130px;")
+        style(self.current_number_label, "CURRENT_NUMBER")
         self.current_number_label.setMinimumHeight(200)
         lay.addWidget(self.current_number_label)
 
         self.current_counter_label = QLabel("Ke Loket -")
         self.current_counter_label.setAlignment(Qt.AlignCenter)
-        self.current_counter_label.setStyleSheet(STYLE["CURRENT_COUNTER"] + "font-size:48px;")
+        style(self.current_counter_label, "CURRENT_COUNTER")
         lay.addWidget(self.current_counter_label)
 
+        self.waiting_label = QLabel("")
+        self.waiting_label.setAlignment(Qt.AlignCenter)
+        style(self.waiting_label, "DISPLAY_WAITING")
+        lay.addWidget(self.waiting_label)
+
         foot = QLabel("© Sistem Antrian Modular")
         foot.setAlignment(Qt.AlignCenter)
-        foot.setStyleSheet("color:#64748B; font-size:14px;")
+        style(foot, "FOOTER")
         lay.addWidget(foot)
 
         return container
 
+    # ---------------- POWER ----------------
+    def set_power_state(self, state: str):
+        previous, self._power_state = self._power_state, state
+        self.marquee.set_power_state(state)
+        if state == STATE_ACTIVE and previous in SUSPENDED and self.force_fullscreen:
+            self._reassert_fullscreen()
+
+    # ---------------- THEME ----------------
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._theme_timer.start()  # restart: hanya ukuran akhir yang dihitung
+
+    def _rescale_theme(self):
+        self.apply_theme(scale_for_size(self.width(), self.height()))
+
+    def on_scale_changed(self, scale: float):
+        """Dipanggil ThemedWindow hanya saat skala terkuantisasi berubah."""
+        self.current_number_label.setMinimumHeight(round(200 * scale))
+        if self.board_panel is not None:
+            self.board_panel.set_scale(scale)
+        size = QSize(round(LOGO_SIZE[0] * scale), round(LOGO_SIZE[1] * scale))
+        for lbl in self._logo_labels:
+            lbl.setPixmap(LOGOS.scaled(lbl.property("logo_path"), size))
+
     # ---------------- UPDATE ----------------
     def update_display(self, entry: CallEntry):
-        self.current_number_label.setText(str(entry.number))
-        self.current_counter_label.setText(f"Ke {entry.counter}")
-        history = self.queue_manager.last_history(3)
+        # hanya menjadwalkan; state akhir dibaca dari queue_manager saat refresh
+        self.update_counters["requested"] += 1
+        if TRACER.enabled:
+            TRACER.mark(entry.label, "signal")
+        self._schedule_refresh()
+
+    def _on_pending_changed(self, _waiting: int):
+        self.update_counters["requested"] += 1
+        self._schedule_refresh()
+
+    def _on_state_synced(self):
+        # snapshot server / reset: history diganti seluruhnya
+        self.update_counters["requested"] += 1
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        if self._refresh_timer.isActive():
+            # masih dalam jendela refresh sebelumnya: digabung di akhir jendela
+            self.update_counters["coalesced"] += 1
+            self._refresh_dirty = True
+            return
+        self._refresh_timer.start()
+        self._apply_refresh()
+
+    def _on_refresh_window_end(self):
+        if self._refresh_dirty:
+            self._refresh_dirty = False
+            self._refresh_timer.start()
+            self._apply_refresh()
+
+    def _apply_refresh(self):
+        self.update_counters["applied"] += 1
+        current = self.queue_manager.current()
+        self._set_label(self.current_number_label, current.label if current else "--")
+        if TRACER.enabled and current is not None:
+            TRACER.mark(current.label, "display_update")
+        self._set_label(self.current_counter_label, f"Ke {current.counter}" if current else "Ke Loket -")
+        history = self.queue_manager.last_history(len(self.history_labels))
         for i, lbl in enumerate(self.history_labels):
             if i < len(history):
                 h = history[i]
-                lbl.setText(f"Nomor {h.number} {h.counter}")
+                self._set_label(lbl, f"Nomor {h.label} {h.counter}")
             else:
-                lbl.setText("-")
+                self._set_label(lbl, "-")
+        self._set_label(self.waiting_label, self._waiting_text())
+
+    def _waiting_text(self) -> str:
+        waiting = self.queue_manager.waiting_count()
+        if waiting == 0:
+            return ""
+        eta = self.queue_manager.estimated_wait()
+        if eta is None:
+            return f"Menunggu: {waiting} orang"
+        return f"Menunggu: {waiting} orang  ·  Estimasi ±{max(1, round(eta / 60))} menit"
+
+    def _set_label(self, label: QLabel, text: str):
+        if self._label_texts.get(label) == text:
+            self.update_counters["labels_skipped"] += 1
+            return
+        self._label_texts[label] = text
+        label.setText(text)
+        self.update_counters["labels_set"] += 1
 
     # ---------------- KEYS ----------------
     def keyPressEvent(self, e):
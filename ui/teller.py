@@ -14,16 +14,18 @@ from PyQt5.QtGui import QKeySequence
 
 from ..queue_manager import QueueManager
 from ..models import CallEntry
-from ..config import STYLE
+from .theme import ThemedWindow, scale_for_dpi, style
+from ..tracing import TRACER
 
 
-class TellerWindow(QWidget):
+class TellerWindow(ThemedWindow, QWidget):
     """
     Teller UI lebih menarik:
     - Panel dengan styling
     - Tombol besar
     - Preview nomor berikutnya (estimasi)
     - Shortcut: Enter / Space -> Next
+    - Tema: satu stylesheet kompilasi, font diskalakan menurut DPI layar
     """
     def __init__(self, queue_manager: QueueManager, counters: List[str]):
         super().__init__()
@@ -36,7 +38,11 @@ class TellerWindow(QWidget):
         self.next_preview_label: QLabel
 
         self._init_ui()
+        self.apply_theme(scale_for_dpi(self.logicalDpiY()))
         self.queue_manager.new_call.connect(self._on_new_call)
+        self.queue_manager.pending_changed.connect(self._on_pending_changed)
+        self.queue_manager.state_synced.connect(self._on_state_synced)
+        self.counter_combo.currentTextChanged.connect(self._on_pending_changed)
         self._update_next_preview()
 
         # Shortcuts
@@ -49,26 +55,26 @@ class TellerWindow(QWidget):
         outer.setContentsMargins(14, 14, 14, 14)
 
         panel = QFrame()
-        panel.setStyleSheet(STYLE["TELLER_PANEL"])
+        style(panel, "TELLER_PANEL")
         panel_layout = QVBoxLayout(panel)
         panel_layout.setSpacing(14)
 
         title = QLabel("Panel Petugas Loket")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(STYLE["TELLER_TITLE"])
+        style(title, "TELLER_TITLE")
         panel_layout.addWidget(title)
 
         loc_label = QLabel("Pilih Loket:")
-        loc_label.setStyleSheet(STYLE["TELLER_LABEL"])
+        style(loc_label, "TELLER_LABEL")
         panel_layout.addWidget(loc_label)
 
         self.counter_combo = QComboBox()
         self.counter_combo.addItems(self.counters)
-        self.counter_combo.setStyleSheet(STYLE["TELLER_COMBO"])
+        style(self.counter_combo, "TELLER_COMBO")
         panel_layout.addWidget(self.counter_combo)
 
         self.next_button = QPushButton("PANGGIL NEXT")
-        self.next_button.setStyleSheet(STYLE["TELLER_NEXT_BTN"])
+        style(self.next_button, "TELLER_NEXT_BTN")
         self.next_button.setCursor(Qt.PointingHandCursor)
         self.next_button.clicked.connect(self._handle_next)
         self.next_button.setMinimumHeight(90)
@@ -76,32 +82,51 @@ class TellerWindow(QWidget):
 
         self.last_called_label = QLabel("Nomor Terakhir: -")
         self.last_called_label.setAlignment(Qt.AlignCenter)
-        self.last_called_label.setStyleSheet(STYLE["TELLER_LAST"])
+        style(self.last_called_label, "TELLER_LAST")
         panel_layout.addWidget(self.last_called_label)
 
         self.next_preview_label = QLabel("Nomor Berikutnya: 1")
         self.next_preview_label.setAlignment(Qt.AlignCenter)
-        self.next_preview_label.setStyleSheet("font-size:16px; color:#A5B4FC; font-weight:600;")
+        style(self.next_preview_label, "TELLER_PREVIEW")
         panel_layout.addWidget(self.next_preview_label)
 
+        self.waiting_label = QLabel("Menunggu: 0")
+        self.waiting_label.setAlignment(Qt.AlignCenter)
+        style(self.waiting_label, "TELLER_WAITING")
+        panel_layout.addWidget(self.waiting_label)
+
         hint = QLabel("Shortcut: ENTER / SPACE untuk Next")
         hint.setAlignment(Qt.AlignCenter)
-        hint.setStyleSheet("color:#64748B; font-size:12px;")
+        style(hint, "TELLER_HINT")
         panel_layout.addWidget(hint)
 
         outer.addWidget(panel)
 
     def _update_next_preview(self):
+        # kepala antrian loket ini, atau nomor baru dari pool pertamanya
+        next_label = self.queue_manager.next_label(self.counter_combo.currentText())
+        self.next_preview_label.setText(f"Nomor Berikutnya: {next_label}")
+        self.waiting_label.setText(f"Menunggu: {self.queue_manager.waiting_count()}")
+
+    def _on_pending_changed(self, _value=None):
+        self._update_next_preview()
+
+    def _on_state_synced(self):
         current = self.queue_manager.current()
-        next_number = (current.number + 1) if current else 1
-        self.next_preview_label.setText(f"Nomor Berikutnya: {next_number}")
+        self.last_called_label.setText(
+            f"Nomor Terakhir: {current.label} ({current.counter})" if current else "Nomor Terakhir: -"
+        )
+        self._update_next_preview()
 
     def _handle_next(self):
+        if TRACER.enabled:
+            TRACER.mark_press()
         selected_counter = self.counter_combo.currentText()
         entry = self.queue_manager.next_number(selected_counter)
-        self.last_called_label.setText(f"Nomor Terakhir: {entry.number} ({entry.counter})")
+        if entry is not None:  # proxy remote: nomor datang belakangan lewat new_call
+            self.last_called_label.setText(f"Nomor Terakhir: {entry.label} ({entry.counter})")
         QTimer.singleShot(50, self._update_next_preview)  # update preview setelah emit
 
     def _on_new_call(self, entry: CallEntry):
-        self.last_called_label.setText(f"Nomor Terakhir: {entry.number} ({entry.counter})")
+        self.last_called_label.setText(f"Nomor Terakhir: {entry.label} ({entry.counter})")
         self._update_next_preview()
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+theme.py
+Theme engine: STYLE dikompilasi sekali menjadi satu stylesheet per skala,
+dengan selector berdasarkan objectName (objectName widget = kunci STYLE).
+
+- Widget cukup memanggil style(widget, "KUNCI"); tidak ada setStyleSheet
+  per widget. Stylesheet hasil kompilasi dipasang sekali di window top-level.
+- Ukuran font (font-size:Npx) di STYLE adalah ukuran desain untuk layar
+  referensi 1920x1080 dan diskalakan menurut geometri layar (display) atau
+  DPI (teller). Skala dibulatkan per SCALE_STEP sehingga resize kecil tidak
+  memicu parse ulang; hasil kompilasi di-cache per skala.
+- Kunci berakhiran _HOVER (mis. TELLER_NEXT_BTN_HOVER) menjadi #KUNCI:hover.
+- LogoCache: pixmap asli dimuat sekali, versi terskala di-cache per ukuran.
+"""
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QWidget
+
+from ..config import STYLE
+
+REFERENCE_SIZE = (1920, 1080)
+REFERENCE_DPI = 96.0
+SCALE_STEP = 0.05
+SCALE_MIN = 0.4
+SCALE_MAX = 3.0
+
+_FONT_RE = re.compile(r"font-size\s*:\s*(\d+(?:\.\d+)?)px")
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_TYPE_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_PSEUDO_SUFFIX = {"_HOVER": ":hover", "_PRESSED": ":pressed", "_DISABLED": ":disabled"}
+
+
+def style(widget: QWidget, key: str) -> QWidget:
+    """Tandai widget dengan kunci STYLE (dipakai sebagai objectName)."""
+    if key not in STYLE:
+        raise KeyError(f"STYLE tidak punya kunci {key!r}")
+    widget.setObjectName(key)
+    return widget
+
+
+def _quantize(scale: float) -> float:
+    scale = min(SCALE_MAX, max(SCALE_MIN, scale))
+    return round(round(scale / SCALE_STEP) * SCALE_STEP, 2)
+
+
+def scale_for_size(width: int, height: int) -> float:
+    ref_w, ref_h = REFERENCE_SIZE
+    return _quantize(min(width / ref_w, height / ref_h))
+
+
+def scale_for_dpi(dpi: float) -> float:
+    return _quantize(dpi / REFERENCE_DPI)
+
+
+def _scale_fonts(css: str, scale: float) -> str:
+    if scale == 1.0:
+        return css
+    return _FONT_RE.sub(lambda m: f"font-size:{max(6, round(float(m.group(1)) * scale))}px", css)
+
+
+def _scope_rule(key: str, selectors: str, body: str) -> str:
+    scoped = []
+    for sel in (s.strip() for s in selectors.split(",")):
+        if _TYPE_RE.match(sel):
+            scoped.append(f"{sel}#{key}")  # widget itu sendiri
+        scoped.append(f"#{key} {sel}")  # turunannya (header, item, dsb)
+    return f"{', '.join(scoped)} {{{body}}}"
+
+
+@lru_cache(maxsize=16)
+def compile_stylesheet(scale: float = 1.0) -> str:
+    """Satu stylesheet untuk semua kunci STYLE pada skala tertentu (di-cache)."""
+    parts = []
+    for key, css in STYLE.items():
+        css = _scale_fonts(css, scale)
+        pseudo = ""
+        for suffix, state in _PSEUDO_SUFFIX.items():
+            if key.endswith(suffix) and key[: -len(suffix)] in STYLE:
+                key, pseudo = key[: -len(suffix)], state
+                break
+        if "{" in css:
+            parts.extend(_scope_rule(key, sel, body) for sel, body in _RULE_RE.findall(css))
+        else:
+            parts.append(f"#{key}{pseudo} {{{css}}}")
+    return "\n".join(parts)
+
+
+class ThemedWindow:
+    """
+    Mixin untuk window top-level: pasang stylesheet kompilasi sesuai skala
+    dan panggil on_scale_changed() hanya saat skala (terkuantisasi) berubah.
+    """
+    _theme_scale: Optional[float] = None
+
+    def apply_theme(self, scale: float) -> bool:
+        if scale == self._theme_scale:
+            return False
+        self._theme_scale = scale
+        self.setStyleSheet(compile_stylesheet(scale))
+        self.on_scale_changed(scale)
+        return True
+
+    def theme_scale(self) -> float:
+        return self._theme_scale or 1.0
+
+    def on_scale_changed(self, scale: float):
+        pass
+
+
+class LogoCache:
+    """Pixmap logo terskala per (path, ukuran); sumber dimuat sekali."""
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._sources: "dict[Path, QPixmap]" = {}
+        self._scaled: "OrderedDict[Tuple[Path, int, int], QPixmap]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def source(self, path: Path) -> QPixmap:
+        pix = self._sources.get(path)
+        if pix is None:
+            pix = QPixmap(str(path))
+            self._sources[path] = pix
+        return pix
+
+    def scaled(self, path: Path, size: QSize) -> QPixmap:
+        key = (Path(path), size.width(), size.height())
+        pix = self._scaled.get(key)
+        if pix is not None:
+            self._scaled.move_to_end(key)
+            self.hits += 1
+            return pix
+        self.misses += 1
+        src = self.source(key[0])
+        pix = src if src.isNull() else src.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._scaled[key] = pix
+        while len(self._scaled) > self.max_entries:
+            self._scaled.popitem(last=False)
+        return pix
+
+
+LOGOS = LogoCache()
@@ -0,0 +1,69 @@
+"""
+wait_estimate.py
+Estimasi waktu tunggu antrian (tanpa Qt).
+
+Waktu layanan tiap loket = selang antara dua panggilan berturut-turut di
+loket itu, dihaluskan dengan EWMA. Laju layanan total (tiket/detik) adalah
+jumlah 1/EWMA semua loket dan diperbarui secara inkremental, jadi setiap
+panggilan maupun query estimasi O(1), tanpa memindai history.
+
+    estimasi tunggu = jumlah orang di depan / laju layanan total
+"""
+from typing import Dict, Optional
+
+from .config import WAIT_EWMA_ALPHA, WAIT_MIN_SERVICE_S, WAIT_MAX_SERVICE_S
+
+
+class WaitEstimator:
+    def __init__(
+        self,
+        alpha: float = WAIT_EWMA_ALPHA,
+        min_service_s: float = WAIT_MIN_SERVICE_S,
+        max_service_s: float = WAIT_MAX_SERVICE_S,
+    ):
+        self.alpha = alpha
+        self.min_service_s = min_service_s
+        self.max_service_s = max_service_s
+        self._last_call: Dict[str, float] = {}
+        self._ewma: Dict[str, float] = {}
+        self._rate = 0.0
+
+    def observe_call(self, counter: str, timestamp: float):
+        last = self._last_call.get(counter)
+        self._last_call[counter] = timestamp
+        if last is None:
+            return
+        dt = timestamp - last
+        if dt <= 0 or dt > self.max_service_s:
+            return
+        dt = max(dt, self.min_service_s)
+        old = self._ewma.get(counter)
+        new = dt if old is None else old + self.alpha * (dt - old)
+        if old is not None:
+            self._rate -= 1.0 / old
+        self._rate += 1.0 / new
+        self._ewma[counter] = new
+
+    def service_time(self, counter: str) -> Optional[float]:
+        return self._ewma.get(counter)
+
+    def throughput(self) -> float:
+        """Tiket per detik (semua loket)."""
+        return self._rate
+
+    def estimate_wait(self, ahead: int) -> Optional[float]:
+        """Detik sampai giliran, dengan `ahead` orang di depan; None jika belum ada data."""
+        if self._rate <= 0:
+            return None
+        return ahead / self._rate
+
+    def reset(self):
+        self._last_call.clear()
+        self._ewma.clear()
+        self._rate = 0.0
+
+    def stats(self) -> dict:
+        return {
+            "throughput_per_min": self._rate * 60,
+            "service_s": dict(self._ewma),
+        }
@@ -0,0 +1,156 @@
+"""
+watchdog.py
+Detektor stall event loop GUI.
+
+- Heartbeat QTimer di main thread; selisih waktu nyata vs interval = drift.
+  Drift di atas threshold dicatat sebagai stall (jumlah, durasi, stack).
+- Thread samping memantau heartbeat; saat main thread macet, stack Python
+  main thread diambil (sys._current_frames) selagi stall masih berlangsung.
+- Jika macet lebih lama dari restart_after_s, signal wedged dipancarkan
+  (diterima begitu loop pulih, mis. untuk membuat ulang window display);
+  exit_after_s opsional mematikan proses agar supervisor me-restart.
+"""
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from .config import POWER_IDLE_WATCHDOG_MS, WATCHDOG_INTERVAL_MS, WATCHDOG_STALL_MS
+from .power import STATE_ACTIVE
+
+
+class StallRecord:
+    __slots__ = ("at", "duration_ms", "stack")
+
+    def __init__(self, at: float, duration_ms: float, stack: Optional[str]):
+        self.at = at
+        self.duration_ms = duration_ms
+        self.stack = stack
+
+
+class EventLoopWatchdog(QObject):
+    stall_detected = pyqtSignal(float)  # durasi ms
+    wedged = pyqtSignal(float)  # detik macet
+
+    def __init__(
+        self,
+        interval_ms: int = WATCHDOG_INTERVAL_MS,
+        stall_ms: float = WATCHDOG_STALL_MS,
+        restart_after_s: float = 0.0,
+        exit_after_s: float = 0.0,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self._active_interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.restart_after_s = restart_after_s
+        self.exit_after_s = exit_after_s
+
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        # stack main thread saat macet: ditulis side thread, diambil _beat
+        self._pending_stack: Optional[str] = None
+        self._stack_lock = threading.Lock()
+        self._wedge_reported = False
+        self._stop = threading.Event()
+
+        self.stalls = 0
+        self.total_stall_ms = 0.0
+        self.max_stall_ms = 0.0
+        self.max_drift_ms = 0.0
+        self.wedge_count = 0
+        self.recent: Deque[StallRecord] = deque(maxlen=20)
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._beat)
+        self._timer.start(interval_ms)
+
+        self._thread = threading.Thread(target=self._monitor, name="gui-watchdog", daemon=True)
+        self._thread.start()
+
+    # ---------- MAIN THREAD ----------
+    def _beat(self):
+        now = time.monotonic()
+        drift_ms = (now - self._last_beat) * 1000 - self.interval_ms
+        self._last_beat = now
+        if drift_ms > self.max_drift_ms:
+            self.max_drift_ms = drift_ms
+        with self._stack_lock:
+            stack, self._pending_stack = self._pending_stack, None
+        if drift_ms >= self.stall_ms:
+            self.stalls += 1
+            self.total_stall_ms += drift_ms
+            self.max_stall_ms = max(self.max_stall_ms, drift_ms)
+            self.recent.append(StallRecord(time.time(), drift_ms, stack))
+            print(f"[WATCHDOG] event loop stall {drift_ms:.0f}ms")
+            if stack:
+                print(stack)
+            self.stall_detected.emit(drift_ms)
+        self._wedge_reported = False
+
+    # ---------- SIDE THREAD ----------
+    def set_interval(self, interval_ms: int):
+        """Ubah periode heartbeat (governor daya memperlambatnya saat idle)."""
+        if interval_ms == self.interval_ms:
+            return
+        self.interval_ms = interval_ms
+        # beat berikutnya diukur dari sekarang, bukan dari beat lama
+        self._last_beat = time.monotonic()
+        self._timer.start(interval_ms)
+
+    def set_power_state(self, state: str):
+        if state == STATE_ACTIVE:
+            self.set_interval(self._active_interval_ms)
+        else:
+            self.set_interval(max(self._active_interval_ms, POWER_IDLE_WATCHDOG_MS))
+
+    def _monitor(self):
+        while not self._stop.wait(max(0.01, self.interval_ms / 1000)):
+            beat = self._last_beat
+            stalled_s = time.monotonic() - beat - self.interval_ms / 1000
+            if stalled_s * 1000 < self.stall_ms:
+                continue
+            if self._pending_stack is None:
+                stack = self._capture_main_stack()
+                with self._stack_lock:
+                    # beat sempat masuk selama capture: stack milik stall yang sudah selesai
+                    if self._pending_stack is None and self._last_beat == beat:
+                        self._pending_stack = stack
+            if self.restart_after_s and stalled_s >= self.restart_after_s and not self._wedge_reported:
+                self._wedge_reported = True
+                self.wedge_count += 1
+                print(f"[WATCHDOG] event loop macet {stalled_s:.1f}s, window akan dibuat ulang")
+                # queued: diproses main thread begitu loop jalan lagi
+                self.wedged.emit(stalled_s)
+            if self.exit_after_s and stalled_s >= self.exit_after_s:
+                print(f"[WATCHDOG] event loop macet {stalled_s:.1f}s, keluar paksa")
+                sys.stdout.flush()
+                os._exit(3)
+
+    def _capture_main_stack(self) -> Optional[str]:
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return None
+        return "".join(traceback.format_stack(frame))
+
+    # ---------- API ----------
+    def stats(self) -> Dict[str, float]:
+        return {
+            "stalls": self.stalls,
+            "total_stall_ms": self.total_stall_ms,
+            "max_stall_ms": self.max_stall_ms,
+            "max_drift_ms": self.max_drift_ms,
+            "last_stall_ms": self.recent[-1].duration_ms if self.recent else 0.0,
+            "wedges": self.wedge_count,
+        }
+
+    def stop(self):
+        self._stop.set()
+        self._timer.stop()
@@ -1,27 +1,234 @@
-from typing import Optional
+from typing import List, Optional
 from PyQt5.QtWidgets import QLabel, QWidget
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QEvent, QPointF, QSize, QVariantAnimation
+from PyQt5.QtGui import QPainter, QPixmap, QFontMetrics, QFontMetricsF
+
+from ..config import POWER_IDLE_MARQUEE_FPS
+from ..power import STATE_ACTIVE, STATE_IDLE
+
+MODE_CHAR = "char"    # mode lama: putar string + setText per tick
+MODE_PIXEL = "pixel"  # teks dirender sekali ke pixmap, digeser per frame
 
 
 class MarqueeLabel(QLabel):
-    def __init__(self, text: str, interval_ms: int = 100, parent: Optional[QWidget] = None, stylesheet: str = ""):
+    """
+    Label teks berjalan.
+    - Mode "pixel": setiap pesan dirender sekali ke QPixmap (tile), lalu
+      digambar di offset sub-pixel yang digerakkan QVariantAnimation (timer
+      animasi Qt, selaras frame). Render ulang hanya saat teks / ukuran /
+      font berubah. Beberapa pesan (setMessages) jadi ticker panjang tanpa
+      satu pixmap raksasa; hanya tile yang terlihat yang digambar.
+    - Mode "char": perilaku lama (geser per karakter tiap interval_ms).
+    - set_power_state (power.py): idle -> geser dengan QTimer pada
+      POWER_IDLE_MARQUEE_FPS (mode char: tick diperlambat); quiet / hidden
+      -> berhenti total. Posisi teks tetap saat berpindah state.
+    """
+    SEPARATOR = "   •   "
+
+    def __init__(
+        self,
+        text: str,
+        interval_ms: int = 100,
+        parent: Optional[QWidget] = None,
+        stylesheet: str = "",
+        mode: str = MODE_CHAR,
+        speed_px_s: float = 80.0,
+    ):
         super().__init__(parent)
+        self.mode = mode
+        self.speed_px_s = speed_px_s
         self.original_text = f"   {text}   "
         self.display_text = self.original_text
+        self._messages: List[str] = [text]
         self.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         if stylesheet:
             self.setStyleSheet(stylesheet)
+
+        # cache render (mode pixel)
+        self._tiles: List[QPixmap] = []
+        self._cycle_width = 0.0
+        self._cache_height = -1
+        self._offset = 0.0
+        self.render_count = 0
+        self.interval_ms = interval_ms
+        self._power_state = STATE_ACTIVE
+
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self._scroll_text)
-        self.timer.start(interval_ms)
-        self.setText(self.display_text)
+        self._anim = QVariantAnimation(self)
+        self._anim.setLoopCount(-1)
+        self._anim.valueChanged.connect(self._on_anim_value)
+
+        if self.mode == MODE_PIXEL:
+            # timer hanya dipakai saat idle (langkah kasar, fps rendah)
+            self.timer.timeout.connect(self._step_offset)
+            self.setText("")
+        else:
+            self.timer.timeout.connect(self._scroll_text)
+            self.timer.start(interval_ms)
+            self.setText(self.display_text)
 
+    # ---------------- MODE CHAR ----------------
     def _scroll_text(self):
         if self.display_text:
             self.display_text = self.display_text[1:] + self.display_text[0]
             self.setText(self.display_text)
 
+    # ---------------- API ----------------
     def setMarqueeText(self, text: str):
-        self.original_text = f"   {text}   "
+        self.setMessages([text])
+
+    def setMessages(self, messages: List[str]):
+        """Ganti isi ticker (satu atau banyak pesan)."""
+        self._messages = [m for m in messages if m] or [""]
+        self.original_text = f"   {self.SEPARATOR.join(self._messages)}   "
         self.display_text = self.original_text
-        self.setText(self.display_text)
\ No newline at end of file
+        if self.mode == MODE_PIXEL:
+            self._invalidate()
+        else:
+            self.setText(self.display_text)
+
+    # ---------------- MODE PIXEL ----------------
+    def _invalidate(self):
+        self._tiles = []
+        self._cache_height = -1
+        self.update()
+
+    def _render_tiles(self):
+        rect = self.contentsRect()
+        height = max(1, rect.height())
+        dpr = self.devicePixelRatioF()
+        fm = QFontMetricsF(self.font())
+        color = self.palette().color(self.foregroundRole())
+        baseline = (height + fm.ascent() - fm.descent()) / 2
+
+        tiles = []
+        for msg in self._messages:
+            text = msg + self.SEPARATOR
+            width = max(1.0, fm.horizontalAdvance(text))
+            pix = QPixmap(int(width * dpr) + 1, int(height * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.TextAntialiasing)
+            p.setFont(self.font())
+            p.setPen(color)
+            p.drawText(QPointF(0, baseline), text)
+            p.end()
+            tiles.append(pix)
+
+        self._tiles = tiles
+        self._cache_height = rect.height()
+        self._cycle_width = sum(t.width() / dpr for t in tiles)
+        self.render_count += 1
+        # font / style / tinggi berubah: lanjut dari posisi sekarang, bukan lompat ke awal
+        if self._cycle_width > 0:
+            self._offset %= self._cycle_width
+        self._restart_animation()
+        self._seek_offset()
+
+    def _restart_animation(self):
+        if self._cycle_width <= 0 or self.speed_px_s <= 0:
+            return
+        running = self._anim.state() == QVariantAnimation.Running
+        self._anim.stop()
+        self._anim.setStartValue(0.0)
+        self._anim.setEndValue(float(self._cycle_width))
+        self._anim.setDuration(max(1, int(self._cycle_width / self.speed_px_s * 1000)))
+        if self._power_state == STATE_ACTIVE and (running or self.isVisible()):
+            self._anim.start()
+
+    def _step_offset(self):
+        if self._cycle_width <= 0:
+            self.update()  # tile belum dirender
+            return
+        step = self.speed_px_s * self.timer.interval() / 1000
+        self._offset = (self._offset + step) % self._cycle_width
+        self.update()
+
+    # ---------------- POWER ----------------
+    def set_power_state(self, state: str):
+        if state == self._power_state:
+            return
+        self._power_state = state
+        self._anim.stop()
+        self.timer.stop()
+        if self.mode != MODE_PIXEL:
+            if state == STATE_ACTIVE:
+                self.timer.start(self.interval_ms)
+            elif state == STATE_IDLE:
+                self.timer.start(max(self.interval_ms, int(1000 / POWER_IDLE_MARQUEE_FPS)))
+        elif state == STATE_ACTIVE:
+            self._restart_animation()
+            self._seek_offset()
+        elif state == STATE_IDLE and self.isVisible():
+            self.timer.start(max(1, int(1000 / POWER_IDLE_MARQUEE_FPS)))
+
+    def _seek_offset(self):
+        if self.speed_px_s > 0:
+            # lanjut dari posisi terakhir, bukan dari awal teks
+            self._anim.setCurrentTime(int(self._offset / self.speed_px_s * 1000))
+
+    def _on_anim_value(self, value):
+        self._offset = float(value)
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        if self.mode != MODE_PIXEL:
+            return super().sizeHint()
+        # teks QLabel kosong di mode pixel; tinggi dihitung dari font + padding
+        m = self.contentsMargins()
+        h = QFontMetrics(self.font()).height() + m.top() + m.bottom() + 2 * self.frameWidth()
+        return QSize(100, h)
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint() if self.mode == MODE_PIXEL else super().minimumSizeHint()
+
+    def paintEvent(self, e):
+        # background / border dari stylesheet tetap digambar QLabel (teks kosong)
+        super().paintEvent(e)
+        if self.mode != MODE_PIXEL:
+            return
+        rect = self.contentsRect()
+        if not self._tiles or self._cache_height != rect.height():
+            self._render_tiles()
+            if not self._tiles:
+                return
+        dpr = self.devicePixelRatioF()
+        p = QPainter(self)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        p.setClipRect(rect)
+        x = rect.left() - self._offset
+        right = rect.right()
+        i = 0
+        # ulangi tile sampai lebar area terisi (seamless loop)
+        while x <= right:
+            tile = self._tiles[i % len(self._tiles)]
+            w = tile.width() / dpr
+            if x + w >= rect.left():
+                p.drawPixmap(QPointF(x, rect.top()), tile)
+            x += w
+            i += 1
+        p.end()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self.mode != MODE_PIXEL:
+            return
+        if self._power_state == STATE_ACTIVE:
+            if self._tiles and self._anim.state() != QVariantAnimation.Running:
+                self._anim.start()
+                self._seek_offset()
+        elif self._power_state == STATE_IDLE and not self.timer.isActive():
+            self.timer.start(max(1, int(1000 / POWER_IDLE_MARQUEE_FPS)))
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        if self.mode == MODE_PIXEL:
+            # tidak terlihat: tidak perlu tick animasi; offset disimpan untuk showEvent
+            self._anim.stop()
+            self.timer.stop()
+
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        if self.mode == MODE_PIXEL and e.type() in (QEvent.FontChange, QEvent.StyleChange, QEvent.PaletteChange):
+            self._invalidate()
@@ -0,0 +1,225 @@
+"""
+video_fanout.py
+Satu decoder video untuk banyak layar.
+
+- SharedVideoSource : memutar playlist (lihat playlist.py) tanpa jeda hitam.
+  Dua "deck" (QMediaPlayer + FrameFanoutSurface): satu aktif, satu memuat
+  klip berikutnya dalam keadaan pause. Tepat saat EndOfMedia output pindah
+  ke deck lain, sementara view tetap menampilkan frame terakhir sampai frame
+  pertama klip baru tiba. Jendela preload = 1 klip, jadi memori tetap datar.
+  Player dibuat saat view pertama di-attach (setelah paint pertama display),
+  jadi QtMultimedia tidak ikut dimuat saat startup.
+- VideoFrameView    : widget ringan yang menggambar frame terbaru source
+  (aspect-fit). Banyak view berbagi satu QImage, jadi biaya decode dan
+  memori mengikuti jumlah video, bukan jumlah layar.
+"""
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional, Sequence
+
+from PyQt5.QtCore import QObject, QRect, Qt, QUrl
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+
+from ..config import POWER_IDLE_PAUSE_VIDEO
+from ..playlist import Playlist
+from ..power import STATE_IDLE, SUSPENDED
+
+
+class VideoFrameView(QWidget):
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._image: Optional[QImage] = None
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def set_frame(self, image: QImage):
+        self._image = image
+        self.update()  # beberapa frame sebelum paint tergabung jadi satu
+
+    def paintEvent(self, e):
+        p = QPainter(self)
+        p.fillRect(self.rect(), Qt.black)
+        img = self._image
+        if img is not None and not img.isNull():
+            size = img.size().scaled(self.size(), Qt.KeepAspectRatio)
+            target = QRect(0, 0, size.width(), size.height())
+            target.moveCenter(self.rect().center())
+            p.drawImage(target, img)
+        p.end()
+
+
+class _Deck:
+    __slots__ = ("player", "surface", "clip")
+
+    def __init__(self, player, surface):
+        self.player = player
+        self.surface = surface
+        self.clip: Optional[Path] = None
+
+
+class SharedVideoSource(QObject):
+    def __init__(self, clips: Sequence[Path], loop: bool = True, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.playlist = Playlist(clips, loop=loop)
+        self._views: List[VideoFrameView] = []
+        self._decks: List[_Deck] = []
+        self._active = 0
+        self._volume: Optional[int] = None
+        self._paused = False  # dijeda governor daya (power.py)
+        self._last_frame = QImage()
+
+        # statistik transisi: jeda = EndOfMedia -> frame pertama klip berikutnya
+        self._ended_at: Optional[float] = None
+        self._gaps_ms: Deque[float] = deque(maxlen=100)
+        self.transitions = 0
+        self.max_gap_ms = 0.0
+        self.errors = 0
+        self._error_streak = 0
+
+    # ---------- VIEWS ----------
+    def attach(self, view: VideoFrameView):
+        if view in self._views:
+            return
+        self._views.append(view)
+        view.destroyed.connect(lambda _=None, v=view: self._forget(v))
+        if not self._decks:
+            self._start()
+        elif not self._last_frame.isNull():
+            view.set_frame(self._last_frame)
+
+    def detach(self, view: VideoFrameView):
+        self._forget(view)
+
+    def _forget(self, view: VideoFrameView):
+        if view in self._views:
+            self._views.remove(view)
+
+    def _on_frame(self, deck_index: int, image: QImage):
+        if deck_index != self._active:
+            return  # frame preload (pause) atau sisa klip lama
+        if self._ended_at is not None:
+            gap = (time.monotonic() - self._ended_at) * 1000
+            self._ended_at = None
+            self._gaps_ms.append(gap)
+            self.max_gap_ms = max(self.max_gap_ms, gap)
+        self._last_frame = image
+        for v in self._views:
+            v.set_frame(image)
+
+    # ---------- PLAYER ----------
+    def _start(self):
+        if not len(self.playlist):
+            return
+        self._decks = [self._make_deck(0), self._make_deck(1)]
+        self._active = 0
+        self._load(self._decks[0], self.playlist.next())
+        if self._paused:
+            self._decks[0].player.pause()
+        else:
+            self._decks[0].player.play()
+        self._preload()
+        print(f"[VIDEO] decoder tunggal, playlist {len(self.playlist)} klip")
+
+    def _make_deck(self, index: int) -> _Deck:
+        from PyQt5.QtMultimedia import QMediaPlayer
+        from .video_surface import FrameFanoutSurface
+
+        surface = FrameFanoutSurface(self)
+        surface.frame_ready.connect(lambda img, i=index: self._on_frame(i, img))
+        player = QMediaPlayer(self, QMediaPlayer.VideoSurface)
+        player.setVideoOutput(surface)
+        player.mediaStatusChanged.connect(lambda status, i=index: self._on_status(i, status))
+        if self._volume is not None:
+            player.setVolume(self._volume)
+        return _Deck(player, surface)
+
+    def _load(self, deck: _Deck, clip: Optional[Path]):
+        from PyQt5.QtMultimedia import QMediaContent
+        deck.clip = clip
+        if clip is None:
+            deck.player.setMedia(QMediaContent())
+        else:
+            deck.player.setMedia(QMediaContent(QUrl.fromLocalFile(str(clip))))
+
+    def _preload(self):
+        """Muat klip berikutnya di deck cadangan; pause = buffer siap, tanpa output."""
+        deck = self._decks[1 - self._active]
+        self._load(deck, self.playlist.next())
+        if deck.clip is not None:
+            deck.player.pause()
+
+    def _on_status(self, deck_index: int, status):
+        from PyQt5.QtMultimedia import QMediaPlayer
+        if status == QMediaPlayer.EndOfMedia and deck_index == self._active:
+            self._switch()
+        elif status == QMediaPlayer.BufferedMedia and deck_index == self._active:
+            self._error_streak = 0
+        elif status == QMediaPlayer.InvalidMedia:
+            deck = self._decks[deck_index]
+            self.errors += 1
+            self._error_streak += 1
+            print(f"[VIDEO WARN] klip tidak bisa diputar: {deck.clip}")
+            if self._error_streak > len(self.playlist):
+                print("[VIDEO WARN] semua klip gagal, playlist dihentikan")
+                return
+            if deck_index == self._active:
+                self._switch()
+            else:
+                self._preload()
+
+    def _switch(self):
+        nxt = self._decks[1 - self._active]
+        if nxt.clip is None:
+            return  # playlist tanpa loop sudah habis; frame terakhir tetap tampil
+        self._ended_at = time.monotonic()
+        self._active = 1 - self._active
+        nxt.player.play()
+        self.transitions += 1
+        # deck lama jadi cadangan -> langsung isi klip berikutnya
+        self._preload()
+
+    def set_power_state(self, state: str):
+        """Quiet / hidden (dan idle jika POWER_IDLE_PAUSE_VIDEO): jeda decoder, frame terakhir tetap tampil."""
+        paused = state in SUSPENDED or (state == STATE_IDLE and POWER_IDLE_PAUSE_VIDEO)
+        if paused == self._paused:
+            return
+        self._paused = paused
+        if not self._decks:
+            return
+        active = self._decks[self._active]
+        if active.clip is None:
+            return
+        if paused:
+            active.player.pause()
+        else:
+            active.player.play()
+
+    def set_volume(self, volume: int):
+        """Satu suara (deck aktif), berapa pun jumlah layarnya."""
+        self._volume = volume
+        for deck in self._decks:
+            deck.player.setVolume(volume)
+
+    def stats(self) -> dict:
+        gaps = sorted(self._gaps_ms)
+        return {
+            "views": len(self._views),
+            "clips": len(self.playlist),
+            "frames": sum(d.surface.frames for d in self._decks),
+            "dropped": sum(d.surface.dropped for d in self._decks),
+            "transitions": self.transitions,
+            "paused": self._paused,
+            "errors": self.errors,
+            "gap_ms": {
+                "last": self._gaps_ms[-1] if gaps else 0.0,
+                "mean": sum(gaps) / len(gaps) if gaps else 0.0,
+                "p95": gaps[min(len(gaps) - 1, int(0.95 * len(gaps)))] if gaps else 0.0,
+                "max": self.max_gap_ms,
+            },
+        }
+
+    def stop(self):
+        for deck in self._decks:
+            deck.player.stop()
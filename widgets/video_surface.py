@@ -0,0 +1,50 @@
+"""
+video_surface.py
+QAbstractVideoSurface yang menerima frame hasil decode QMediaPlayer dan
+meneruskannya sebagai QImage ke banyak view (lihat video_fanout.py).
+
+Dipisah dari video_fanout supaya QtMultimedia baru dimuat saat video
+benar-benar dimulai.
+"""
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtGui import QImage
+from PyQt5.QtMultimedia import QAbstractVideoBuffer, QAbstractVideoSurface, QVideoFrame
+
+
+class FrameFanoutSurface(QAbstractVideoSurface):
+    # frame terbaru (QImage, implicitly shared: semua view memakai data yang sama)
+    frame_ready = pyqtSignal(QImage)
+
+    FORMATS = [
+        QVideoFrame.Format_RGB32,
+        QVideoFrame.Format_ARGB32,
+        QVideoFrame.Format_ARGB32_Premultiplied,
+        QVideoFrame.Format_RGB565,
+        QVideoFrame.Format_RGB24,
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frames = 0
+        self.dropped = 0
+
+    def supportedPixelFormats(self, handle_type=QAbstractVideoBuffer.NoHandle):
+        if handle_type == QAbstractVideoBuffer.NoHandle:
+            return self.FORMATS
+        return []
+
+    def present(self, frame: QVideoFrame) -> bool:
+        fmt = QVideoFrame.imageFormatFromPixelFormat(frame.pixelFormat())
+        if fmt == QImage.Format_Invalid or not frame.map(QAbstractVideoBuffer.ReadOnly):
+            self.dropped += 1
+            return False
+        try:
+            # copy() sekali per frame; buffer decoder dipakai ulang setelah unmap
+            image = QImage(
+                frame.bits(), frame.width(), frame.height(), frame.bytesPerLine(), fmt
+            ).copy()
+        finally:
+            frame.unmap()
+        self.frames += 1
+        self.frame_ready.emit(image)
+        return True